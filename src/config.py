@@ -30,11 +30,19 @@ class Config:
     UPLOAD_TIMEOUT_SECONDS: int = int(os.getenv("UPLOAD_TIMEOUT_SECONDS", "1800"))
     RETRY_ATTEMPTS: int = int(os.getenv("RETRY_ATTEMPTS", "3"))
     RETRY_DELAY_SECONDS: int = int(os.getenv("RETRY_DELAY_SECONDS", "30"))
+    DOWNLOAD_CHUNK_SIZE: int = int(os.getenv("DOWNLOAD_CHUNK_SIZE", "262144"))  # Bytes read per network chunk
     
     # Selenium Configuration
     HEADLESS_MODE: bool = os.getenv("HEADLESS_MODE", "true").lower() == "true"
     SELENIUM_TIMEOUT: int = int(os.getenv("SELENIUM_TIMEOUT", "30"))
-    IMPLICIT_WAIT: int = int(os.getenv("IMPLICIT_WAIT", "10"))
+    CHROMEDRIVER_PATH: str = os.getenv("CHROMEDRIVER_PATH", "/usr/local/bin/chromedriver")
+    # Persistent Chrome profile (holds live session cookies); empty disables. Chrome locks
+    # a profile while it is open, so each bot process needs its own directory.
+    CHROME_PROFILE_DIR: str = os.getenv("CHROME_PROFILE_DIR", ".chrome_profile")
+    PAGE_LOAD_STRATEGY: str = os.getenv("PAGE_LOAD_STRATEGY", "eager")  # normal, eager or none
+    UPLOAD_POOL_SIZE: int = int(os.getenv("UPLOAD_POOL_SIZE", "2"))
+    MAX_CONCURRENT_UPLOADS: int = int(os.getenv("MAX_CONCURRENT_UPLOADS", "2"))
+    BROWSER_MAX_REUSES: int = int(os.getenv("BROWSER_MAX_REUSES", "20"))
     
     # Logging Configuration
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
@@ -54,6 +62,12 @@ class Config:
     ENABLE_PROGRESS_UPDATES: bool = os.getenv("ENABLE_PROGRESS_UPDATES", "true").lower() == "true"
     ENABLE_DEBUG_INFO: bool = os.getenv("ENABLE_DEBUG_INFO", "true").lower() == "true"
     ENABLE_VIDEO_CONVERSION: bool = os.getenv("ENABLE_VIDEO_CONVERSION", "false").lower() == "true"
+    VIDEO_ENCODER: str = os.getenv("VIDEO_ENCODER", "auto")  # auto probes NVENC/VAAPI/AMF, else libx264
+    FFMPEG_PRESET: str = os.getenv("FFMPEG_PRESET", "faster")  # libx264 preset, slower = smaller files
+
+    # Security Configuration
+    # Values encrypted with the derived key stay readable after enabling the key file
+    CREDENTIAL_KEY_FILE: str = os.getenv("CREDENTIAL_KEY_FILE", "")  # Persisted random key; empty derives it
     
     # Directories
     DOWNLOADS_DIR: str = "downloads"
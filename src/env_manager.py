@@ -5,6 +5,7 @@ Handles secure environment variable management through Telegram commands
 
 import os
 import re
+import time
 from typing import Dict, Optional, Tuple, List
 from .logger import log
 from .security import credential_manager
@@ -12,6 +13,9 @@ from .security import credential_manager
 
 class EnvironmentManager:
     """Manages environment variables securely through Telegram interface"""
+
+    # Variables can also change outside the bot, so the status is only trusted briefly
+    STATUS_TTL = 5.0
     
     def __init__(self):
         self.env_file_path = ".env"
@@ -74,10 +78,26 @@ class EnvironmentManager:
             }
         }
         
+        # Bumped on every successful set so cached replies know when to re-render
+        self.version = 0
+        self._setup_instructions: Optional[Tuple[Dict[str, any], str]] = None
+        self._variable_list: Optional[str] = None
+        self._status: Optional[Tuple[int, float, Dict[str, any]]] = None
+        
         log.info("EnvironmentManager initialized")
     
     def get_configuration_status(self) -> Dict[str, any]:
-        """Get current configuration status"""
+        """Get current configuration status, cached for STATUS_TTL seconds or until a variable is set"""
+        now = time.monotonic()
+        if self._status and self._status[0] == self.version and now - self._status[1] < self.STATUS_TTL:
+            return self._status[2]
+
+        status = self._build_configuration_status()
+        self._status = (self.version, now, status)
+        return status
+
+    def _build_configuration_status(self) -> Dict[str, any]:
+        """Read the configurable variables from the environment"""
         status = {
             'configured': {},
             'missing': [],
@@ -163,6 +183,7 @@ class EnvironmentManager:
             
             # Set in current environment
             os.environ[var_name] = value
+            self.version += 1
             
             # Update .env file
             self._update_env_file(var_name, value)
@@ -200,9 +221,17 @@ class EnvironmentManager:
             f.writelines(env_lines)
     
     def get_setup_instructions(self) -> str:
-        """Get setup instructions for configuration"""
+        """Get setup instructions for configuration, re-rendered only when the cached status is"""
         status = self.get_configuration_status()
-
+        if self._setup_instructions and self._setup_instructions[0] is status:
+            return self._setup_instructions[1]
+        
+        instructions = self._build_setup_instructions(status)
+        self._setup_instructions = (status, instructions)
+        return instructions
+    
+    def _build_setup_instructions(self, status: Dict[str, any]) -> str:
+        """Render setup instructions from a configuration status"""
         if not status['missing']:
             return """✅ <b>Configuration Complete!</b>
 
@@ -238,7 +267,13 @@ Sensitive data (passwords, emails) will be hidden in status displays."""
         return instructions
     
     def get_variable_list(self) -> str:
-        """Get list of all configurable variables"""
+        """Get list of all configurable variables; the schema is fixed, so it is rendered once"""
+        if self._variable_list is None:
+            self._variable_list = self._build_variable_list()
+        return self._variable_list
+    
+    def _build_variable_list(self) -> str:
+        """Render the configurable variable list"""
         var_list = "🔧 <b>Configurable Environment Variables:</b>\n\n"
 
         for var_name, var_config in self.configurable_vars.items():
@@ -1,33 +1,553 @@
 """
 Rumble video upload automation using Selenium
 """
+import asyncio
 import time
 import random
 import json
 import os
-from typing import Dict, List, Optional, Any
+import queue
+import re
+import shutil
+import tempfile
+import threading
+from functools import lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple, Any
 from pathlib import Path
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
-# from webdriver_manager.chrome import ChromeDriverManager  # Not needed with system ChromeDriver
+from selenium.common.exceptions import (
+    TimeoutException, NoSuchElementException, WebDriverException, ElementNotInteractableException,
+    StaleElementReferenceException
+)
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+    _json_loads = json.loads
 
 from .config import config
 from .logger import log
 
 
+# Turn off Chrome background services (updates, sync, Safe Browsing, crash
+# reporting) that only cost CPU and network in an automated session
+CHROME_BACKGROUND_ARGS = (
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-client-side-phishing-detection",
+    "--disable-default-apps",
+    "--disable-extensions",
+    "--disable-hang-monitor",
+    "--disable-popup-blocking",
+    "--disable-prompt-on-repost",
+    "--disable-sync",
+    "--disable-component-update",
+    "--disable-breakpad",
+    "--disable-features=Translate,BackForwardCache,OptimizationHints",
+    "--safebrowsing-disable-auto-update",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--no-first-run",
+    "--password-store=basic",
+    "--use-mock-keychain",
+)
+
+# Content settings: 2 blocks images, media streams and notification prompts
+CHROME_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.media_stream": 2,
+    "profile.default_content_setting_values.notifications": 2,
+}
+
+# Selector groups shared across upload attempts (built once at import time)
+LOGIN_BUTTON_XPATHS = (
+    "//button[@type='submit']",
+    "//button[contains(text(), 'Sign In')]",
+    "//button[contains(text(), 'Login')]",
+    "//input[@type='submit' and @value='Login']",
+    "//input[@type='submit']",
+)
+
+UPLOAD_LINK_XPATHS = (
+    "//a[contains(@href, 'upload')]",
+    "//a[contains(text(), 'Upload')]",
+    "//button[contains(text(), 'Upload')]",
+    "//div[contains(@class, 'upload')]//a",
+)
+
+# CSS selectors are matched natively by Chrome and are cheaper than XPath
+FILE_INPUT_SELECTORS = (
+    "input[name='Filedata']",  # Primary upload input
+    "input#Filedata",
+    "input[type='file'][name='Filedata']",
+    "input[type='file']",  # Fallback to any file input
+)
+
+# One compound predicate per control type, resolved with a single find_elements
+CATEGORY_INPUT_XPATH = (
+    "//input[contains(@name, 'category') or contains(@id, 'category')"
+    " or contains(@placeholder, 'category') or contains(@placeholder, 'Category')"
+    " or contains(@class, 'category')]"
+)
+
+CATEGORY_SELECT_XPATH = (
+    "//select[contains(@name, 'category') or contains(@id, 'category')"
+    " or contains(@class, 'category') or contains(@name, 'genre') or contains(@id, 'genre')]"
+)
+
+CHANNEL_LABEL_SELECTOR = "label[for*='channelId']"
+TITLE_INPUT_SELECTOR = "input[name='title']"
+
+# XPath unions ("|") resolve every alternative in a single find_elements call
+VISIBILITY_RADIO_XPATH = (
+    "//input[@id='visibility_public']"
+    " | //input[@type='radio' and @value='public']"
+    " | //input[@type='radio' and contains(@value, '{value}')]"
+    " | //label[contains(text(), '{label}')]//input[@type='radio']"
+)
+
+
+@lru_cache(maxsize=8)
+def _visibility_radio_xpath(visibility: str) -> str:
+    """Format the visibility radio union once per distinct visibility value"""
+    return VISIBILITY_RADIO_XPATH.format(value=visibility.lower(), label=visibility)
+
+
+VISIBILITY_PUBLIC_VALUES = ('public', '1', 'Public')
+
+VISIBILITY_SELECT_XPATH = (
+    "//select[contains(@name, 'visibility')]"
+    " | //select[contains(@id, 'visibility')]"
+    " | //select[contains(@name, 'privacy')]"
+)
+
+# Post-submit result markers
+UPLOAD_SUCCESS_TEXT_XPATH = (
+    "//*[contains(text(), 'Video Upload Complete') or contains(text(), 'successfully')]"
+)
+VIDEO_URL_INPUT_SELECTOR = "input[value*='rumble.com/v']"
+
+# CSS selector group; like an XPath union it matches in document order
+VIDEO_URL_SELECTOR = (
+    "a[href*='rumble.com/v'],"
+    " a[href*='/v'],"
+    " input[value*='rumble.com/v'],"
+    " div[class*='video-url'] a,"
+    " div[class*='share'] input,"
+    " input[class*='video-url'],"
+    " textarea[class*='video-url']"
+)
+
+# Selects a radio by id with the events Rumble's form listens for; returns
+# null when missing, otherwise whether it ended up checked
+SELECT_RADIO_BY_ID_JS = """
+var radio = document.getElementById(arguments[0]);
+if (!radio) {
+    return null;
+}
+radio.checked = true;
+radio.dispatchEvent(new Event('change', { bubbles: true }));
+radio.dispatchEvent(new Event('click', { bubbles: true }));
+return radio.checked;
+"""
+
+# Selects the first enabled radio with the given name; returns its 1-based index or 0
+SELECT_FIRST_RADIO_BY_NAME_JS = """
+var radios = document.getElementsByName(arguments[0]);
+for (var i = 0; i < radios.length; i++) {
+    if (!radios[i].disabled) {
+        radios[i].checked = true;
+        radios[i].dispatchEvent(new Event('change', { bubbles: true }));
+        radios[i].dispatchEvent(new Event('click', { bubbles: true }));
+        if (radios[i].checked) {
+            return i + 1;
+        }
+    }
+}
+return 0;
+"""
+
+# Selects the channel radio whose label matches arguments[0] (exact, then partial,
+# case-insensitive) and the visibility radio for arguments[1] in one round-trip.
+# Returns [channelSelected, visibilitySelected]; false entries are retried by the
+# per-field helpers.
+FORM_SELECTIONS_JS = """
+function check(radio) {
+    if (!radio || radio.disabled) {
+        return false;
+    }
+    radio.checked = true;
+    radio.dispatchEvent(new Event('change', { bubbles: true }));
+    radio.dispatchEvent(new Event('click', { bubbles: true }));
+    return radio.checked;
+}
+var destination = arguments[0];
+var wanted = destination.toLowerCase();
+var labels = Array.from(document.querySelectorAll("label[for*='channelId']"));
+var label = labels.find(function (l) { return l.textContent.trim() === destination; })
+    || labels.find(function (l) { return l.textContent.toLowerCase().indexOf(wanted) >= 0; });
+var channel = check(label ? document.getElementById(label.getAttribute('for')) : null);
+
+var visibility = arguments[1].toLowerCase();
+var radio = document.getElementById('visibility_' + visibility)
+    || document.querySelector("input[type='radio'][value='" + visibility + "']");
+var visible = check(radio);
+return [channel, visible];
+"""
+
+# Checks Rumble's rights (crights) and terms (cterms) boxes, returns their states
+AGREEMENT_CHECKBOXES_JS = """
+return ['crights', 'cterms'].map(function (id) {
+    var checkbox = document.getElementById(id);
+    if (!checkbox) {
+        return null;
+    }
+    checkbox.checked = true;
+    checkbox.dispatchEvent(new Event('change', { bubbles: true }));
+    checkbox.dispatchEvent(new Event('click', { bubbles: true }));
+    return checkbox.checked;
+});
+"""
+
+# Clicks every unchecked terms/ownership-style checkbox, returns how many changed
+REQUIRED_CHECKBOXES_JS = """
+var boxes = document.querySelectorAll(
+    "input[type='checkbox'], input[name*='terms'], input[name*='agree'], " +
+    "input[name*='ownership'], input[name*='rights']"
+);
+var count = 0;
+for (var i = 0; i < boxes.length; i++) {
+    if (!boxes[i].checked) {
+        boxes[i].click();
+        count++;
+    }
+}
+return count;
+"""
+
+# Fallback submit buttons, in priority order
+UPLOAD_BUTTON_XPATHS = (
+    "//button[contains(text(), 'Upload')]",
+    "//input[@type='submit' and contains(@value, 'Upload')]",
+    "//button[@type='submit']",
+    "//input[@type='submit']",
+)
+
+LICENSE_SUBMIT_XPATHS = (
+    "//button[contains(text(), 'Continue')]",
+    "//button[contains(text(), 'Agree')]",
+    "//button[contains(text(), 'Accept')]",
+    "//button[contains(text(), 'Submit')]",
+    "//input[@type='submit']",
+    "//button[@type='submit']",
+)
+
+DESCRIPTION_SELECTORS = (
+    "textarea[name='description']",
+    "input[name='description']",
+    "textarea[id*='description']",
+    "div[contenteditable='true']",  # Rich text editor
+)
+
+# Form fields filled by FILL_FIELDS_JS, in the order of the values passed to it
+FILL_FIELD_NAMES = ('title', 'description', 'tags')
+
+# Sets each named field to its value and fires the input/change events the form
+# listens for. Returns one entry per field: null when no value was given, false
+# when the field is missing or disabled, true once it holds the value.
+FILL_FIELDS_JS = """
+var names = arguments[0];
+var values = arguments[1];
+return names.map(function (name, i) {
+    if (values[i] === null) {
+        return null;
+    }
+    var el = document.querySelector('[name="' + name + '"]');
+    if (!el || el.disabled) {
+        return false;
+    }
+    el.focus();
+    el.value = values[i];
+    el.dispatchEvent(new Event('input', { bubbles: true }));
+    el.dispatchEvent(new Event('change', { bubbles: true }));
+    return el.value === values[i];
+});
+"""
+
+# Sets a form control's value (or a rich-text editor's text) and fires the
+# input/change events validators listen for; returns whether the text stuck
+SET_VALUE_JS = """
+var el = arguments[0];
+var text = arguments[1];
+if (el.isContentEditable) {
+    el.innerText = text;
+} else {
+    el.value = text;
+}
+el.dispatchEvent(new Event('input', { bubbles: true }));
+el.dispatchEvent(new Event('change', { bubbles: true }));
+return el.isContentEditable ? el.innerText.trim() === text.trim() : el.value === text;
+"""
+
+# Returns [text, value] for every option of the <select> in arguments[0]
+SELECT_OPTIONS_JS = """
+return Array.from(arguments[0].options).map(function (o) { return [o.text.trim(), o.value]; });
+"""
+
+# Selects option arguments[1] of the <select> in arguments[0] and fires the
+# events a user selection would
+SELECT_INDEX_JS = """
+var el = arguments[0];
+el.selectedIndex = arguments[1];
+el.dispatchEvent(new Event('input', { bubbles: true }));
+el.dispatchEvent(new Event('change', { bubbles: true }));
+return el.selectedIndex === arguments[1];
+"""
+
+# Returns the first enabled (and optionally visible) element matching the
+# selectors in arguments[0]; entries starting with "/" are XPath, the rest CSS.
+# Alternatives are tried in priority order, which a plain "|" union would not
+# preserve since it yields nodes in document order.
+FIRST_MATCH_JS = """
+var selectors = arguments[0];
+var mustBeVisible = arguments[1];
+function matches(selector) {
+    if (selector.charAt(0) !== '/') {
+        return Array.from(document.querySelectorAll(selector));
+    }
+    var snapshot = document.evaluate(selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var nodes = [];
+    for (var k = 0; k < snapshot.snapshotLength; k++) {
+        nodes.push(snapshot.snapshotItem(k));
+    }
+    return nodes;
+}
+for (var i = 0; i < selectors.length; i++) {
+    var nodes = matches(selectors[i]);
+    for (var j = 0; j < nodes.length; j++) {
+        var el = nodes[j];
+        if (el.disabled) {
+            continue;
+        }
+        if (mustBeVisible && !(el.offsetWidth || el.offsetHeight || el.getClientRects().length)) {
+            continue;
+        }
+        return el;
+    }
+}
+return null;
+"""
+
+# Text that only appears on Rumble's license/agreement step
+LICENSE_CONTENT_INDICATORS = (
+    'terms and conditions',
+    'you have not signed an exclusive agreement',
+    'check here if you agree to our',
+    'terms of service',
+)
+
+SUCCESS_KEYWORDS = ('success', 'uploaded', 'complete', 'published', 'processing')
+FINAL_SUCCESS_KEYWORDS = ('success', 'complete', 'uploaded', 'processing')
+
+# Case-insensitive alternations: one pass per string, no lower-cased copies
+_LICENSE_RE = re.compile('|'.join(map(re.escape, LICENSE_CONTENT_INDICATORS)), re.IGNORECASE)
+_LICENSE_META_RE = re.compile(r'licen[sc]e|agreement', re.IGNORECASE)  # URL/title only
+_SUCCESS_RE = re.compile('|'.join(SUCCESS_KEYWORDS), re.IGNORECASE)
+_FINAL_SUCCESS_RE = re.compile('|'.join(FINAL_SUCCESS_KEYWORDS), re.IGNORECASE)
+
+# Saved session cookies, shared by uploaders that are not given their own file
+DEFAULT_COOKIES_FILE = "rumble_cookies.json"
+
+# Video page URLs such as https://rumble.com/v6xvjmq-blah.html (JS-compatible regex)
+VIDEO_URL_PATTERN = r'https://rumble\.com/v[a-zA-Z0-9]+-[^"\s<>]+\.html'
+VIDEO_URL_BROADER_PATTERN = r'https://rumble\.com/v[a-zA-Z0-9]+-[^"\s<>]+'
+
+# Top-level navigations to a published video page
+_VIDEO_PAGE_RE = re.compile(r'rumble\.com/v[a-z0-9]+', re.IGNORECASE)
+
+# Path fragment of the endpoint the upload form posts the video file to
+UPLOAD_ENDPOINT = 'upload.php'
+
+# Quiet period after the last upload request finished before the upload counts
+# as done, so the gap between two chunks is not mistaken for completion
+UPLOAD_SETTLE_SECONDS = 2
+
+# Records the HTTP status of the video upload in window.__uploadStatus. Only
+# file-carrying POSTs to the upload endpoint (arguments[0]) are tracked; a failed
+# request is recorded at once, a successful one only after no further upload
+# request (e.g. the next chunk) started within the settle window (arguments[1],
+# in milliseconds). Installing it
+# again resets the state, so a retry never sees the previous attempt's result.
+UPLOAD_DONE_HOOK_JS = """
+window.__uploadStatus = null;
+window.__uploadProgress = [0, 0];
+window.__uploadPending = 0;
+window.__uploadSeen = false;
+window.__uploadEndpoint = arguments[0];
+window.__uploadSettleMs = arguments[1];
+clearTimeout(window.__uploadSettle);
+if (!window.__uploadHooked) {
+    window.__uploadHooked = true;
+    var finish = function (status) {
+        if (window.__uploadStatus === null) {
+            window.__uploadStatus = status;
+        }
+    };
+    var open = XMLHttpRequest.prototype.open;
+    XMLHttpRequest.prototype.open = function (method, url) {
+        this.__isUpload = String(method).toUpperCase() === 'POST'
+            && String(url).indexOf(window.__uploadEndpoint) >= 0;
+        return open.apply(this, arguments);
+    };
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function (body) {
+        if (this.__isUpload && (body instanceof FormData || body instanceof Blob)) {
+            window.__uploadPending++;
+            window.__uploadSeen = true;
+            clearTimeout(window.__uploadSettle);
+            this.upload.addEventListener('progress', function (e) {
+                if (e.lengthComputable) {
+                    window.__uploadProgress = [e.loaded, e.total];
+                }
+            });
+            this.addEventListener('loadend', function () {
+                var status = this.status || 0;
+                window.__uploadPending--;
+                if (status < 200 || status >= 300) {
+                    finish(status);
+                } else if (window.__uploadPending === 0) {
+                    window.__uploadSettle = setTimeout(function () {
+                        if (window.__uploadPending === 0) {
+                            finish(status);
+                        }
+                    }, window.__uploadSettleMs);
+                }
+            });
+        }
+        return send.apply(this, arguments);
+    };
+}
+"""
+
+# [HTTP status or null while uploading, [bytes sent, bytes total], whether an
+# upload request was seen]; null without the hook
+UPLOAD_PROGRESS_JS = """
+if (!window.__uploadHooked) {
+    return null;
+}
+return [window.__uploadStatus, window.__uploadProgress, window.__uploadSeen];
+"""
+
+# True once the page left the upload form (arguments[0]) or shows the completion text
+COMPLETION_SIGNAL_JS = """
+var href = location.href;
+return href.indexOf('/v') >= 0
+    || (href !== arguments[0] && href.indexOf('upload.php') < 0)
+    || document.documentElement.outerHTML.indexOf('Video Upload Complete!') >= 0;
+"""
+
+# Expression for _evaluate; returns URL, title and text instead of the serialized document
+PAGE_META_EXPRESSION = "[location.href, document.title, document.body ? document.body.textContent : '']"
+
+# Reads URL, title, video links and every page-content signal used by
+# _detect_upload_success in one call, so the full page source never has to be
+# transferred to Python. arguments: strict and broader URL patterns, candidate
+# element selector.
+PAGE_PROBE_JS = """
+function linkUrl() {
+    var links = document.querySelectorAll("a[href*='rumble.com/v'], input[value*='rumble.com/v']");
+    for (var i = 0; i < links.length; i++) {
+        var url = links[i].href || links[i].value;
+        if (/rumble\\.com\\/v[a-z0-9]+-/i.test(url)) {
+            return url;
+        }
+    }
+    return null;
+}
+function candidateUrl(selector) {
+    var nodes = document.querySelectorAll(selector);
+    for (var i = 0; i < nodes.length; i++) {
+        var url = nodes[i].href || nodes[i].value || nodes[i].textContent;
+        if (url && url.indexOf('rumble.com') >= 0 && url.indexOf('/v') >= 0) {
+            return url;
+        }
+    }
+    return null;
+}
+var html = document.documentElement.outerHTML;
+var lower = html.toLowerCase();
+function firstMatch(pattern, minLength) {
+    var matches = html.match(new RegExp(pattern, 'g')) || [];
+    for (var i = 0; i < matches.length; i++) {
+        if (matches[i].length > minLength) {
+            return matches[i];
+        }
+    }
+    return null;
+}
+var complete = html.indexOf('Video Upload Complete!') >= 0;
+return {
+    url: location.href,
+    title: document.title,
+    linkUrl: linkUrl(),
+    candidateUrl: candidateUrl(arguments[2]),
+    complete: complete,
+    videoUrl: complete ? firstMatch(arguments[0], 30) : null,
+    broaderUrl: complete ? firstMatch(arguments[1], 25) : null,
+    successMessage: lower.indexOf('upload successful') >= 0 || lower.indexOf('video uploaded') >= 0,
+    processing: lower.indexOf('processing') >= 0
+};
+"""
+
+
 class RumbleUploader:
     """Handles automated video uploads to Rumble using Selenium"""
-    
-    def __init__(self):
-        """Initialize the Rumble uploader"""
+
+    # chromedriver path, resolved once per process and shared by every uploader
+    _driver_path: Optional[str] = None
+
+    def __init__(self, user_data_dir: Optional[str] = None, cookies_file: Optional[str] = None):
+        """
+        Initialize the Rumble uploader
+
+        Args:
+            user_data_dir: Chrome profile directory (optional). Each concurrently
+                running browser needs its own, Chrome locks the profile in use.
+            cookies_file: Cookie file to load and save (optional, defaults to the shared one)
+        """
         self.driver = None
         self.wait = None
         self.is_logged_in = False
+        self.user_data_dir = user_data_dir or config.CHROME_PROFILE_DIR or None
+
+        # Form elements reused across workflow stages, valid for one page URL
+        self._cached_elements = {}
+        self._cached_url = None
+
+        # Cleared if the driver does not provide CDP events via the performance log
+        self._performance_log_enabled = True
+        self._upload_requests = {}  # CDP id -> HTTP status of the current upload's POSTs
+        self._upload_requests_done = set()
+        self._upload_finished_at = None
+
+        # Cleared if the driver does not accept CDP commands
+        self._cdp_enabled = True
+
+        # Uploads served by the current browser session (see reset_for_next_upload)
+        self._session_uploads = 0
+
+        # Single writer thread for cookie files, so saves never block an upload
+        self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rumble-io")
 
         # Rumble URLs
         self.base_url = "https://rumble.com"
@@ -35,7 +555,7 @@ class RumbleUploader:
         self.upload_url = "https://rumble.com/upload.php"
 
         # Cookie management
-        self.cookies_file = "rumble_cookies.json"
+        self.cookies_file = cookies_file or DEFAULT_COOKIES_FILE
 
         log.info("RumbleUploader initialized")
     
@@ -45,28 +565,41 @@ class RumbleUploader:
             chrome_options = Options()
             
             if config.HEADLESS_MODE:
-                chrome_options.add_argument("--headless")
+                chrome_options.add_argument("--headless=new")
             
             # Additional Chrome options for stability
             chrome_options.add_argument("--no-sandbox")
             chrome_options.add_argument("--disable-dev-shm-usage")
             chrome_options.add_argument("--disable-gpu")
             chrome_options.add_argument("--window-size=1920,1080")
+            chrome_options.add_argument("--autoplay-policy=user-gesture-required")
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            for argument in CHROME_BACKGROUND_ARGS:
+                chrome_options.add_argument(argument)
             chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
+
+            if self.user_data_dir:
+                # Persistent profile: cookies and local storage survive browser restarts
+                chrome_options.add_argument(f"--user-data-dir={os.path.abspath(self.user_data_dir)}")
+                chrome_options.add_argument("--profile-directory=Default")
             
-            # Disable images and CSS for faster loading (optional)
-            prefs = {
-                "profile.managed_default_content_settings.images": 2,
-                "profile.default_content_setting_values.notifications": 2
-            }
-            chrome_options.add_experimental_option("prefs", prefs)
+            # Disable images and media for faster loading; no upload step depends on them
+            chrome_options.add_experimental_option("prefs", CHROME_PREFS)
+
+            # 'eager' returns from driver.get() on DOMContentLoaded; form steps wait explicitly
+            chrome_options.page_load_strategy = config.PAGE_LOAD_STRATEGY
+
+            # Performance log exposes CDP Page/Network events (used for success detection)
+            chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
             
-            # Setup ChromeDriver (use system-installed ChromeDriver)
-            service = Service("/usr/local/bin/chromedriver")
+            # Setup ChromeDriver (system-installed, resolved once per process, else Selenium Manager)
+            service = Service(self._resolve_driver_path())
             driver = webdriver.Chrome(service=service, options=chrome_options)
             
             # Set timeouts
-            driver.implicitly_wait(config.IMPLICIT_WAIT)
+            # No implicit wait: lookups return (or miss) immediately and every real
+            # wait is an explicit WebDriverWait, so timeouts never stack
+            driver.implicitly_wait(0)
             driver.set_page_load_timeout(config.SELENIUM_TIMEOUT)
             
             log.info("Chrome WebDriver setup successfully")
@@ -76,46 +609,71 @@ class RumbleUploader:
             log.error(f"Error setting up WebDriver: {e}")
             raise
 
+    @classmethod
+    def _resolve_driver_path(cls) -> Optional[str]:
+        """Locate an installed chromedriver once; None lets Selenium Manager provide one"""
+        if cls._driver_path is None:
+            driver_path = config.CHROMEDRIVER_PATH
+            if not os.path.isfile(driver_path):
+                driver_path = shutil.which("chromedriver")
+
+            if driver_path:
+                log.info(f"Using ChromeDriver at {driver_path}")
+            else:
+                log.info("No ChromeDriver installed, Selenium Manager will resolve one")
+            cls._driver_path = driver_path or ""
+        return cls._driver_path or None
+
     def save_cookies(self):
         """Save current cookies to file"""
         try:
             if self.driver:
-                cookies = self.driver.get_cookies()
-                with open(self.cookies_file, 'w') as f:
-                    json.dump(cookies, f)
-                log.info(f"Cookies saved to {self.cookies_file}")
+                # Filter once here so load_cookies can add every entry as-is
+                cookies = [
+                    cookie for cookie in self.driver.get_cookies()
+                    if 'name' in cookie and 'value' in cookie
+                ]
+                # Serialize here, write in the background off the upload path
+                self._io_executor.submit(self._write_cookie_file, self.cookies_file, _json_dumps(cookies))
+        except Exception as e:
+            log.error(f"Error saving cookies: {e}")
+
+    @staticmethod
+    def _write_cookie_file(path: str, data: bytes):
+        """Write the cookie file atomically, so a crash never leaves it half-written"""
+        try:
+            tmp_path = Path(f"{path}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+            log.info(f"Cookies saved to {path}")
         except Exception as e:
             log.error(f"Error saving cookies: {e}")
 
     def load_cookies(self):
         """Load cookies from file with better error handling"""
         try:
-            if not os.path.exists(self.cookies_file):
+            cookies_path = Path(self.cookies_file)
+            if not cookies_path.exists():
                 log.info("No cookie file found")
                 return False
 
-            with open(self.cookies_file, 'r') as f:
-                cookies = json.load(f)
+            cookies = _json_loads(cookies_path.read_bytes())
 
             if not cookies:
                 log.info("Cookie file is empty")
                 return False
 
-            # Navigate to domain first with longer timeout
-            log.info("Navigating to base URL for cookie loading...")
-            self.driver.get(self.base_url)
-            time.sleep(3)
-
-            # Add cookies with better error handling
-            cookies_added = 0
-            for cookie in cookies:
-                try:
-                    # Ensure cookie has required fields
-                    if 'name' in cookie and 'value' in cookie:
-                        self.driver.add_cookie(cookie)
-                        cookies_added += 1
-                except Exception as e:
-                    log.debug(f"Could not add cookie {cookie.get('name', 'unknown')}: {e}")
+            # Set cookies through CDP so no page load is needed to establish the domain
+            try:
+                self.driver.execute_cdp_cmd("Network.enable", {})
+                self.driver.execute_cdp_cmd(
+                    "Network.setCookies",
+                    {"cookies": [self._to_cdp_cookie(cookie) for cookie in cookies]}
+                )
+                cookies_added = len(cookies)
+            except Exception as e:
+                log.debug(f"CDP cookie loading unavailable, falling back to add_cookie: {e}")
+                cookies_added = self._add_cookies_via_page(cookies)
 
             log.info(f"Loaded {cookies_added}/{len(cookies)} cookies from {self.cookies_file}")
             return cookies_added > 0
@@ -124,12 +682,53 @@ class RumbleUploader:
             log.error(f"Error loading cookies: {e}")
             return False
 
+    def _add_cookies_via_page(self, cookies: List[Dict[str, Any]]) -> int:
+        """Add cookies with WebDriver, which requires being on the cookie domain"""
+        # Any document on the domain will do; robots.txt loads far faster than the home page
+        log.info("Opening a lightweight rumble.com page for cookie loading...")
+        self.driver.get(f"{self.base_url}/robots.txt")
+
+        cookies_added = 0
+        for cookie in cookies:
+            try:
+                self.driver.add_cookie(cookie)
+                cookies_added += 1
+            except Exception as e:
+                log.debug(f"Could not add cookie {cookie.get('name', 'unknown')}: {e}")
+        return cookies_added
+
+    @staticmethod
+    def _to_cdp_cookie(cookie: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a WebDriver cookie dict to a CDP Network.CookieParam"""
+        cdp_cookie = {
+            'name': cookie['name'],
+            'value': cookie['value'],
+            'domain': cookie.get('domain') or '.rumble.com',
+            'path': cookie.get('path', '/'),
+            'secure': cookie.get('secure', False),
+            'httpOnly': cookie.get('httpOnly', False),
+        }
+        if 'expiry' in cookie:
+            cdp_cookie['expires'] = cookie['expiry']
+        if cookie.get('sameSite') in ('Strict', 'Lax', 'None'):
+            cdp_cookie['sameSite'] = cookie['sameSite']
+        return cdp_cookie
+
     def check_login_status(self) -> bool:
         """Check if already logged in using cookies"""
         try:
             # Navigate to a page that requires login
             self.driver.get(self.upload_url)
-            time.sleep(3)
+
+            # Wait for either the login redirect or the upload form
+            try:
+                WebDriverWait(self.driver, 10, poll_frequency=0.25).until(EC.any_of(
+                    EC.url_contains("login"),
+                    EC.url_contains("auth.rumble.com"),
+                    EC.presence_of_element_located((By.CSS_SELECTOR, FILE_INPUT_SELECTORS[-1])),
+                ))
+            except TimeoutException:
+                log.debug("Login state still unclear after 10 seconds, checking URL")
 
             # Check if we're redirected to login page
             current_url = self.driver.current_url.lower()
@@ -137,7 +736,7 @@ class RumbleUploader:
                 log.info("Not logged in - need to authenticate")
                 return False
             else:
-                log.info("Already logged in via cookies")
+                log.info("Already logged in")
                 self.is_logged_in = True
                 return True
 
@@ -164,6 +763,105 @@ class RumbleUploader:
             log.error(f"Element not found: {by}={value}")
             raise
     
+    def _get_cached_element(self, key: str) -> Optional[Any]:
+        """Return a cached element if it is still attached to the current page"""
+        current_url = self.driver.current_url
+        if current_url != self._cached_url:
+            self._cached_elements.clear()
+            self._cached_url = current_url
+            return None
+
+        element = self._cached_elements.get(key)
+        if element is None:
+            return None
+
+        try:
+            element.is_enabled()  # Cheap probe, raises if the element was detached
+            return element
+        except StaleElementReferenceException:
+            del self._cached_elements[key]
+            return None
+
+    def _find_cached(self, by: By, value: str, key: str, timeout: int = None) -> Any:
+        """Find an element, reusing the cached one while it is still valid"""
+        element = self._get_cached_element(key)
+        if element is None:
+            element = self._wait_and_find_element(by, value, timeout)
+            self._cached_elements[key] = element
+        return element
+
+    def _find_first(self, selectors: tuple, visible_only: bool = False) -> Optional[Any]:
+        """Return the first enabled element matching any of the XPath/CSS selectors, in one round-trip"""
+        try:
+            return self.driver.execute_script(FIRST_MATCH_JS, list(selectors), visible_only)
+        except WebDriverException as e:
+            log.debug(f"Selector lookup failed: {e}")
+            return None
+
+    def _retry_on_stale(self, locate: Callable[[], Any], action: Callable[[Any], Any],
+                        attempts: int = 3) -> Any:
+        """Run action on a freshly located element, re-locating it when it goes stale"""
+        for attempt in range(attempts):
+            try:
+                return action(locate())
+            except StaleElementReferenceException:
+                if attempt == attempts - 1:
+                    raise
+                log.debug(f"Element went stale, re-locating ({attempt + 1}/{attempts})")
+                time.sleep(0.2 * (2 ** attempt))
+
+    @staticmethod
+    def _type_into(field: Any, text: str):
+        """Replace a field's content with text"""
+        field.clear()
+        field.send_keys(text)
+
+    def _js_set_value(self, field: Any, text: str) -> bool:
+        """Set a field's text in one call instead of one keystroke per character"""
+        return bool(self.driver.execute_script(SET_VALUE_JS, field, text))
+
+    def _select_option(self, dropdown: Any, text: str, values: tuple = ()) -> Optional[str]:
+        """Select the option matching text (exact, then partial) or one of values; returns its text"""
+        options = self.driver.execute_script(SELECT_OPTIONS_JS, dropdown) or []
+        wanted = text.lower()
+        index = next((i for i, (label, _) in enumerate(options) if label == text), None)
+        if index is None:
+            index = next((i for i, (label, _) in enumerate(options) if wanted in label.lower()), None)
+        if index is None:
+            index = next((i for i, (_, value) in enumerate(options) if value in values), None)
+        if index is None:
+            return None
+
+        # Select.select_by_index would re-read every option's index attribute
+        if not self.driver.execute_script(SELECT_INDEX_JS, dropdown, index):
+            Select(dropdown).select_by_index(index)
+        return options[index][0]
+
+    def _wait_for_first(self, xpaths: tuple, timeout: int = None, visible_only: bool = False) -> Optional[Any]:
+        """Wait until any of the XPaths matches, checking all alternatives on each poll"""
+        if timeout is None:
+            timeout = config.SELENIUM_TIMEOUT
+
+        try:
+            return WebDriverWait(self.driver, timeout).until(
+                lambda d: self._find_first(xpaths, visible_only)
+            )
+        except TimeoutException:
+            return None
+
+    def _evaluate(self, expression: str) -> Any:
+        """Evaluate a JS expression via CDP Runtime.evaluate, falling back to execute_script"""
+        if self._cdp_enabled:
+            try:
+                result = self.driver.execute_cdp_cmd(
+                    'Runtime.evaluate', {'expression': expression, 'returnByValue': True}
+                )
+                return result.get('result', {}).get('value')
+            except WebDriverException as e:
+                log.debug(f"CDP Runtime.evaluate unavailable, using execute_script: {e}")
+                self._cdp_enabled = False
+        return self.driver.execute_script(f"return {expression};")
+
     def _wait_and_click(self, by: By, value: str, timeout: int = None):
         """Wait for element to be clickable and click it"""
         if timeout is None:
@@ -187,7 +885,12 @@ class RumbleUploader:
                 self.driver = self._setup_driver()
                 self.wait = WebDriverWait(self.driver, config.SELENIUM_TIMEOUT)
 
-            # Try to use existing cookies first
+            # A persistent profile usually still holds the session; skip cookie replay
+            if self.user_data_dir and self.check_login_status():
+                log.info("Logged in via the persistent Chrome profile")
+                return True
+
+            # Fall back to saved cookies
             log.info("Checking for existing login cookies...")
             if self.load_cookies():
                 if self.check_login_status():
@@ -200,7 +903,6 @@ class RumbleUploader:
 
             # Navigate to login page
             self.driver.get(self.login_url)
-            self._human_delay(2, 4)
             
             # Find and fill email field
             email_field = self._wait_and_find_element(By.NAME, "username")
@@ -215,29 +917,18 @@ class RumbleUploader:
             self._human_delay(1, 2)
             
             # Click login button (updated for new Rumble auth page)
-            login_button_selectors = [
-                "//button[@type='submit']",
-                "//button[contains(text(), 'Sign In')]",
-                "//button[contains(text(), 'Login')]",
-                "//input[@type='submit' and @value='Login']",
-                "//input[@type='submit']"
-            ]
-
-            login_button = None
-            for selector in login_button_selectors:
-                try:
-                    login_button = self._wait_and_find_element(By.XPATH, selector, timeout=5)
-                    break
-                except:
-                    continue
-
+            login_button = self._wait_for_first(LOGIN_BUTTON_XPATHS, timeout=5)
             if not login_button:
                 raise Exception("Could not find login button")
 
+            login_page_url = self.driver.current_url
             login_button.click()
-            
-            # Wait for login to complete
-            self._human_delay(3, 5)
+
+            # Wait for the post-login redirect instead of a fixed delay
+            try:
+                WebDriverWait(self.driver, 15).until(EC.url_changes(login_page_url))
+            except TimeoutException:
+                log.warning("Still on the login page 15 seconds after submitting")
             
             # Check if login was successful
             # After successful login, should redirect away from auth.rumble.com
@@ -259,7 +950,8 @@ class RumbleUploader:
             return False
     
     def upload_video(self, video_path: str, title: str, description: str,
-                    tags: List[str] = None, channel: str = None) -> Dict[str, Any]:
+                    tags: List[str] = None, channel: str = None,
+                    progress_callback: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
         """
         Upload video to Rumble
 
@@ -269,6 +961,8 @@ class RumbleUploader:
             description: Video description
             tags: List of tags
             channel: Channel name to upload to (optional)
+            progress_callback: Called with (bytes sent, bytes total) about once a second
+                while the file uploads; runs on the uploading thread (optional)
 
         Returns:
             Dict with upload result
@@ -278,30 +972,46 @@ class RumbleUploader:
             'success': False,
             'url': None,
             'error': None,
+            'retryable': False,  # Failed before anything was submitted, so trying again is safe
             'duration': 0
         }
         
         try:
+            # Validate the file before paying for any browser work
+            try:
+                path = Path(video_path).resolve(strict=True)
+            except FileNotFoundError:
+                result['error'] = f"Video file not found: {video_path}"
+                return result
+            file_size_mb = path.stat().st_size / (1024 * 1024)
+
             # Ensure we're logged in
             if not self.is_logged_in:
                 if not self.login():
                     result['error'] = "Failed to login to Rumble"
                     return result
             
-            log.info(f"Starting video upload: {video_path}")
+            log.info(f"Starting video upload: {path} ({file_size_mb:.1f} MB)")
             
             # Ensure we're on the upload page
             if not self._navigate_to_upload_page():
                 result['error'] = "Failed to navigate to upload page"
+                result['retryable'] = True
                 return result
 
             # Upload video file
-            if not self._upload_file(video_path):
+            if not self._upload_file(str(path)):
                 result['error'] = "Failed to upload video file"
+                result['retryable'] = True
                 return result
             
             # Wait for upload to complete (detect 100% progress)
-            if not self._wait_for_upload_completion():
+            upload_completed = self._wait_for_upload_completion(progress_callback)
+            if upload_completed is False:
+                result['error'] = "Video upload request failed"
+                result['retryable'] = True
+                return result
+            if upload_completed is None:
                 log.warning("Upload progress not detected, continuing anyway")
 
             # Fill HIGH PRIORITY form fields
@@ -315,36 +1025,27 @@ class RumbleUploader:
             else:
                 log.warning("❌ Category selection failed")
 
+            # Channel and visibility radios in one round-trip; misses fall back below
+            channel_selected, visibility_selected = self._apply_form_selections(
+                channel or config.RUMBLE_CHANNEL, "Public"
+            )
+
             # 2. Channel Selection (HIGH PRIORITY)
-            if self._select_upload_destination(channel or config.RUMBLE_CHANNEL):
+            if channel_selected or self._select_upload_destination(channel or config.RUMBLE_CHANNEL):
                 success_count += 1
                 log.info("✅ Channel selection successful")
             else:
                 log.warning("❌ Channel selection failed")
 
             # 3. Visibility (HIGH PRIORITY)
-            if self._set_visibility("Public"):
+            if visibility_selected or self._set_visibility("Public"):
                 success_count += 1
                 log.info("✅ Visibility setting successful")
             else:
                 log.warning("❌ Visibility setting failed")
 
-            # Fill title (always attempt)
-            self._fill_title_only(title)
-
-            # Fill description (LOW PRIORITY - skip if problematic)
-            if description:
-                try:
-                    self._fill_description_safe(description)
-                except:
-                    log.info("Skipping description due to form state issues")
-
-            # Fill tags if provided
-            if tags:
-                try:
-                    self._fill_tags_safe(tags)
-                except:
-                    log.info("Skipping tags due to form state issues")
+            # Fill title, description and tags (title always attempted)
+            self._fill_video_details(title, description, tags)
 
             log.info(f"Form filling completed: {success_count}/{total_priority_fields} priority fields successful")
 
@@ -372,14 +1073,28 @@ class RumbleUploader:
             
         return result
 
+    async def upload_video_async(self, video_path: str, title: str, description: str,
+                                 tags: List[str] = None, channel: str = None,
+                                 progress_callback: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
+        """Run upload_video in a worker thread so an event loop can await it"""
+        return await asyncio.to_thread(
+            self.upload_video, video_path, title, description, tags, channel, progress_callback
+        )
+
     def _navigate_to_upload_page(self) -> bool:
         """Ensure we're properly on the upload page"""
         try:
+            # Reuse a fresh upload form the session is already on (e.g. after listing channels)
+            if self.driver.current_url.startswith(self.upload_url):
+                file_input = self._find_file_input()
+                if file_input and not file_input.get_attribute('value'):
+                    log.info("Already on a fresh upload page, skipping navigation")
+                    return True
+
             log.info("Navigating to upload page...")
 
-            # First try direct navigation
+            # First try direct navigation (a login redirect happens before get() returns)
             self.driver.get(self.upload_url)
-            self._human_delay(3, 5)
 
             current_url = self.driver.current_url.lower()
             log.info(f"After navigation, current URL: {current_url}")
@@ -392,7 +1107,6 @@ class RumbleUploader:
                     return False
                 # Try navigation again
                 self.driver.get(self.upload_url)
-                self._human_delay(3, 5)
                 current_url = self.driver.current_url.lower()
 
             # Check if we're on the main page instead of upload page
@@ -400,23 +1114,14 @@ class RumbleUploader:
                 log.info("On main page, looking for upload link...")
 
                 # Look for upload link on the main page
-                upload_link_selectors = [
-                    "//a[contains(@href, 'upload')]",
-                    "//a[contains(text(), 'Upload')]",
-                    "//button[contains(text(), 'Upload')]",
-                    "//div[contains(@class, 'upload')]//a"
-                ]
-
-                for selector in upload_link_selectors:
+                upload_link = self._wait_for_first(UPLOAD_LINK_XPATHS, timeout=10, visible_only=True)
+                if upload_link:
+                    log.info("Found upload link")
+                    upload_link.click()
                     try:
-                        upload_link = self.driver.find_element(By.XPATH, selector)
-                        if upload_link and upload_link.is_displayed():
-                            log.info(f"Found upload link: {selector}")
-                            upload_link.click()
-                            self._human_delay(3, 5)
-                            break
-                    except:
-                        continue
+                        WebDriverWait(self.driver, 10).until(EC.url_contains("upload"))
+                    except TimeoutException:
+                        log.debug("Upload link click did not reach an upload URL")
                 else:
                     log.warning("Could not find upload link on main page")
 
@@ -435,229 +1140,176 @@ class RumbleUploader:
             log.error(f"Error navigating to upload page: {e}")
             return False
 
-    def _upload_file(self, video_path: str) -> bool:
-        """Upload the video file - handles hidden file inputs"""
+    def _upload_file(self, absolute_path: str) -> bool:
+        """Upload the video file (absolute path) - handles hidden file inputs"""
         try:
             log.info("Looking for file upload element...")
 
-            # Wait for page to load
-            self._human_delay(3, 5)
-
-            # Look for the main file input (Filedata) - it's hidden but functional
-            file_input_selectors = [
-                "//input[@name='Filedata']",  # Primary upload input
-                "//input[@id='Filedata']",
-                "//input[@type='file' and @name='Filedata']",
-                "//input[@type='file']",  # Fallback to any file input
-            ]
-
-            file_input = None
-            for selector in file_input_selectors:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, selector)
-                    for element in elements:
-                        # Check if it's enabled (even if hidden)
-                        if element.is_enabled():
-                            # Skip thumbnail upload (customThumb)
-                            name = element.get_attribute('name')
-                            if name and 'thumb' not in name.lower():
-                                file_input = element
-                                log.info(f"Found file input: name={name}, id={element.get_attribute('id')}")
-                                break
-                    if file_input:
-                        break
-                except Exception as e:
-                    log.debug(f"Selector {selector} failed: {e}")
-                    continue
+            # Wait for the (hidden) file input instead of a fixed page-load delay
+            try:
+                file_input = WebDriverWait(self.driver, config.SELENIUM_TIMEOUT).until(
+                    lambda d: self._find_file_input()
+                )
+            except TimeoutException:
+                file_input = None
 
             if not file_input:
                 log.error("Could not find usable file upload element")
                 return False
 
-            # Send file path to the hidden input (this works even if hidden)
-            absolute_path = str(Path(video_path).absolute())
+            # Send file path to the hidden input (this works even if hidden). With a local
+            # chromedriver only the path crosses the WebDriver wire; Chrome streams the
+            # file from disk in the page's own upload request.
             log.info(f"Uploading file to hidden input: {absolute_path}")
 
+            # Hook the upload XHR before the upload starts
+            try:
+                self.driver.execute_script(UPLOAD_DONE_HOOK_JS, UPLOAD_ENDPOINT, UPLOAD_SETTLE_SECONDS * 1000)
+            except Exception as e:
+                log.debug(f"Could not install upload completion hook: {e}")
+
+            # Only CDP network events from this upload onwards are relevant
+            self._drain_performance_log()
+            self._reset_upload_requests()
+
             # Use JavaScript to set the file if direct send_keys fails
             try:
                 file_input.send_keys(absolute_path)
                 log.info("Video file selected for upload via send_keys")
-            except Exception as e:
+            except ElementNotInteractableException as e:
                 log.warning(f"send_keys failed, trying JavaScript method: {e}")
                 # Alternative: Use JavaScript to trigger file selection
-                self.driver.execute_script(f"arguments[0].style.display = 'block';", file_input)
+                self.driver.execute_script("arguments[0].style.display = 'block';", file_input)
                 file_input.send_keys(absolute_path)
-                self.driver.execute_script(f"arguments[0].style.display = 'none';", file_input)
+                self.driver.execute_script("arguments[0].style.display = 'none';", file_input)
                 log.info("Video file selected for upload via JavaScript")
 
-            # Wait for file to be processed and upload to start (reduced delay)
-            self._human_delay(3, 5)
-
+            # No settle delay: _wait_for_upload_completion waits on the upload request
             return True
 
         except Exception as e:
             log.error(f"Error uploading file: {e}")
             return False
 
-    def _wait_for_upload_completion(self) -> bool:
-        """Wait for upload progress to reach 100%"""
+    def _find_file_input(self) -> Optional[Any]:
+        """Return the main video file input (Filedata), skipping the thumbnail input"""
+        for selector in FILE_INPUT_SELECTORS:
+            try:
+                for element in self.driver.find_elements(By.CSS_SELECTOR, selector):
+                    # Check if it's enabled (even if hidden)
+                    if element.is_enabled():
+                        # Skip thumbnail upload (customThumb)
+                        name = element.get_attribute('name')
+                        if name and 'thumb' not in name.lower():
+                            log.info(f"Found file input: name={name}, id={element.get_attribute('id')}")
+                            return element
+            except Exception as e:
+                log.debug(f"Selector {selector} failed: {e}")
+        return None
+
+    def _wait_for_upload_completion(self, progress_callback: Optional[Callable[[int, int], None]] = None) -> Optional[bool]:
+        """Wait for the video upload request to finish.
+
+        Returns True once the upload is accepted, False if the upload request
+        failed (non-2xx or aborted), and None if completion could not be detected.
+        """
         try:
             log.info("Waiting for upload progress to complete...")
 
             max_wait_time = 120  # 2 minutes max wait
-            start_time = time.time()
-
-            while time.time() - start_time < max_wait_time:
-                # Check for 100% completion
-                completion_indicators = [
-                    "//*[contains(text(), '100%')]",
-                    "//*[contains(text(), 'Complete')]",
-                    "//*[contains(text(), 'Uploaded')]",
-                    "//*[contains(text(), 'Processing')]"
-                ]
-
-                for indicator in completion_indicators:
-                    try:
-                        elements = self.driver.find_elements(By.XPATH, indicator)
-                        if elements:
-                            log.info(f"Upload completion detected: {elements[0].text}")
-                            self._human_delay(1, 2)  # Reduced wait for form to be ready
-                            return True
-                    except:
-                        continue
-
-                # Check if upload form fields are now available/enabled
-                title_field = self.driver.find_elements(By.XPATH, "//input[@name='title']")
-                if title_field and title_field[0].is_enabled():
-                    log.info("Upload form fields are now available")
-                    return True
 
-                self._human_delay(2, 3)
+            # All completion signals share one deadline, so whichever arrives first wins
+            try:
+                source, status = WebDriverWait(self.driver, max_wait_time, poll_frequency=0.5).until(
+                    lambda d: self._check_upload_signals(progress_callback)
+                )
+            except TimeoutException:
+                log.warning("Upload progress timeout, but continuing...")
+                return None
 
-            log.warning("Upload progress timeout, but continuing...")
+            if source == 'page':
+                log.info("Upload form fields are now available")
+                return True
+            if 200 <= status < 300:
+                log.info(f"Upload request completed with HTTP status {status}")
+                return True
+            log.error(f"Upload request failed with HTTP status {status}")
             return False
 
         except Exception as e:
             log.error(f"Error waiting for upload completion: {e}")
-            return False
+            return None
+
+    def _check_upload_signals(self, progress_callback: Optional[Callable[[int, int], None]] = None) -> Optional[Tuple[str, Optional[int]]]:
+        """One upload completion poll.
+
+        Returns ('request', status) once the hooked upload XHR finished, or, while the
+        hook tracks no request, once the upload POSTs finished in CDP network events or
+        ('page', None) once the title field became enabled; None while the upload is
+        still running.
+        """
+        try:
+            state = self.driver.execute_script(UPLOAD_PROGRESS_JS)
+        except WebDriverException as e:
+            log.debug(f"Upload completion hook unavailable: {e}")
+            state = None
+
+        hook_tracking = False
+        if state is not None:
+            status, (sent, total) = state[:2]
+            hook_tracking = len(state) > 2 and bool(state[2])
+            if progress_callback and total:
+                try:
+                    progress_callback(sent, total)
+                except Exception as e:
+                    log.debug(f"Progress callback failed: {e}")
+            if status is not None:
+                return 'request', status
+
+        # CDP network events and the title field only stand in for the hook when it
+        # never saw the request; otherwise the hook's status and settle window decide
+        if hook_tracking:
+            return None
+
+        status = self._upload_request_status()
+        if status is not None:
+            return 'request', status
+
+        # The title field becoming enabled means the upload has been accepted
+        fields = self.driver.find_elements(By.CSS_SELECTOR, TITLE_INPUT_SELECTOR)
+        if fields and fields[0].is_enabled():
+            return 'page', None
+        return None
 
     def _select_category_text_input(self, category: str = "News") -> bool:
-        """Select category using text input method"""
+        """Select category using text input method, falling back to a dropdown"""
         try:
             log.info(f"Selecting category via text input: {category}")
 
             # Look for category input field (text input that accepts typing)
-            category_input_selectors = [
-                "//input[contains(@name, 'category')]",
-                "//input[contains(@id, 'category')]",
-                "//input[contains(@placeholder, 'category')]",
-                "//input[contains(@placeholder, 'Category')]",
-                "//input[contains(@class, 'category')]"
-            ]
-
-            for selector in category_input_selectors:
+            for category_input in self.driver.find_elements(By.XPATH, CATEGORY_INPUT_XPATH):
                 try:
-                    category_input = self.driver.find_element(By.XPATH, selector)
-                    if category_input and category_input.is_enabled():
+                    if category_input.is_enabled():
                         # Clear and type the category
                         category_input.clear()
                         category_input.send_keys(category)
                         log.info(f"Entered category via text input: {category}")
-                        self._human_delay(1, 2)
 
-                        # Press Tab to confirm
-                        from selenium.webdriver.common.keys import Keys
+                        # Press Tab to confirm; give the autocomplete a moment to commit
                         category_input.send_keys(Keys.TAB)
-                        self._human_delay(1, 2)
+                        time.sleep(0.2)
                         return True
                 except:
                     continue
 
             # Fallback to dropdown method
-            return self._select_category_dropdown(category)
-
-        except Exception as e:
-            log.error(f"Error selecting category via text input: {e}")
-            return False
-
-    def _select_category_dropdown(self, category: str = "News") -> bool:
-        """Fallback method for category selection via dropdown"""
-        try:
-            category_selectors = [
-                "//select[contains(@name, 'category')]",
-                "//select[contains(@id, 'category')]",
-                "//select[contains(@class, 'category')]"
-            ]
-
-            for selector in category_selectors:
-                try:
-                    category_dropdown = self.driver.find_element(By.XPATH, selector)
-                    if category_dropdown:
-                        from selenium.webdriver.support.ui import Select
-                        select = Select(category_dropdown)
-
-                        try:
-                            select.select_by_visible_text(category)
-                            log.info(f"Selected category via dropdown: {category}")
-                            self._human_delay(1, 2)
-                            return True
-                        except:
-                            # Try partial match
-                            for option in select.options:
-                                if category.lower() in option.text.lower():
-                                    select.select_by_visible_text(option.text)
-                                    log.info(f"Selected category by partial match: {option.text}")
-                                    self._human_delay(1, 2)
-                                    return True
-                except:
-                    continue
-
-            return False
-
-        except Exception as e:
-            log.error(f"Error selecting category via dropdown: {e}")
-            return False
-
-    def _select_channel(self, channel_name: str) -> bool:
-        """Legacy method - now redirects to _select_upload_destination"""
-        return self._select_upload_destination(channel_name)
-
-    def _select_category(self, category: str = "News") -> bool:
-        """Select video category"""
-        try:
-            log.info(f"Selecting category: {category}")
-
-            # Look for category dropdown or selection
-            category_selectors = [
-                "//select[contains(@name, 'category')]",
-                "//select[contains(@id, 'category')]",
-                "//select[contains(@class, 'category')]",
-                "//div[contains(@class, 'category')]//select",
-                "//select[contains(@name, 'genre')]",
-                "//select[contains(@id, 'genre')]"
-            ]
-
-            for selector in category_selectors:
+            for category_dropdown in self.driver.find_elements(By.XPATH, CATEGORY_SELECT_XPATH):
                 try:
-                    category_dropdown = self.driver.find_element(By.XPATH, selector)
-                    if category_dropdown:
-                        from selenium.webdriver.support.ui import Select
-                        select = Select(category_dropdown)
-
-                        # Try to select by visible text
-                        try:
-                            select.select_by_visible_text(category)
-                            log.info(f"Selected category: {category}")
-                            self._human_delay(1, 2)
-                            return True
-                        except:
-                            # Try partial match
-                            for option in select.options:
-                                if category.lower() in option.text.lower():
-                                    select.select_by_visible_text(option.text)
-                                    log.info(f"Selected category by partial match: {option.text}")
-                                    self._human_delay(1, 2)
-                                    return True
+                    # Option texts are read in one call and matched locally
+                    selected = self._select_option(category_dropdown, category)
+                    if selected:
+                        log.info(f"Selected category via dropdown: {selected}")
+                        return True
                 except:
                     continue
 
@@ -671,17 +1323,21 @@ class RumbleUploader:
     def get_available_channels(self) -> list:
         """Get list of available channels for user selection"""
         try:
-            # Make sure we're logged in first
-            if not hasattr(self, 'driver') or not self.driver:
-                self._setup_driver()
+            # Make sure we're logged in first (login() starts the browser if needed)
+            if not self.driver or not self.is_logged_in:
                 self.login()
 
             # Navigate to upload page to see channels
-            self.driver.get("https://rumble.com/upload.php")
-            self._human_delay(2, 3)
+            self.driver.get(self.upload_url)
+            try:
+                WebDriverWait(self.driver, 5).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, CHANNEL_LABEL_SELECTOR))
+                )
+            except TimeoutException:
+                log.debug("No channel labels rendered on the upload page")
 
             # Find all channel labels
-            all_labels = self.driver.find_elements(By.XPATH, "//label[contains(@for, 'channelId')]")
+            all_labels = self.driver.find_elements(By.CSS_SELECTOR, CHANNEL_LABEL_SELECTOR)
             available_channels = []
 
             for label in all_labels:
@@ -702,6 +1358,23 @@ class RumbleUploader:
             log.error(f"Error getting available channels: {e}")
             return []
 
+    def _apply_form_selections(self, destination: str = None, visibility: str = "Public") -> List[bool]:
+        """Select channel and visibility radios in a single script call"""
+        destination = destination or "The GRYD"
+        try:
+            channel_selected, visibility_selected = self.driver.execute_script(
+                FORM_SELECTIONS_JS, destination, visibility
+            )
+        except Exception as e:
+            log.debug(f"Batched form selection failed: {e}")
+            return [False, False]
+
+        if channel_selected:
+            log.info(f"✅ Successfully selected '{destination}' channel")
+        if visibility_selected:
+            log.info(f"Selected visibility radio button: {visibility}")
+        return [bool(channel_selected), bool(visibility_selected)]
+
     def _select_upload_destination(self, destination: str = None) -> bool:
         """Select upload destination/channel using the proven method"""
         try:
@@ -710,48 +1383,46 @@ class RumbleUploader:
 
             log.info(f"Selecting upload destination: {destination}")
 
-            # First, let's see what channels are available
+            # Fetch all channel labels in one round-trip; matching happens locally
+            # so a missing channel does not pay a find_element wait per attempt
+            channel_labels = []
             try:
-                all_labels = self.driver.find_elements(By.XPATH, "//label[contains(@for, 'channelId')]")
-                available_channels = [label.text.strip() for label in all_labels if label.text.strip()]
-                log.info(f"Available channels: {available_channels}")
+                all_labels = self.driver.find_elements(By.CSS_SELECTOR, CHANNEL_LABEL_SELECTOR)
+                channel_labels = [(label, label.text.strip()) for label in all_labels]
+                log.info(f"Available channels: {[text for _, text in channel_labels if text]}")
             except Exception as e:
                 log.debug(f"Could not list available channels: {e}")
 
             # Method 1: Find by label text and get associated radio (PROVEN METHOD)
-            try:
-                # Try exact match first
-                label = self.driver.find_element(By.XPATH, f"//label[text()='{destination}']")
-                for_attr = label.get_attribute('for')
+            for_attr = None
+            destination_lower = destination.lower()
+            label = next((label for label, text in channel_labels if text == destination), None)
+            if label is not None:
                 log.info(f"Found exact match for '{destination}'")
-            except:
+            else:
+                label = next(
+                    (label for label, text in channel_labels if destination_lower in text.lower()), None
+                )
+                if label is not None:
+                    log.info(f"Found partial match for '{destination}'")
+                else:
+                    log.warning(f"Could not find channel '{destination}'")
+
+            if label is not None:
                 try:
-                    # Try partial match
-                    label = self.driver.find_element(By.XPATH, f"//label[contains(text(), '{destination}')]")
                     for_attr = label.get_attribute('for')
-                    log.info(f"Found partial match for '{destination}'")
                 except Exception as e:
-                    log.warning(f"Could not find channel '{destination}': {e}")
-                    for_attr = None
+                    log.warning(f"Could not read channel label for '{destination}': {e}")
 
             if for_attr:
                 try:
-                    radio = self.driver.find_element(By.XPATH, f"//input[@id='{for_attr}']")
-
-                    log.info(f"Found radio for '{destination}' with id='{for_attr}'")
-
-                    # Use JavaScript to select the radio button with proper events
-                    self.driver.execute_script("""
-                        var radio = arguments[0];
-                        radio.checked = true;
-                        radio.dispatchEvent(new Event('change', { bubbles: true }));
-                        radio.dispatchEvent(new Event('click', { bubbles: true }));
-                    """, radio)
+                    # Locate, select and verify the radio in a single round-trip
+                    selected = self.driver.execute_script(SELECT_RADIO_BY_ID_JS, for_attr)
 
-                    # Verify selection
-                    if radio.is_selected():
+                    if selected is None:
+                        log.warning(f"No radio found for '{destination}' with id='{for_attr}'")
+                    elif selected:
                         log.info(f"✅ Successfully selected '{destination}' channel")
-                        self._human_delay(1, 2)
                         return True
                     else:
                         log.warning(f"❌ Channel '{destination}' selection verification failed")
@@ -759,29 +1430,14 @@ class RumbleUploader:
                 except Exception as e:
                     log.warning(f"Failed to select radio for '{destination}': {e}")
 
-            # Method 2: Fallback - try all channel radios and select first available
+            # Method 2: Fallback - select the first enabled channel radio, entirely in JS
             try:
                 log.info("Trying fallback method - selecting first available channel")
-                channel_radios = self.driver.find_elements(By.XPATH, "//input[@name='channelId']")
+                selected_index = self.driver.execute_script(SELECT_FIRST_RADIO_BY_NAME_JS, "channelId")
 
-                for i, radio in enumerate(channel_radios):
-                    try:
-                        if radio.is_enabled():
-                            # Use JavaScript to select
-                            self.driver.execute_script("""
-                                var radio = arguments[0];
-                                radio.checked = true;
-                                radio.dispatchEvent(new Event('change', { bubbles: true }));
-                                radio.dispatchEvent(new Event('click', { bubbles: true }));
-                            """, radio)
-
-                            if radio.is_selected():
-                                log.info(f"✅ Selected channel {i+1} (fallback)")
-                                self._human_delay(1, 2)
-                                return True
-                    except Exception as e:
-                        log.debug(f"Radio {i+1} failed: {e}")
-                        continue
+                if selected_index:
+                    log.info(f"✅ Selected channel {selected_index} (fallback)")
+                    return True
 
             except Exception as e:
                 log.warning(f"Fallback method failed: {e}")
@@ -799,57 +1455,28 @@ class RumbleUploader:
             log.info(f"Setting visibility to: {visibility}")
 
             # Look for specific visibility radio button (from working test)
-            visibility_radio_selectors = [
-                "//input[@id='visibility_public']",  # Specific public visibility radio
-                f"//input[@type='radio' and @value='public']",
-                f"//input[@type='radio' and contains(@value, '{visibility.lower()}')]",
-                f"//label[contains(text(), '{visibility}')]//input[@type='radio']"
-            ]
-
-            for selector in visibility_radio_selectors:
+            for visibility_radio in self.driver.find_elements(By.XPATH, _visibility_radio_xpath(visibility)):
                 try:
-                    visibility_radio = self.driver.find_element(By.XPATH, selector)
-                    if visibility_radio and visibility_radio.is_displayed():
+                    if visibility_radio.is_displayed():
                         # Use JavaScript click with event dispatch (from working test)
                         self.driver.execute_script("""
                             arguments[0].checked = true;
                             arguments[0].dispatchEvent(new Event('change'));
                         """, visibility_radio)
                         log.info(f"Selected visibility radio button: {visibility}")
-                        self._human_delay(0.5, 1)  # Reduced delay
                         return True
                 except:
                     continue
 
             # Look for visibility dropdown
-            visibility_selectors = [
-                "//select[contains(@name, 'visibility')]",
-                "//select[contains(@id, 'visibility')]",
-                "//select[contains(@name, 'privacy')]"
-            ]
-
-            for selector in visibility_selectors:
+            for visibility_dropdown in self.driver.find_elements(By.XPATH, VISIBILITY_SELECT_XPATH):
                 try:
-                    visibility_dropdown = self.driver.find_element(By.XPATH, selector)
-                    if visibility_dropdown and visibility_dropdown.is_displayed():
-                        from selenium.webdriver.support.ui import Select
-                        select = Select(visibility_dropdown)
-
-                        try:
-                            select.select_by_visible_text(visibility)
-                            log.info(f"Selected visibility: {visibility}")
-                            self._human_delay(0.5, 1)  # Reduced delay
+                    if visibility_dropdown.is_displayed():
+                        # Match by text, then by the common values, from one options read
+                        selected = self._select_option(visibility_dropdown, visibility, VISIBILITY_PUBLIC_VALUES)
+                        if selected:
+                            log.info(f"Selected visibility: {selected}")
                             return True
-                        except:
-                            # Try common values
-                            for value in ['public', '1', 'Public']:
-                                try:
-                                    select.select_by_value(value)
-                                    log.info(f"Selected visibility with value: {value}")
-                                    self._human_delay(0.5, 1)
-                                    return True
-                                except:
-                                    continue
                 except:
                     continue
 
@@ -864,50 +1491,48 @@ class RumbleUploader:
     def _fill_title_only(self, title: str) -> bool:
         """Fill only the title field safely"""
         try:
-            title_field = self._wait_and_find_element(By.NAME, "title", timeout=10)
-            title_field.clear()
-            title_field.send_keys(title)
-            self._human_delay(1, 2)
+            self._retry_on_stale(
+                lambda: self._find_cached(By.NAME, "title", "title", timeout=10),
+                lambda field: self._type_into(field, title)
+            )
             log.debug(f"Filled title: {title}")
             return True
         except Exception as e:
             log.warning(f"Could not fill title: {e}")
             return False
 
+    def _locate_description(self) -> Optional[Any]:
+        """Return the description field, reusing the cached one while it is attached"""
+        description_field = self._get_cached_element("description")
+        if description_field is None:
+            description_field = self._find_first(DESCRIPTION_SELECTORS, visible_only=True)
+            if description_field is not None:
+                self._cached_elements["description"] = description_field
+        return description_field
+
     def _fill_description_safe(self, description: str) -> bool:
         """Fill description field with error handling"""
+
+        def fill(description_field) -> bool:
+            if description_field is None:
+                return False
+
+            # Check if field is enabled and ready
+            if not description_field.is_enabled():
+                log.debug("Description field not enabled")
+                return False
+
+            # Set long text in one call; type it only if the editor ignores the value
+            if self._js_set_value(description_field, description):
+                log.debug("Filled description via JavaScript")
+            else:
+                self._type_into(description_field, description)
+                log.debug("Filled description via send_keys")
+            return True
+
         try:
-            # Try multiple approaches to find and fill description
-            description_selectors = [
-                "//textarea[@name='description']",
-                "//input[@name='description']",
-                "//textarea[contains(@id, 'description')]",
-                "//div[@contenteditable='true']"  # Rich text editor
-            ]
-
-            for selector in description_selectors:
-                try:
-                    description_field = self.driver.find_element(By.XPATH, selector)
-                    if description_field and description_field.is_displayed():
-                        # Check if field is enabled and ready
-                        if description_field.is_enabled():
-                            # Try different methods to clear and fill
-                            try:
-                                description_field.clear()
-                                description_field.send_keys(description)
-                                log.debug("Filled description successfully")
-                                self._human_delay(0.5, 1)  # Reduced delay
-                                return True
-                            except:
-                                # Try JavaScript method if direct input fails
-                                self.driver.execute_script("arguments[0].value = arguments[1];", description_field, description)
-                                log.debug("Filled description via JavaScript")
-                                self._human_delay(0.5, 1)
-                                return True
-                        else:
-                            log.debug(f"Description field not enabled: {selector}")
-                except:
-                    continue
+            if self._retry_on_stale(self._locate_description, fill):
+                return True
 
             log.warning("Could not find or fill description field - skipping (not critical)")
             return False  # Not critical for upload success
@@ -919,12 +1544,16 @@ class RumbleUploader:
     def _fill_tags_safe(self, tags: List[str]) -> bool:
         """Fill tags field with error handling"""
         try:
-            tags_field = self._wait_and_find_element(By.NAME, "tags", timeout=5)
-            if tags_field.is_enabled():
-                tags_field.clear()
-                tags_string = ", ".join(tags)
-                tags_field.send_keys(tags_string)
-                self._human_delay(1, 2)
+            tags_string = ", ".join(tags)
+
+            def fill(tags_field):
+                if not tags_field.is_enabled():
+                    return False
+                if not self._js_set_value(tags_field, tags_string):
+                    self._type_into(tags_field, tags_string)
+                return True
+
+            if self._retry_on_stale(lambda: self._find_cached(By.NAME, "tags", "tags", timeout=5), fill):
                 log.debug(f"Filled tags: {tags_string}")
                 return True
             else:
@@ -935,39 +1564,23 @@ class RumbleUploader:
             return False
 
     def _fill_video_details(self, title: str, description: str, tags: List[str] = None) -> bool:
-        """Fill video title, description, and tags"""
+        """Fill video title, description, and tags in one script call, typing only into fields it missed"""
+        values = [title, description or None, ", ".join(tags) if tags else None]
         try:
-            # Fill title
-            title_field = self._wait_and_find_element(By.NAME, "title")
-            title_field.clear()
-            title_field.send_keys(title)
-            self._human_delay(1, 2)
-            log.debug(f"Filled title: {title}")
-            
-            # Fill description
-            description_field = self._wait_and_find_element(By.NAME, "description")
-            description_field.clear()
-            description_field.send_keys(description)
-            self._human_delay(1, 2)
-            log.debug("Filled description")
-            
-            # Fill tags if provided
-            if tags:
-                try:
-                    tags_field = self._wait_and_find_element(By.NAME, "tags")
-                    tags_field.clear()
-                    tags_string = ", ".join(tags)
-                    tags_field.send_keys(tags_string)
-                    self._human_delay(1, 2)
-                    log.debug(f"Filled tags: {tags_string}")
-                except:
-                    log.warning("Could not find tags field - skipping")
-            
-            return True
-            
+            filled = self.driver.execute_script(FILL_FIELDS_JS, FILL_FIELD_NAMES, values)
         except Exception as e:
-            log.error(f"Error filling video details: {e}")
-            return False
+            log.debug(f"Batched field fill failed, typing fields individually: {e}")
+            filled = [False, False, False]
+
+        # Some inputs only accept synthetic keystrokes; fall back per field
+        title_filled = bool(filled[0]) or self._fill_title_only(title)
+        if description and not filled[1]:
+            self._fill_description_safe(description)
+        if tags and not filled[2]:
+            self._fill_tags_safe(tags)
+
+        log.debug(f"Filled video details (batched: {filled})")
+        return title_filled
     
     def _submit_upload_and_handle_license(self) -> Optional[str]:
         """Submit the upload form, handle license page, and return video URL"""
@@ -976,33 +1589,31 @@ class RumbleUploader:
             self._check_required_boxes()
 
             # Find and click the main upload button (use specific ID from test)
-            upload_button_selectors = [
-                "//input[@id='submitForm']",  # Primary submit button
-                "//button[contains(text(), 'Upload')]",
-                "//input[@type='submit' and contains(@value, 'Upload')]",
-                "//button[@type='submit']",
-                "//input[@type='submit']"
-            ]
-
             upload_button = None
-            for selector in upload_button_selectors:
-                try:
-                    upload_button = self.driver.find_element(By.XPATH, selector)
-                    if upload_button and upload_button.is_enabled():
-                        break
-                except:
-                    continue
+            try:
+                upload_button = self._find_cached(By.ID, "submitForm", "submitForm", timeout=5)
+            except TimeoutException:
+                pass
+
+            if not (upload_button and upload_button.is_enabled()):
+                upload_button = self._find_first(UPLOAD_BUTTON_XPATHS)
 
             if not upload_button:
                 log.error("Could not find upload button")
                 return None
 
+            # Discard buffered CDP events so only post-submit navigations are considered
+            self._find_video_navigation()
+
             log.info("Clicking upload button...")
             # Use JavaScript click for reliability
             self.driver.execute_script("arguments[0].click();", upload_button)
 
-            # Wait for page transition
-            self._human_delay(3, 5)
+            # Wait for page transition (the old form is detached once it happens)
+            try:
+                WebDriverWait(self.driver, 10).until(EC.staleness_of(upload_button))
+            except TimeoutException:
+                log.debug("Upload button still attached after submit, continuing")
 
             # Handle license agreement page and complete the entire workflow
             final_url = self._handle_license_page_and_submit()
@@ -1020,19 +1631,12 @@ class RumbleUploader:
     def _handle_license_page_and_submit(self) -> Optional[str]:
         """Handle the license agreement page and complete the entire upload workflow"""
         try:
-            current_url = self.driver.current_url.lower()
-            page_title = self.driver.title.lower()
-
-            # Check if we're on a license or agreement page by content (not URL)
-            page_source = self.driver.page_source.lower()
-            license_content_indicators = [
-                'terms and conditions',
-                'you have not signed an exclusive agreement',
-                'check here if you agree to our',
-                'terms of service'
-            ]
-
-            is_license_page = any(indicator in page_source for indicator in license_content_indicators)
+            # Check if we're on a license or agreement page: URL/title first, then content
+            url, title, page_text = self._evaluate(PAGE_META_EXPRESSION) or ('', '', '')
+            log.debug(f"Post-submit page - URL: {url}, Title: {title}")
+            is_license_page = bool(
+                _LICENSE_META_RE.search(url) or _LICENSE_META_RE.search(title) or _LICENSE_RE.search(page_text)
+            )
 
             if is_license_page:
 
@@ -1041,88 +1645,54 @@ class RumbleUploader:
                 # Target the specific Rumble agreement checkboxes
                 log.info("Targeting specific Rumble agreement checkboxes...")
 
+                # Check both agreements and read them back in a single round-trip
                 checkboxes_checked = 0
-
-                # Checkbox 1: Rights agreement (id='crights')
                 try:
-                    crights_checkbox = self.driver.find_element(By.XPATH, "//input[@id='crights']")
-                    self.driver.execute_script("""
-                        var checkbox = arguments[0];
-                        checkbox.checked = true;
-                        checkbox.dispatchEvent(new Event('change', { bubbles: true }));
-                        checkbox.dispatchEvent(new Event('click', { bubbles: true }));
-                    """, crights_checkbox)
-
-                    # Verify
-                    is_checked = self.driver.execute_script("return arguments[0].checked;", crights_checkbox)
-                    if is_checked:
+                    crights_checked, cterms_checked = self.driver.execute_script(AGREEMENT_CHECKBOXES_JS)
+
+                    if crights_checked:
                         checkboxes_checked += 1
                         log.info("✅ Rights agreement checkbox checked")
                     else:
                         log.warning("❌ Rights agreement checkbox not checked")
 
-                except Exception as e:
-                    log.warning(f"Rights agreement checkbox error: {e}")
-
-                # Checkbox 2: Terms agreement (id='cterms')
-                try:
-                    cterms_checkbox = self.driver.find_element(By.XPATH, "//input[@id='cterms']")
-                    self.driver.execute_script("""
-                        var checkbox = arguments[0];
-                        checkbox.checked = true;
-                        checkbox.dispatchEvent(new Event('change', { bubbles: true }));
-                        checkbox.dispatchEvent(new Event('click', { bubbles: true }));
-                    """, cterms_checkbox)
-
-                    # Verify
-                    is_checked = self.driver.execute_script("return arguments[0].checked;", cterms_checkbox)
-                    if is_checked:
+                    if cterms_checked:
                         checkboxes_checked += 1
                         log.info("✅ Terms agreement checkbox checked")
                     else:
                         log.warning("❌ Terms agreement checkbox not checked")
 
                 except Exception as e:
-                    log.warning(f"Terms agreement checkbox error: {e}")
+                    log.warning(f"Agreement checkbox error: {e}")
 
                 log.info(f"Agreement checkboxes: {checkboxes_checked}/2 checked")
 
-                # Wait before final submit
-                self._human_delay(2, 3)
-
-                # Look for final submit button (use specific ID from working test)
-                license_submit_selectors = [
-                    "//input[@id='submitForm2']",  # Specific final submit button from working test
-                    "//button[contains(text(), 'Continue')]",
-                    "//button[contains(text(), 'Agree')]",
-                    "//button[contains(text(), 'Accept')]",
-                    "//button[contains(text(), 'Submit')]",
-                    "//input[@type='submit']",
-                    "//button[@type='submit']"
-                ]
+                # Look for final submit button, re-locating it if the page re-renders it
+                def click_submit(submit_button) -> Optional[str]:
+                    if not submit_button:
+                        return None
+                    # Read the label first: the button is gone once the click navigates
+                    label = submit_button.get_attribute('id') or submit_button.text
+                    # Scroll to button and use JavaScript click (from working test)
+                    self.driver.execute_script("arguments[0].scrollIntoView();", submit_button)
+                    self.driver.execute_script("arguments[0].click();", submit_button)
+                    return label or "submit"
 
-                for selector in license_submit_selectors:
-                    try:
-                        submit_button = self.driver.find_element(By.XPATH, selector)
-                        if submit_button and submit_button.is_enabled():
-                            # Scroll to button and use JavaScript click (from working test)
-                            self.driver.execute_script("arguments[0].scrollIntoView();", submit_button)
-                            self._human_delay(1, 1)
-                            self.driver.execute_script("arguments[0].click();", submit_button)
-                            log.info(f"✅ FINAL SUBMIT CLICKED: {submit_button.get_attribute('id') or submit_button.text}")
-
-                            # Wait for final result (from working test)
-                            self._human_delay(5, 8)
-
-                            # Check final result and detect success
-                            final_url = self.driver.current_url
-                            final_title = self.driver.title
-                            log.info(f"After final submit - URL: {final_url}, Title: {final_title}")
-
-                            # Now run success detection to find the actual video URL
-                            return self._detect_upload_success()
-                    except:
-                        continue
+                submit_label = self._retry_on_stale(self._locate_license_submit, click_submit)
+
+                if submit_label:
+                    log.info(f"✅ FINAL SUBMIT CLICKED: {submit_label}")
+
+                    # Wait for the first sign of the final result instead of a fixed delay
+                    self._wait_for_submit_result()
+
+                    # Check final result and detect success
+                    final_url = self.driver.current_url
+                    final_title = self.driver.title
+                    log.info(f"After final submit - URL: {final_url}, Title: {final_title}")
+
+                    # Now run success detection to find the actual video URL
+                    return self._detect_upload_success()
 
                 log.warning("Could not find final submit button on license page")
                 return None
@@ -1135,199 +1705,427 @@ class RumbleUploader:
             log.error(f"Error handling license page: {e}")
             return None
 
+    def _wait_for_submit_result(self) -> bool:
+        """Wait until the page shows a video URL or the upload success text"""
+        try:
+            WebDriverWait(self.driver, config.SELENIUM_TIMEOUT, poll_frequency=0.5).until(EC.any_of(
+                EC.url_contains('/v'),
+                EC.presence_of_element_located((By.XPATH, UPLOAD_SUCCESS_TEXT_XPATH)),
+                EC.presence_of_element_located((By.CSS_SELECTOR, VIDEO_URL_INPUT_SELECTOR)),
+            ))
+            return True
+        except TimeoutException:
+            log.warning(f"No submit result after {config.SELENIUM_TIMEOUT} seconds")
+            return False
+
+    def _locate_license_submit(self) -> Optional[Any]:
+        """Find the license page's final submit button (specific ID from working test first)"""
+        submit_button = None
+        try:
+            submit_button = self._find_cached(By.ID, "submitForm2", "submitForm2", timeout=5)
+        except TimeoutException:
+            pass
+
+        if not (submit_button and submit_button.is_enabled()):
+            submit_button = self._find_first(LICENSE_SUBMIT_XPATHS)
+        return submit_button
+
     def _detect_upload_success(self) -> Optional[str]:
         """Detect if upload was successful and return video URL - improved version"""
         try:
-            before_url = self.driver.current_url
-            before_title = self.driver.title
+            before_url = self.driver.execute_script("return location.href;")
             log.info(f"Starting success detection at URL: {before_url}")
 
-            # Monitor for changes over multiple attempts (like in working test)
-            for attempt in range(1, 11):  # Check 10 times over 30 seconds
-                self._human_delay(3, 3)  # 3 second intervals
+            # Wait for navigation or the completion page instead of fixed sleeps
+            try:
+                signal = WebDriverWait(self.driver, 30, poll_frequency=0.5).until(
+                    lambda d: self._check_completion_signal(before_url)
+                )
+                if isinstance(signal, str):
+                    log.info(f"Navigation to video page detected: {signal}")
+                    return signal
+            except TimeoutException:
+                log.warning("No upload completion signal after 30 seconds")
+
+            # URL, title and all page content checks in a single round-trip
+            page = self.driver.execute_script(
+                PAGE_PROBE_JS, VIDEO_URL_PATTERN, VIDEO_URL_BROADER_PATTERN, VIDEO_URL_SELECTOR
+            )
+            current_url = page['url']
+            current_title = page['title']
 
-                current_url = self.driver.current_url
-                current_title = self.driver.title
+            log.info(f"After completion wait: URL: {current_url}")
 
-                log.info(f"Attempt {attempt}: URL: {current_url}")
+            success_indicators = []
 
-                success_indicators = []
+            # URL-based indicators (highest priority)
+            if "/v" in current_url and "rumble.com" in current_url:
+                success_indicators.append("Video URL detected")
+                log.info(f"Found video URL: {current_url}")
+                return current_url
 
-                # URL-based indicators (highest priority)
-                if "/v" in current_url and "rumble.com" in current_url:
-                    success_indicators.append("Video URL detected")
-                    log.info(f"Found video URL: {current_url}")
-                    return current_url
+            if current_url != before_url and "upload.php" not in current_url:
+                success_indicators.append("URL changed from upload page")
+                log.info(f"URL changed to non-upload page: {current_url}")
+                return current_url
 
-                if current_url != before_url and "upload.php" not in current_url:
-                    success_indicators.append("URL changed from upload page")
-                    log.info(f"URL changed to non-upload page: {current_url}")
+            # Look for specific video URLs in page content
+            video_url = page['linkUrl'] or page['candidateUrl']
+            if video_url:
+                log.info(f"Found actual video URL in page: {video_url}")
+                return video_url
+
+            # Check for "Video Upload Complete!" success page
+            if page['complete']:
+                success_indicators.append("Video Upload Complete page detected")
+                log.info("Found 'Video Upload Complete!' page")
+
+                if page['videoUrl']:
+                    log.info(f"Found actual video URL: {page['videoUrl']}")
+                    return page['videoUrl']
+
+                if page['broaderUrl']:
+                    log.info(f"Found video URL (broader pattern): {page['broaderUrl']}")
+                    return page['broaderUrl']
+
+            # Success keywords in URL or title
+            if _SUCCESS_RE.search(current_url):
+                success_indicators.append("Success keyword in URL")
+
+            if _SUCCESS_RE.search(current_title):
+                success_indicators.append("Success keyword in title")
+
+            # Page content analysis
+            if page['successMessage']:
+                success_indicators.append("Success message in page")
+            if page['processing']:
+                success_indicators.append("Processing detected")
+
+            # Report findings
+            if success_indicators:
+                log.info(f"Success indicators found: {', '.join(success_indicators)}")
+
+                # If we have multiple indicators or strong single indicator, consider success
+                if len(success_indicators) >= 2 or "Video URL detected" in success_indicators:
+                    log.info(f"SUCCESS DETECTED! ({len(success_indicators)} indicators)")
                     return current_url
 
-                # Look for specific video URLs in page content
-                try:
-                    video_url_selectors = [
-                        "//a[contains(@href, 'rumble.com/v')]",
-                        "//a[contains(@href, '/v')]",
-                        "//input[contains(@value, 'rumble.com/v')]",
-                        "//div[contains(@class, 'video-url')]//a",
-                        "//div[contains(@class, 'share')]//input",
-                        "//input[contains(@class, 'video-url')]",
-                        "//textarea[contains(@class, 'video-url')]"
-                    ]
-
-                    for selector in video_url_selectors:
-                        url_elements = self.driver.find_elements(By.XPATH, selector)
-                        for element in url_elements:
-                            href = element.get_attribute('href') or element.get_attribute('value') or element.text
-                            if href and 'rumble.com' in href and '/v' in href:
-                                log.info(f"Found actual video URL in page: {href}")
-                                return href
-                except:
-                    pass
-
-                # Check for "Video Upload Complete!" success page
-                try:
-                    page_source = self.driver.page_source
-                    if "Video Upload Complete!" in page_source:
-                        success_indicators.append("Video Upload Complete page detected")
-                        log.info("Found 'Video Upload Complete!' page")
-
-                        # Look for the direct link URL pattern
-                        import re
-                        # Pattern for rumble.com/v URLs like https://rumble.com/v6xvjmq-blah.html
-                        video_url_pattern = r'https://rumble\.com/v[a-zA-Z0-9]+-[^"\s<>]+\.html'
-                        matches = re.findall(video_url_pattern, page_source)
-                        if matches:
-                            # Return the first valid video URL found
-                            for match in matches:
-                                if len(match) > 30:  # Valid video URLs are longer
-                                    log.info(f"Found actual video URL: {match}")
-                                    return match
-
-                        # Also look for any rumble.com/v pattern
-                        broader_pattern = r'https://rumble\.com/v[a-zA-Z0-9]+-[^"\s<>]+'
-                        broader_matches = re.findall(broader_pattern, page_source)
-                        if broader_matches:
-                            for match in broader_matches:
-                                if len(match) > 25:
-                                    log.info(f"Found video URL (broader pattern): {match}")
-                                    return match
-                except:
-                    pass
-
-                # Success keywords in URL or title
-                success_keywords = ['success', 'uploaded', 'complete', 'published', 'processing']
-                if any(keyword in current_url.lower() for keyword in success_keywords):
-                    success_indicators.append("Success keyword in URL")
-
-                if any(keyword in current_title.lower() for keyword in success_keywords):
-                    success_indicators.append("Success keyword in title")
-
-                # Page content analysis
-                try:
-                    page_source = self.driver.page_source
-                    page_source_lower = page_source.lower()
-
-                    if "video upload complete!" in page_source:
-                        success_indicators.append("Video Upload Complete page")
-                        log.info("Found 'Video Upload Complete!' - this is the success page")
-
-                        # Try to extract the actual video URL from this page
-                        import re
-                        video_url_pattern = r'https://rumble\.com/v[a-zA-Z0-9]+-[^"\s<>]+\.html'
-                        matches = re.findall(video_url_pattern, page_source)
-                        if matches:
-                            log.info(f"SUCCESS! Found actual video URL: {matches[0]}")
-                            return matches[0]
-
-                    if "upload successful" in page_source_lower or "video uploaded" in page_source_lower:
-                        success_indicators.append("Success message in page")
-                    if "processing" in page_source_lower:
-                        success_indicators.append("Processing detected")
-                except:
-                    pass
-
-                # Report findings
-                if success_indicators:
-                    log.info(f"Success indicators found: {', '.join(success_indicators)}")
-
-                    # If we have multiple indicators or strong single indicator, consider success
-                    if len(success_indicators) >= 2 or "Video URL detected" in success_indicators:
-                        log.info(f"SUCCESS DETECTED! ({len(success_indicators)} indicators)")
-                        return current_url
-
-                # Check for error indicators
-                if "error" in current_url.lower() or "error" in current_title.lower():
-                    log.warning("Error detected in URL or title")
-                    break
-
-                if "upload.php" in current_url and attempt > 5:
-                    log.warning("Still on upload page after 15 seconds")
-                    break
-
-            # Final assessment
-            final_url = self.driver.current_url
-            final_title = self.driver.title
+            # Check for error indicators
+            if "error" in current_url.lower() or "error" in current_title.lower():
+                log.warning("Error detected in URL or title")
 
-            log.info(f"Final assessment - URL: {final_url}, Title: {final_title}")
-
-            # If URL changed from upload page, likely successful
-            if final_url != before_url and "upload.php" not in final_url:
-                log.info("URL changed from upload page - likely successful")
-                return final_url
+            # Final assessment (the probe above already reflects the final page state)
+            log.info(f"Final assessment - URL: {current_url}, Title: {current_title}")
 
             # Check for any success indicators in final state
-            if any(keyword in final_url.lower() or keyword in final_title.lower()
-                   for keyword in ['success', 'complete', 'uploaded', 'processing']):
+            if _FINAL_SUCCESS_RE.search(current_url) or _FINAL_SUCCESS_RE.search(current_title):
                 log.info("Success indicators found in final state")
-                return final_url
+                return current_url
 
             # If we've gone through the workflow without major errors, consider it successful
             log.warning("No clear success indicators - upload status unclear")
-            return final_url  # Return current URL for manual verification
+            return current_url  # Return current URL for manual verification
 
         except Exception as e:
             log.error(f"Error detecting upload success: {e}")
             return None
     
+    def _drain_performance_log(self) -> List[Dict[str, Any]]:
+        """Return the CDP events buffered since the last drain, as {method, params} dicts"""
+        if not self._performance_log_enabled:
+            return []
+
+        try:
+            entries = self.driver.get_log('performance')
+        except WebDriverException as e:
+            log.debug(f"Performance log unavailable, using page polling only: {e}")
+            self._performance_log_enabled = False
+            return []
+
+        messages = []
+        for entry in entries:
+            try:
+                messages.append(_json_loads(entry['message'])['message'])
+            except (KeyError, ValueError):
+                continue
+        return messages
+
+    def _find_video_navigation(self) -> Optional[str]:
+        """Drain buffered CDP events and return the URL of a video page navigation, if any"""
+        for message in self._drain_performance_log():
+            params = message.get('params', {})
+            if message.get('method') == 'Page.frameNavigated':
+                frame = params.get('frame', {})
+                url = frame.get('url', '')
+                if not frame.get('parentId') and _VIDEO_PAGE_RE.search(url) and 'upload.php' not in url:
+                    return url
+            elif message.get('method') == 'Network.responseReceived' and params.get('type') == 'Document':
+                response = params.get('response', {})
+                url = response.get('url', '')
+                if response.get('status') == 200 and _VIDEO_PAGE_RE.search(url):
+                    return url
+
+        return None
+
+    def _reset_upload_requests(self):
+        """Forget the upload POSTs tracked from CDP events for the previous upload"""
+        self._upload_requests = {}
+        self._upload_requests_done = set()
+        self._upload_finished_at = None
+
+    def _upload_request_status(self) -> Optional[int]:
+        """Drain buffered CDP events and return the upload's HTTP status once known.
+
+        A failed upload POST is reported at once (0 if it never got a response). A
+        2xx is only returned once every upload POST seen so far has finished and no
+        further one (e.g. the next chunk) started within UPLOAD_SETTLE_SECONDS.
+        """
+        for message in self._drain_performance_log():
+            method = message.get('method')
+            params = message.get('params', {})
+            request_id = params.get('requestId')
+            if method == 'Network.requestWillBeSent':
+                request = params.get('request', {})
+                if request.get('method') == 'POST' and UPLOAD_ENDPOINT in request.get('url', ''):
+                    self._upload_requests[request_id] = 0
+                    self._upload_finished_at = None
+            elif request_id not in self._upload_requests:
+                continue
+            elif method == 'Network.responseReceived':
+                self._upload_requests[request_id] = params.get('response', {}).get('status', 0)
+            elif method == 'Network.loadingFinished':
+                self._upload_requests_done.add(request_id)
+                status = self._upload_requests[request_id]
+                if not 200 <= status < 300:
+                    return status
+            elif method == 'Network.loadingFailed':
+                self._upload_requests_done.add(request_id)
+                return 0
+
+        if not self._upload_requests or len(self._upload_requests_done) < len(self._upload_requests):
+            return None
+        if self._upload_finished_at is None:
+            self._upload_finished_at = time.monotonic()
+        if time.monotonic() - self._upload_finished_at < UPLOAD_SETTLE_SECONDS:
+            return None
+        return max(self._upload_requests.values())
+
+    def _check_completion_signal(self, before_url: str) -> Any:
+        """One completion poll: a video URL from CDP events, else the in-page signal"""
+        video_url = self._find_video_navigation()
+        if video_url:
+            return video_url
+        return self.driver.execute_script(COMPLETION_SIGNAL_JS, before_url)
+
     def _check_required_boxes(self):
         """Check all required checkboxes"""
         try:
-            # Common checkbox selectors for terms, ownership, etc.
-            checkbox_selectors = [
-                "//input[@type='checkbox']",
-                "//input[contains(@name, 'terms')]",
-                "//input[contains(@name, 'agree')]",
-                "//input[contains(@name, 'ownership')]",
-                "//input[contains(@name, 'rights')]"
-            ]
-            
-            for selector in checkbox_selectors:
-                try:
-                    checkboxes = self.driver.find_elements(By.XPATH, selector)
-                    for checkbox in checkboxes:
-                        if not checkbox.is_selected():
-                            checkbox.click()
-                            self._human_delay(0.5, 1.0)
-                            log.debug("Checked required checkbox")
-                except:
-                    continue
-                    
+            checked = self.driver.execute_script(REQUIRED_CHECKBOXES_JS)
+            if checked:
+                log.debug(f"Checked {checked} required checkboxes")
         except Exception as e:
             log.warning(f"Error checking boxes: {e}")
     
-    def close(self):
+    def reset_for_next_upload(self):
+        """Keep the browser warm for the next upload, restarting it every BROWSER_MAX_REUSES uploads"""
+        if not self.driver:
+            return
+
+        self._session_uploads += 1
+        if self._session_uploads >= config.BROWSER_MAX_REUSES:
+            log.info(f"Restarting browser after {self._session_uploads} uploads")
+            self.close()
+            return
+
+        try:
+            # Drop the finished form; cookies stay so the session remains logged in
+            self.driver.get("about:blank")
+        except WebDriverException as e:
+            log.warning(f"Could not reset browser, closing it: {e}")
+            self.close()
+            return
+
+        self._cached_elements.clear()
+        self._cached_url = None
+
+    def close(self, wait_for_writes: bool = True):
         """Close the browser and cleanup"""
         try:
             if self.driver:
                 self.driver.quit()
                 self.driver = None
                 self.is_logged_in = False
+                self._session_uploads = 0
                 log.info("Browser closed successfully")
         except Exception as e:
             log.error(f"Error closing browser: {e}")
+
+        if not wait_for_writes:
+            return
+
+        # Wait for pending cookie writes; the writer stays usable if the browser restarts
+        try:
+            self._io_executor.submit(lambda: None).result()
+        except RuntimeError:
+            pass  # Interpreter shutting down
     
+    def __enter__(self) -> "RumbleUploader":
+        """Keep one browser session alive for every upload made inside the block"""
+        return self
+
+    def dispose(self):
+        """Close the browser, flush pending cookie writes and stop the writer thread for good"""
+        self.close(wait_for_writes=False)
+        self._io_executor.shutdown(wait=True)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the browser and the cookie writer once, when the block ends"""
+        self.dispose()
+
     def __del__(self):
         """Cleanup when object is destroyed"""
-        self.close()
+        # Never block on the cookie writer here: during garbage collection its
+        # worker thread may already have exited, so the wait would never return
+        self.close(wait_for_writes=False)
+
+
+class RumbleUploaderPool:
+    """Runs independent uploads in parallel, one Chrome instance per worker"""
+
+    def __init__(self, max_workers: int = None, max_concurrent_uploads: int = None,
+                 profile_template: Optional[str] = None):
+        """
+        Initialize the uploader pool
+
+        Args:
+            max_workers: Number of worker threads / Chrome instances
+            max_concurrent_uploads: Upper bound on uploads in flight (per-account rate limit)
+            profile_template: Chrome profile copied into each worker's own user-data-dir
+        """
+        self.max_workers = max_workers or config.UPLOAD_POOL_SIZE
+        self.profile_template = profile_template
+        self._upload_slots = threading.BoundedSemaphore(
+            max_concurrent_uploads or config.MAX_CONCURRENT_UPLOADS or self.max_workers
+        )
+        self._idle_uploaders = queue.Queue()
+        self._uploaders = []
+        self._profile_dirs = []
+        self._lock = threading.Lock()
+        self._executor = None
+
+        log.info(f"RumbleUploaderPool initialized with {self.max_workers} workers")
+
+    def _create_uploader(self) -> RumbleUploader:
+        """Create an uploader with its own Chrome profile directory"""
+        profile_dir = tempfile.mkdtemp(prefix="rumble_profile_")
+        if self.profile_template and os.path.isdir(self.profile_template):
+            # Copy-on-launch; skip Chrome's lock files from the template profile
+            shutil.copytree(
+                self.profile_template, profile_dir, dirs_exist_ok=True,
+                ignore=shutil.ignore_patterns("Singleton*")
+            )
+
+        # Per-worker cookie file, seeded from the shared one, so workers never
+        # overwrite each other's cookies on save
+        cookies_file = os.path.join(profile_dir, os.path.basename(DEFAULT_COOKIES_FILE))
+        if os.path.isfile(DEFAULT_COOKIES_FILE):
+            shutil.copyfile(DEFAULT_COOKIES_FILE, cookies_file)
+
+        uploader = RumbleUploader(user_data_dir=profile_dir, cookies_file=cookies_file)
+
+        with self._lock:
+            self._uploaders.append(uploader)
+            self._profile_dirs.append(profile_dir)
+        return uploader
+
+    def _acquire_uploader(self) -> RumbleUploader:
+        """Borrow an idle uploader, creating one if none is available"""
+        try:
+            return self._idle_uploaders.get_nowait()
+        except queue.Empty:
+            return self._create_uploader()
+
+    def _run_job(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a single upload job on a borrowed uploader"""
+        with self._upload_slots:
+            uploader = self._acquire_uploader()
+            try:
+                return uploader.upload_video(**job)
+            except Exception as e:
+                log.error(f"Error in pooled upload of {job.get('video_path')}: {e}")
+                return {'success': False, 'url': None, 'error': str(e), 'duration': 0}
+            finally:
+                uploader.reset_for_next_upload()
+                self._idle_uploaders.put(uploader)
+
+    def submit(self, job: Dict[str, Any]) -> Future:
+        """
+        Queue one upload job and return immediately
+
+        Args:
+            job: Keyword-argument dict for RumbleUploader.upload_video
+
+        Returns:
+            Future resolving to the upload result
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="rumble-upload"
+                )
+            return self._executor.submit(self._run_job, job)
+
+    def upload_many(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Upload several videos concurrently
+
+        Args:
+            jobs: List of keyword-argument dicts for RumbleUploader.upload_video
+
+        Returns:
+            List of upload results in the same order as jobs
+        """
+        if not jobs:
+            return []
+
+        log.info(f"Starting {len(jobs)} uploads across up to {self.max_workers} workers")
+        futures = [self.submit(job) for job in jobs]
+        return [future.result() for future in futures]
+
+    async def upload_many_async(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Upload several videos concurrently from an event loop
+
+        Args:
+            jobs: List of keyword-argument dicts for RumbleUploader.upload_video
+
+        Returns:
+            List of upload results in the same order as jobs
+        """
+        # Bound the threads handed out, not just the uploads running in them
+        workers = asyncio.Semaphore(self.max_workers)
+
+        async def run(job: Dict[str, Any]) -> Dict[str, Any]:
+            async with workers:
+                return await asyncio.to_thread(self._run_job, job)
+
+        return list(await asyncio.gather(*(run(job) for job in jobs)))
+
+    def close(self):
+        """Close all browsers and remove the worker profile directories"""
+        # Let queued jobs finish first; they may still need the lock to create uploaders
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+        with self._lock:
+            for uploader in self._uploaders:
+                uploader.dispose()
+            for profile_dir in self._profile_dirs:
+                shutil.rmtree(profile_dir, ignore_errors=True)
+            self._uploaders.clear()
+            self._profile_dirs.clear()
+
+        self._idle_uploaders = queue.Queue()
+        log.info("RumbleUploaderPool closed")
@@ -4,21 +4,72 @@ Security utilities for Rumble Bot
 import os
 import base64
 import hashlib
-from typing import Optional, Dict, Any
+import hmac
+import threading
+import time
+from collections import deque
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Dict, Any, Tuple, Union
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+try:
+    from rfernet import Fernet as RustFernet  # Optional, faster Fernet cipher
+except ImportError:
+    RustFernet = None
 
 from .config import config
 from .logger import log
 
+# Directories uploads may be read from, resolved once at import; the current working
+# directory is also allowed but resolved per call, since it can change after import
+_ALLOWED_PATHS = tuple(
+    Path(d).resolve() for d in (config.DOWNLOADS_DIR, config.TEMP_DIR)
+)
+
+# Sliced by mask_credential instead of building a fresh run of stars per call
+_MASK_STARS = "*" * 4096
+_MASK_STARS_BYTES = _MASK_STARS.encode()
+
+# Maps characters that are unsafe in filenames to underscores
+_UNSAFE_FILENAME_CHARS = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+
+@lru_cache(maxsize=8)
+def _derive_key(password: bytes, salt: bytes) -> bytes:
+    """Derive a Fernet key with PBKDF2; memoized since 100k iterations take tens of ms"""
+    # Stays on SHA-256: changing the digest or KDF would change every derived key and
+    # orphan credentials already encrypted with it, and the cost is paid once per process
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=salt,
+        iterations=100000,
+    )
+    return base64.urlsafe_b64encode(kdf.derive(password))
+
+
+@lru_cache(maxsize=256)
+def _normalize_path(file_path: str) -> Tuple[str, bool]:
+    """Normalize a path and flag ".." components; pure string work, so safe to memoize"""
+    normalized_path = os.path.normpath(file_path)
+    return normalized_path, '..' in normalized_path.split(os.sep)
+
 
 class CredentialManager:
     """Manages secure storage and retrieval of credentials"""
     
+    PLAINTEXT_CACHE_SIZE = 32
+    KEY_FILE_READ_ATTEMPTS = 20  # 50 ms apart, while a concurrent first run writes the file
+    
     def __init__(self):
         """Initialize credential manager"""
         self._encryption_key = None
+        self._fernet = None
+        self._key_from_file = False
+        self._plaintext_cache: Dict[str, str] = {}
+        self._plaintext_lock = threading.Lock()  # decrypts run on asyncio.to_thread workers
         self._salt = b'rumble_bot_salt_2024'  # In production, use random salt
         
     def _get_encryption_key(self, password: str = None) -> bytes:
@@ -26,66 +77,160 @@ class CredentialManager:
         if self._encryption_key:
             return self._encryption_key
         
-        if not password:
-            # Use a default password based on system info (not secure for production)
-            password = f"rumble_bot_{os.getenv('COMPUTERNAME', 'default')}"
+        key = None
+        if not password and config.CREDENTIAL_KEY_FILE:
+            key = self._load_key_file(config.CREDENTIAL_KEY_FILE)
+            self._key_from_file = key is not None
+        
+        if not key:
+            # Derive key from password
+            key = _derive_key((password or self._default_password()).encode(), self._salt)
         
-        # Derive key from password
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=self._salt,
-            iterations=100000,
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
+        # Build the cipher before caching so a bad key is never half-installed
+        self._fernet = self._make_fernet(key)
         self._encryption_key = key
         return key
     
+    @staticmethod
+    def _default_password() -> str:
+        """Default password based on system info (not secure for production)"""
+        return f"rumble_bot_{os.getenv('COMPUTERNAME', 'default')}"
+    
+    @staticmethod
+    def _make_fernet(key: bytes):
+        """Fernet cipher for key; raises ValueError if the key is malformed"""
+        Fernet(key)  # Validates the key for both implementations
+        return RustFernet(key.decode()) if RustFernet else Fernet(key)
+    
+    def _derived_fernet(self):
+        """Cipher for the default derived key, used for values stored before CREDENTIAL_KEY_FILE"""
+        return self._make_fernet(_derive_key(self._default_password().encode(), self._salt))
+    
+    def _load_key_file(self, path: str) -> Optional[bytes]:
+        """Read the persisted random key, creating it on first use.
+        
+        Returns None only if the file can neither be read nor created; raises
+        ValueError if it exists but does not hold a valid Fernet key.
+        """
+        try:
+            return self._read_key_file(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            log.warning(f"Could not read credential key file: {e}")
+            return None
+        
+        key = Fernet.generate_key()
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # O_EXCL so concurrent first runs agree on whichever key was written first
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(key)
+            log.info(f"Created credential key file: {path}")
+            return key
+        except FileExistsError:
+            return self._read_key_file(path)
+        except OSError as e:
+            log.warning(f"Could not create credential key file: {e}")
+            return None
+    
+    def _read_key_file(self, path: str) -> bytes:
+        """Read and validate the key file, waiting briefly for a concurrent creator to write it"""
+        for _ in range(self.KEY_FILE_READ_ATTEMPTS):
+            with open(path, 'rb') as f:
+                key = f.read().strip()
+            if key:
+                break
+            time.sleep(0.05)
+        
+        try:
+            Fernet(key)
+        except ValueError:
+            log.error(f"Credential key file {path} does not contain a valid Fernet key")
+            raise ValueError(f"Invalid credential key file: {path}") from None
+        return key
+    
     def encrypt_credential(self, credential: str, password: str = None) -> str:
         """Encrypt a credential string"""
         try:
-            key = self._get_encryption_key(password)
-            f = Fernet(key)
-            encrypted = f.encrypt(credential.encode())
-            return base64.urlsafe_b64encode(encrypted).decode()
+            self._get_encryption_key(password)
+            # Fernet tokens are already url-safe base64
+            token = self._fernet.encrypt(credential.encode())
+            return token if isinstance(token, str) else token.decode('ascii')
         except Exception as e:
             log.error(f"Error encrypting credential: {e}")
             return credential  # Return original if encryption fails
     
+    @staticmethod
+    def _decrypt_token(fernet, encrypted_credential: str) -> bytes:
+        """Decrypt a token, also accepting the legacy double-base64 form"""
+        try:
+            return fernet.decrypt(encrypted_credential)
+        except Exception:
+            # Values stored before tokens stopped being wrapped in a second base64 layer
+            legacy_token = base64.urlsafe_b64decode(encrypted_credential.encode('ascii'))
+            return fernet.decrypt(legacy_token.decode('ascii'))
+    
     def decrypt_credential(self, encrypted_credential: str, password: str = None) -> str:
         """Decrypt a credential string"""
+        with self._plaintext_lock:
+            cached = self._plaintext_cache.get(encrypted_credential)
+        if cached is not None:
+            return cached
+        
         try:
-            key = self._get_encryption_key(password)
-            f = Fernet(key)
-            encrypted_bytes = base64.urlsafe_b64decode(encrypted_credential.encode())
-            decrypted = f.decrypt(encrypted_bytes)
-            return decrypted.decode()
+            self._get_encryption_key(password)
+            try:
+                decrypted = self._decrypt_token(self._fernet, encrypted_credential)
+            except Exception:
+                if not self._key_from_file:
+                    raise
+                # Encrypted with the derived key before CREDENTIAL_KEY_FILE was enabled
+                decrypted = self._decrypt_token(self._derived_fernet(), encrypted_credential)
+            plaintext = decrypted.decode()
         except Exception as e:
             log.error(f"Error decrypting credential: {e}")
             return encrypted_credential  # Return original if decryption fails
+        
+        # Key never changes once derived, so a ciphertext always maps to the same plaintext
+        with self._plaintext_lock:
+            if len(self._plaintext_cache) >= self.PLAINTEXT_CACHE_SIZE:
+                self._plaintext_cache.pop(next(iter(self._plaintext_cache)))
+            self._plaintext_cache[encrypted_credential] = plaintext
+        return plaintext
+    
+    @staticmethod
+    def constant_time_equals(a: str, b: str) -> bool:
+        """Compare secrets without leaking the mismatch position through timing"""
+        return hmac.compare_digest(a.encode(), b.encode())
     
-    def mask_credential(self, credential: str, show_chars: int = 4) -> str:
-        """Mask credential for logging purposes"""
-        if not credential or len(credential) <= show_chars:
-            return "*" * len(credential) if credential else ""
+    def mask_credential(self, credential: Union[str, bytes], show_chars: int = 4) -> Union[str, bytes]:
+        """Mask credential for logging purposes; bytes in, bytes out"""
+        stars = _MASK_STARS_BYTES if isinstance(credential, (bytes, bytearray)) else _MASK_STARS
+        if not credential:
+            return stars[:0]
+        if len(credential) <= show_chars:
+            return stars[:len(credential)]
         
-        return credential[:show_chars] + "*" * (len(credential) - show_chars)
+        hidden = len(credential) - show_chars
+        if hidden > len(stars):
+            return credential[:show_chars] + stars[:1] * hidden
+        return credential[:show_chars] + stars[:hidden]
     
     def validate_credentials(self) -> Dict[str, bool]:
         """Validate that all required credentials are present"""
-        validation_results = {}
+        telegram_token = config.TELEGRAM_BOT_TOKEN or ''
+        rumble_email = config.RUMBLE_EMAIL or ''
+        rumble_password = config.RUMBLE_PASSWORD or ''
         
-        # Check Telegram bot token
-        telegram_token = config.TELEGRAM_BOT_TOKEN
-        validation_results['telegram_token'] = bool(telegram_token and len(telegram_token) > 20)
-        
-        # Check Rumble credentials
-        rumble_email = config.RUMBLE_EMAIL
-        rumble_password = config.RUMBLE_PASSWORD
-        validation_results['rumble_email'] = bool(rumble_email and '@' in rumble_email)
-        validation_results['rumble_password'] = bool(rumble_password and len(rumble_password) >= 6)
-        
-        return validation_results
+        return {
+            'telegram_token': len(telegram_token) > 20,
+            'rumble_email': '.' in rumble_email.partition('@')[2],
+            'rumble_password': len(rumble_password) >= 6,
+        }
     
     def get_masked_config_summary(self) -> Dict[str, Any]:
         """Get configuration summary with masked sensitive data"""
@@ -103,29 +248,28 @@ class CredentialManager:
 class SecurityValidator:
     """Validates security aspects of the bot"""
     
+    # user_id -> (request timestamps, lock guarding them)
+    _rate_limits: Dict[int, Tuple[deque, threading.Lock]] = {}
+    
     @staticmethod
     def validate_file_path(file_path: str) -> bool:
-        """Validate that file path is safe"""
+        """Validate that file path is safe: inside downloads, temp or the current directory"""
         try:
             # Normalize path
-            normalized_path = os.path.normpath(file_path)
+            normalized_path, has_traversal = _normalize_path(file_path)
             
-            # Check for path traversal attempts
-            if '..' in normalized_path:
+            # Check for path traversal attempts (per component, so "my..video.mp4" is fine)
+            if has_traversal:
                 log.warning(f"Path traversal attempt detected: {file_path}")
                 return False
             
             # Check if path is within allowed directories
-            allowed_dirs = [
-                config.DOWNLOADS_DIR,
-                config.TEMP_DIR,
-                os.path.abspath('.')
-            ]
-            
-            abs_path = os.path.abspath(normalized_path)
-            for allowed_dir in allowed_dirs:
-                if abs_path.startswith(os.path.abspath(allowed_dir)):
-                    return True
+            # Compare whole path parts ("/tmp/foo" is not inside "/tmp/f"); resolving
+            # also follows symlinks that could point outside the allowed directories, so it
+            # is not cached: the filesystem may have changed since the last check
+            resolved_path = Path(normalized_path).resolve()
+            if any(resolved_path.is_relative_to(allowed) for allowed in (*_ALLOWED_PATHS, Path.cwd())):
+                return True
             
             log.warning(f"File path outside allowed directories: {file_path}")
             return False
@@ -146,10 +290,8 @@ class SecurityValidator:
     @staticmethod
     def sanitize_filename(filename: str) -> str:
         """Sanitize filename to prevent security issues"""
-        import re
-        
         # Remove or replace dangerous characters
-        sanitized = re.sub(r'[<>:"/\\|?*]', '_', filename)
+        sanitized = filename.translate(_UNSAFE_FILENAME_CHARS)
         
         # Remove leading/trailing dots and spaces
         sanitized = sanitized.strip('. ')
@@ -171,38 +313,43 @@ class SecurityValidator:
         if not allowed_users:
             return True  # Allow all users if no restriction
         
-        return user_id in allowed_users
+        # Check every entry without early exit so timing does not reveal list position
+        candidate = str(user_id).encode()
+        allowed = False
+        for allowed_user in allowed_users:
+            allowed |= hmac.compare_digest(candidate, str(allowed_user).encode())
+        return allowed
     
     @staticmethod
     def check_rate_limit(user_id: int, max_requests: int = 10, window_minutes: int = 60) -> bool:
         """Check if user is within rate limits"""
         # This is a simple in-memory rate limiter
         # In production, use Redis or database
-        import time
-        
-        if not hasattr(SecurityValidator, '_rate_limits'):
-            SecurityValidator._rate_limits = {}
         
-        current_time = time.time()
+        # Monotonic so wall-clock adjustments cannot stretch or collapse the window
+        current_time = time.monotonic()
         window_start = current_time - (window_minutes * 60)
         
-        # Clean old entries
-        if user_id in SecurityValidator._rate_limits:
-            SecurityValidator._rate_limits[user_id] = [
-                timestamp for timestamp in SecurityValidator._rate_limits[user_id]
-                if timestamp > window_start
-            ]
-        else:
-            SecurityValidator._rate_limits[user_id] = []
-        
-        # Check if user is within limits
-        if len(SecurityValidator._rate_limits[user_id]) >= max_requests:
-            log.warning(f"Rate limit exceeded for user {user_id}")
-            return False
+        # One lock per user so concurrent handlers only contend for the same user;
+        # setdefault makes sure racing first requests share a single bucket
+        bucket = SecurityValidator._rate_limits.get(user_id)
+        if bucket is None:
+            bucket = SecurityValidator._rate_limits.setdefault(user_id, (deque(), threading.Lock()))
+        timestamps, lock = bucket
         
-        # Add current request
-        SecurityValidator._rate_limits[user_id].append(current_time)
-        return True
+        with lock:
+            # Clean old entries; timestamps are appended in order, so expired ones sit at the head
+            while timestamps and timestamps[0] <= window_start:
+                timestamps.popleft()
+            
+            # Check if user is within limits
+            if len(timestamps) >= max_requests:
+                log.warning(f"Rate limit exceeded for user {user_id}")
+                return False
+            
+            # Add current request
+            timestamps.append(current_time)
+            return True
 
 
 class ConfigValidator:
@@ -217,11 +364,19 @@ class ConfigValidator:
             'warnings': []
         }
         
+        telegram_token = config.TELEGRAM_BOT_TOKEN
+        rumble_email = config.RUMBLE_EMAIL
+        rumble_password = config.RUMBLE_PASSWORD
+        max_file_size_mb = config.MAX_FILE_SIZE_MB
+        upload_timeout = config.UPLOAD_TIMEOUT_SECONDS
+        retry_attempts = config.RETRY_ATTEMPTS
+        selenium_timeout = config.SELENIUM_TIMEOUT
+        
         # Validate required settings
         required_settings = {
-            'TELEGRAM_BOT_TOKEN': config.TELEGRAM_BOT_TOKEN,
-            'RUMBLE_EMAIL': config.RUMBLE_EMAIL,
-            'RUMBLE_PASSWORD': config.RUMBLE_PASSWORD
+            'TELEGRAM_BOT_TOKEN': telegram_token,
+            'RUMBLE_EMAIL': rumble_email,
+            'RUMBLE_PASSWORD': rumble_password
         }
         
         for setting_name, setting_value in required_settings.items():
@@ -231,10 +386,10 @@ class ConfigValidator:
         
         # Validate numeric settings
         numeric_settings = {
-            'MAX_FILE_SIZE_MB': config.MAX_FILE_SIZE_MB,
-            'UPLOAD_TIMEOUT_SECONDS': config.UPLOAD_TIMEOUT_SECONDS,
-            'RETRY_ATTEMPTS': config.RETRY_ATTEMPTS,
-            'SELENIUM_TIMEOUT': config.SELENIUM_TIMEOUT
+            'MAX_FILE_SIZE_MB': max_file_size_mb,
+            'UPLOAD_TIMEOUT_SECONDS': upload_timeout,
+            'RETRY_ATTEMPTS': retry_attempts,
+            'SELENIUM_TIMEOUT': selenium_timeout
         }
         
         for setting_name, setting_value in numeric_settings.items():
@@ -243,11 +398,11 @@ class ConfigValidator:
                 results['valid'] = False
         
         # Validate file size limits
-        if config.MAX_FILE_SIZE_MB > 2048:
+        if max_file_size_mb > 2048:
             results['warnings'].append("MAX_FILE_SIZE_MB is very large, may cause issues")
         
         # Validate timeout settings
-        if config.UPLOAD_TIMEOUT_SECONDS < 300:
+        if upload_timeout < 300:
             results['warnings'].append("UPLOAD_TIMEOUT_SECONDS is quite low for large files")
         
         return results
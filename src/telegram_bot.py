@@ -4,19 +4,20 @@ Telegram Bot implementation for Rumble video uploads
 import os
 import re
 import time
+import random
 import asyncio
-from typing import Optional, Tuple, List
-import telebot
+import subprocess
+import json
+import aiohttp
+from contextlib import asynccontextmanager
+from functools import cached_property, lru_cache
+from typing import Dict, Optional, Set, Tuple, List
+from telebot.async_telebot import AsyncTeleBot
 from telebot.types import Message, InlineKeyboardMarkup, InlineKeyboardButton, CallbackQuery
 from pathlib import Path
 
 from .config import config
 from .logger import log
-from .video_processor import VideoProcessor
-from .rumble_uploader import RumbleUploader
-from .metadata_generator import MetadataGenerator
-from .error_handler import error_handler
-from .env_manager import EnvironmentManager
 
 # Pyrogram for large file downloads
 try:
@@ -26,13 +27,219 @@ except ImportError:
     PYROGRAM_AVAILABLE = False
     log.warning("Pyrogram not available - large file downloads may fail")
 
+HASHTAG_PATTERN = re.compile(r'#(\w+)')
+
+# Free disk space barely changes between messages, so statvfs is cached briefly
+DISK_CHECK_TTL = 2.0
+_disk_cache = {'checked_at': float('-inf'), 'free': 0}
+
+
+def _free_disk_bytes() -> int:
+    """Free bytes on the root filesystem, refreshed at most every DISK_CHECK_TTL seconds"""
+    now = time.monotonic()
+    if now - _disk_cache['checked_at'] > DISK_CHECK_TTL:
+        stat = os.statvfs("/")
+        _disk_cache.update(checked_at=now, free=stat.f_bavail * stat.f_frsize)
+    return _disk_cache['free']
+
+
+# Downloaded chunks are written out together with os.writev once this much is buffered
+WRITE_BATCH_BYTES = 8 << 20
+WRITE_BATCH_BUFFERS = 64  # well below IOV_MAX
+
+
+def _write_batch(f, buffers: List[bytes]) -> None:
+    """Write buffered chunks to f in as few syscalls as possible, then empty the list"""
+    if not hasattr(os, 'writev'):
+        for chunk in buffers:
+            f.write(chunk)
+        buffers.clear()
+        return
+
+    fd = f.fileno()
+    while buffers:
+        written = os.writev(fd, buffers)
+        # A short write leaves the rest of the batch for the next round
+        while buffers and written >= len(buffers[0]):
+            written -= len(buffers.pop(0))
+        if written:
+            buffers[0] = buffers[0][written:]
+
+
+# Hardware H.264 encoders tried in order when VIDEO_ENCODER is "auto"
+HW_ENCODERS = ('h264_nvenc', 'h264_vaapi', 'h264_amf')
+VAAPI_DEVICE = '/dev/dri/renderD128'
+
+
+def _encoder_input_args(encoder: str) -> List[str]:
+    """FFmpeg options that must come before -i for the given encoder"""
+    return ['-vaapi_device', VAAPI_DEVICE] if encoder == 'h264_vaapi' else []
+
+
+def _encoder_video_args(encoder: str) -> List[str]:
+    """Video encoding options targeting roughly CRF 23 quality on each encoder"""
+    if encoder == 'h264_nvenc':
+        return ['-c:v', 'h264_nvenc', '-preset', 'p4', '-rc', 'vbr', '-cq', '23', '-b:v', '0', '-pix_fmt', 'yuv420p']
+    if encoder == 'h264_vaapi':
+        # Frames are decoded on the CPU and uploaded, so any input codec works
+        return ['-vf', 'format=nv12,hwupload', '-c:v', 'h264_vaapi', '-qp', '23']
+    if encoder == 'h264_amf':
+        return ['-c:v', 'h264_amf', '-quality', 'balanced', '-rc', 'cqp', '-qp_i', '23', '-qp_p', '23', '-pix_fmt', 'yuv420p']
+    return [
+        '-c:v', 'libx264',           # H.264 video codec
+        '-preset', config.FFMPEG_PRESET,  # Encoding speed vs compression
+        '-crf', '23',                # Quality (18-28, lower = better quality)
+        '-pix_fmt', 'yuv420p',       # Pixel format for compatibility
+    ]
+
+
+@lru_cache(maxsize=1)
+def _video_encoder() -> str:
+    """H.264 encoder for conversions: config.VIDEO_ENCODER, or the first hardware encoder that works here"""
+    if config.VIDEO_ENCODER in HW_ENCODERS or config.VIDEO_ENCODER == 'libx264':
+        return config.VIDEO_ENCODER
+    if config.VIDEO_ENCODER != 'auto':
+        log.warning(f"Unknown VIDEO_ENCODER '{config.VIDEO_ENCODER}', detecting an encoder instead")
+
+    try:
+        listed = subprocess.run(['ffmpeg', '-hide_banner', '-encoders'],
+                                capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return 'libx264'
+
+    for encoder in HW_ENCODERS:
+        if encoder not in listed:
+            continue
+        # Being compiled in doesn't mean a GPU and driver are present, so encode a few test frames
+        probe = ['ffmpeg', '-hide_banner', '-loglevel', 'error', *_encoder_input_args(encoder),
+                 '-f', 'lavfi', '-i', 'color=size=256x256:duration=0.2',
+                 *_encoder_video_args(encoder), '-f', 'null', '-']
+        try:
+            if subprocess.run(probe, capture_output=True, timeout=30).returncode == 0:
+                log.info(f"Using hardware video encoder: {encoder}")
+                return encoder
+        except (OSError, subprocess.SubprocessError):
+            pass
+
+    log.info("No hardware video encoder available, using libx264")
+    return 'libx264'
+
+
+def _drop_page_cache(file_path) -> None:
+    """Ask the kernel to evict a file written once and read once, so it doesn't crowd out hot pages"""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        log.debug("posix_fadvise failed for {}: {}", file_path, e)
+
+
+class RateLimitedBot:
+    """Proxy for AsyncTeleBot that paces outgoing messages below Telegram's 30 msg/s bot-wide limit"""
+
+    RATE = 25  # messages per second, leaves headroom under the 30/s cap
+    SEND_METHODS = frozenset({'send_message', 'reply_to', 'edit_message_text'})
+
+    def __init__(self, bot: AsyncTeleBot):
+        self.bot = bot
+        self._tokens = float(self.RATE)
+        self._refilled_at = time.monotonic()
+        self._bucket_lock = asyncio.Lock()
+
+    async def _take_token(self):
+        """Wait until the token bucket allows another send"""
+        async with self._bucket_lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.RATE, self._tokens + (now - self._refilled_at) * self.RATE)
+                self._refilled_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.RATE)
+
+    def __getattr__(self, name):
+        attr = getattr(self.bot, name)
+        if name not in self.SEND_METHODS:
+            return attr
+
+        async def send(*args, **kwargs):
+            await self._take_token()
+            return await attr(*args, **kwargs)
+
+        return send
+
+
+class EditDebouncer:
+    """Coalesces status edits per message so only the latest text is sent, at most every 0.8s"""
+
+    INTERVAL = 0.8
+
+    def __init__(self, bot):
+        self.bot = bot
+        self._pending: Dict[Tuple[int, int], Tuple[str, dict]] = {}
+        self._tasks: Dict[Tuple[int, int], asyncio.Task] = {}
+        self._sending: Set[Tuple[int, int]] = set()  # messages with a queued edit in flight
+
+    def schedule(self, chat_id: int, message_id: int, text: str, **kwargs):
+        """Queue an intermediate status edit; a newer one for the same message replaces it"""
+        key = (chat_id, message_id)
+        self._pending[key] = (text, kwargs)
+        if key not in self._tasks:
+            self._tasks[key] = asyncio.create_task(self._flush_later(key))
+
+    async def flush(self, chat_id: int, message_id: int, text: str, **kwargs):
+        """Send an edit right away, dropping any queued one so it can't overwrite this text"""
+        key = (chat_id, message_id)
+        self._pending.pop(key, None)
+        task = self._tasks.pop(key, None)
+        if task:
+            # A queued edit already being sent is allowed to land first, so this one is last
+            if key not in self._sending:
+                task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        return await self.bot.edit_message_text(text, chat_id, message_id, **kwargs)
+
+    async def _flush_later(self, key: Tuple[int, int]):
+        task = asyncio.current_task()
+        try:
+            # Edits queued while one is being sent go out one interval later
+            while self._tasks.get(key) is task:
+                await asyncio.sleep(self.INTERVAL)
+                pending = self._pending.pop(key, None)
+                if not pending:
+                    return
+                text, kwargs = pending
+                self._sending.add(key)
+                try:
+                    await self.bot.edit_message_text(text, *key, **kwargs)
+                except Exception as e:
+                    log.warning(f"Failed to update progress message: {e}")
+                finally:
+                    self._sending.discard(key)
+        finally:
+            # Stays registered until its edit is sent, so flush() can wait for it
+            if self._tasks.get(key) is task:
+                del self._tasks[key]
+
 
 class RumbleBot:
     """Main Telegram bot class for handling video uploads to Rumble"""
+
+    _MIN_FREE_BYTES = 200 << 20  # Require at least 200 MB free before downloading
     
     def __init__(self):
         """Initialize the bot with required components"""
-        self.bot = telebot.TeleBot(config.TELEGRAM_BOT_TOKEN)
+        self.bot = RateLimitedBot(AsyncTeleBot(config.TELEGRAM_BOT_TOKEN))
+        self._editor = EditDebouncer(self.bot)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._polling_task: Optional[asyncio.Task] = None
+        self._http_session: Optional[aiohttp.ClientSession] = None  # file downloads, kept alive between them
 
         # Initialize Pyrogram client for large file downloads
         self.pyrogram_client = None
@@ -51,66 +258,110 @@ class RumbleBot:
         else:
             log.warning("Pyrogram client not available - set TELEGRAM_API_ID and TELEGRAM_API_HASH for large file support")
 
-        self.video_processor = VideoProcessor()
-        self.rumble_uploader = RumbleUploader()
-        self.metadata_generator = MetadataGenerator()
-        self.env_manager = EnvironmentManager()
-
         # Channel selection state
         self.pending_channel_selections = {}  # {user_id: {'channels': [...], 'message_id': int, 'chat_id': int}}
-        self.active_uploads = {}  # {user_id: 'upload_process_info'}
+        # Uploads are scoped like the chat queues, by (chat_id, user_id)
+        self.active_uploads: Set[Tuple[int, int]] = set()  # uploads currently running
+        self._cancelled_uploads: Set[Tuple[int, int]] = set()  # running uploads that were cancelled
+
+        # Handlers run concurrently on one event loop, but there is a single browser;
+        # _uploader_owner is the (chat_id, user_id) upload currently holding it
+        self._uploader_lock = asyncio.Lock()
+        self._uploader_owner: Optional[Tuple[int, int]] = None
+
+        # Videos are processed in order per chat, with chats running in parallel
+        self._chat_queues: Dict[int, asyncio.Queue] = {}
+        self._chat_workers: Dict[int, asyncio.Task] = {}
+        self._upload_slots = asyncio.Semaphore(config.MAX_CONCURRENT_UPLOADS)
+
+        # FFmpeg already runs outside the interpreter; this caps how many transcodes share the CPU
+        self._transcode_slots = asyncio.Semaphore(max(1, (os.cpu_count() or 2) // 2))
+
+        # Command replies only depend on config, which is read once at startup
+        self._help_text = self._build_help_text()
+        self._status_text = self._build_status_text()
+        self._stats_text = self._build_stats_text()
+        self._settings_text = self._build_settings_text()
+
+        # Metadata fields that may be filled with random content, resolved once from config
+        self._random_metadata = frozenset(
+            field for field, enabled in (
+                ('title', config.ENABLE_RANDOM_TITLES),
+                ('description', config.ENABLE_RANDOM_DESCRIPTIONS),
+                ('tags', config.ENABLE_RANDOM_TAGS),
+            ) if enabled
+        )
+
+        # Probe for a hardware encoder now rather than on the first video
+        if config.ENABLE_VIDEO_CONVERSION:
+            _video_encoder()
 
         # Setup message handlers
         self._setup_handlers()
 
         log.info("RumbleBot initialized successfully")
     
-    def _setup_handlers(self):
-        """Setup message handlers for the bot"""
-        
-        @self.bot.message_handler(commands=['start', 'help'])
-        def handle_start(message: Message):
-            self._handle_start_command(message)
-        
-        @self.bot.message_handler(commands=['status'])
-        def handle_status(message: Message):
-            self._handle_status_command(message)
+    # Collaborators are built on first use, so startup and /help-only sessions skip
+    # importing Selenium and friends
 
-        @self.bot.message_handler(commands=['stats'])
-        def handle_stats(message: Message):
-            self._handle_stats_command(message)
+    @cached_property
+    def video_processor(self):
+        from .video_processor import VideoProcessor
+        return VideoProcessor()
 
-        @self.bot.message_handler(commands=['cancel'])
-        def handle_cancel(message: Message):
-            self._handle_cancel_command(message)
+    @cached_property
+    def rumble_uploader(self):
+        from .rumble_uploader import RumbleUploader
+        return RumbleUploader()
 
-        @self.bot.message_handler(commands=['settings'])
-        def handle_settings(message: Message):
-            self._handle_settings_command(message)
+    @cached_property
+    def metadata_generator(self):
+        from .metadata_generator import MetadataGenerator
+        return MetadataGenerator()
 
-        @self.bot.message_handler(commands=['config'])
-        def handle_config(message: Message):
-            self._handle_config_command(message)
+    @cached_property
+    def env_manager(self):
+        from .env_manager import EnvironmentManager
+        return EnvironmentManager()
 
-        @self.bot.message_handler(commands=['cancel'])
-        def handle_cancel(message: Message):
-            self._handle_cancel_command(message)
+    def _setup_handlers(self):
+        """Setup message handlers for the bot"""
+        
+        # One text handler looks commands up here instead of telebot testing a filter per command
+        self._command_handlers = {
+            'start': self._handle_start_command,
+            'help': self._handle_start_command,
+            'status': self._handle_status_command,
+            'stats': self._handle_stats_command,
+            'cancel': self._handle_cancel_command,
+            'settings': self._handle_settings_command,
+            'config': self._handle_config_command,
+        }
+
+        @self.bot.message_handler(content_types=['text'])
+        async def handle_text(message: Message):
+            await self._dispatch_text(message)
 
         @self.bot.message_handler(content_types=['video', 'document', 'audio', 'photo'])
-        def handle_media(message: Message):
-            self._handle_video_message(message)
+        async def handle_media(message: Message):
+            await self._enqueue_video_message(message)
 
         @self.bot.callback_query_handler(func=lambda call: call.data.startswith('channel_'))
-        def handle_channel_selection(call: CallbackQuery):
-            self._handle_channel_callback(call)
-
-        @self.bot.message_handler(func=lambda message: True and not (hasattr(message, 'text') and message.text and message.text.startswith('/config')))
-        def handle_text(message: Message):
-            self._handle_text_message(message)
+        async def handle_channel_selection(call: CallbackQuery):
+            await self._handle_channel_callback(call)
     
-    def _handle_start_command(self, message: Message):
-        """Handle /start and /help commands"""
-        help_text = f"""
+    async def _dispatch_text(self, message: Message):
+        """Route a /command (optionally addressed as /command@botname) to its handler, other text to the fallback"""
+        handler = None
+        if message.text.startswith('/'):
+            command = message.text.split(maxsplit=1)[0].split('@')[0][1:]
+            handler = self._command_handlers.get(command)
+        await (handler or self._handle_text_message)(message)
+
+    @staticmethod
+    def _build_help_text() -> str:
+        """Render the /start and /help reply; config is fixed for the process lifetime"""
+        return f"""
 🤖 **Enhanced Rumble Bot - Video Upload Assistant**
 
 Send me a video file and I'll upload it to Rumble automatically with real-time progress updates!
@@ -166,13 +417,11 @@ It can be multiple lines.
 
 Ready to upload your videos with enhanced experience! 🎉
         """
-        
-        self.bot.reply_to(message, help_text, parse_mode='Markdown')
-        log.info(f"Sent help message to user {message.from_user.id}")
-    
-    def _handle_status_command(self, message: Message):
-        """Handle /status command"""
-        status_text = """
+
+    @staticmethod
+    def _build_status_text() -> str:
+        """Render the /status reply"""
+        return """
 ✅ **Bot Status: Online**
 
 🔧 **Configuration:**
@@ -196,15 +445,12 @@ Ready to upload your videos with enhanced experience! 🎉
             headless_mode='Enabled' if config.HEADLESS_MODE else 'Disabled',
             log_level=config.LOG_LEVEL
         )
-        
-        self.bot.reply_to(message, status_text, parse_mode='Markdown')
-        log.info(f"Sent status message to user {message.from_user.id}")
 
-    def _handle_stats_command(self, message: Message):
-        """Handle /stats command"""
-        try:
-            # Get basic stats (you can expand this with actual tracking)
-            stats_text = f"""
+    @staticmethod
+    def _build_stats_text() -> str:
+        """Render the /stats reply"""
+        # Basic stats (you can expand this with actual tracking)
+        return f"""
 📊 **Upload Statistics**
 
 🎯 **Current Session:**
@@ -230,44 +476,10 @@ Ready to upload your videos with enhanced experience! 🎉
 • Actual URL extraction: ✅ Active
             """
 
-            self.bot.reply_to(message, stats_text, parse_mode='Markdown')
-            log.info(f"Sent stats message to user {message.from_user.id}")
-
-        except Exception as e:
-            log.error(f"Error sending stats: {e}")
-            self.bot.reply_to(message, "❌ Error retrieving statistics. Please try again.")
-
-    def _handle_cancel_command(self, message: Message):
-        """Handle /cancel command"""
-        try:
-            cancel_text = """
-🛑 **Cancel Operations**
-
-Currently, there are no active operations to cancel.
-
-**Note:** Video uploads cannot be cancelled once they've started processing on Rumble's servers. However, you can:
-
-• Wait for the current upload to complete
-• Send a new video to start a fresh upload
-• Use /status to check current bot status
-
-If you're experiencing issues, try:
-• /status - Check bot status
-• /help - View available commands
-• Contact support if problems persist
-            """
-
-            self.bot.reply_to(message, cancel_text, parse_mode='Markdown')
-            log.info(f"Sent cancel message to user {message.from_user.id}")
-
-        except Exception as e:
-            log.error(f"Error sending cancel message: {e}")
-            self.bot.reply_to(message, "❌ Error processing cancel command.")
-
-    def _handle_settings_command(self, message: Message):
-        """Handle /settings command"""
-        try:
-            settings_text = f"""
+    @staticmethod
+    def _build_settings_text() -> str:
+        """Render the /settings reply"""
+        return f"""
 ⚙️ **Current Bot Settings**
 
 **🎯 Enhanced Features:**
@@ -284,6 +496,7 @@ If you're experiencing issues, try:
 • Upload Timeout: {config.UPLOAD_TIMEOUT_SECONDS} seconds
 • Retry Attempts: {config.RETRY_ATTEMPTS}
 • Default Channel: {config.RUMBLE_CHANNEL}
+• Download Chunk Size: {config.DOWNLOAD_CHUNK_SIZE // 1024} KiB
 
 **🔧 System Settings:**
 • Headless Mode: {'✅ Enabled' if config.HEADLESS_MODE else '❌ Disabled'}
@@ -294,15 +507,59 @@ If you're experiencing issues, try:
 For help with configuration, contact your administrator.
             """
 
-            self.bot.reply_to(message, settings_text, parse_mode='Markdown')
-            log.info(f"Sent settings message to user {message.from_user.id}")
+    async def _handle_start_command(self, message: Message):
+        """Handle /start and /help commands"""
+        await self.bot.reply_to(message, self._help_text, parse_mode='Markdown')
+        log.info("Sent help message to user {}", message.from_user.id)
+    
+    async def _handle_status_command(self, message: Message):
+        """Handle /status command"""
+        await self.bot.reply_to(message, self._status_text, parse_mode='Markdown')
+        log.info("Sent status message to user {}", message.from_user.id)
+
+    async def _handle_stats_command(self, message: Message):
+        """Handle /stats command"""
+        try:
+            await self.bot.reply_to(message, self._stats_text, parse_mode='Markdown')
+            log.info("Sent stats message to user {}", message.from_user.id)
+
+        except Exception as e:
+            log.error(f"Error sending stats: {e}")
+            await self.bot.reply_to(message, "❌ Error retrieving statistics. Please try again.")
+
+    async def _handle_settings_command(self, message: Message):
+        """Handle /settings command"""
+        try:
+            await self.bot.reply_to(message, self._settings_text, parse_mode='Markdown')
+            log.info("Sent settings message to user {}", message.from_user.id)
 
         except Exception as e:
             log.error(f"Error sending settings: {e}")
-            self.bot.reply_to(message, "❌ Error retrieving settings. Please try again.")
+            await self.bot.reply_to(message, "❌ Error retrieving settings. Please try again.")
 
-    @error_handler.retry_on_failure(max_attempts=3, delay=5)
-    def _handle_video_message(self, message: Message):
+    async def _enqueue_video_message(self, message: Message):
+        """Queue a media message for its chat's worker and return without waiting for the upload"""
+        chat_id = message.chat.id
+        queue = self._chat_queues.setdefault(chat_id, asyncio.Queue())
+        queue.put_nowait(message)
+
+        if chat_id not in self._chat_workers:
+            self._chat_workers[chat_id] = asyncio.create_task(self._chat_worker(chat_id))
+
+    async def _chat_worker(self, chat_id: int):
+        """Process a chat's queued videos one at a time, exiting once the queue drains"""
+        queue = self._chat_queues[chat_id]
+        try:
+            while not queue.empty():
+                message = queue.get_nowait()
+                async with self._upload_slots:
+                    await self._handle_video_message(message)
+        finally:
+            # No await between the empty check and here, so nothing can be enqueued unseen
+            del self._chat_workers[chat_id]
+            del self._chat_queues[chat_id]
+
+    async def _handle_video_message(self, message: Message):
         """Handle media file messages (video, document, audio, photo) with detailed progress updates"""
         try:
             # Check file size first for any media type
@@ -333,12 +590,12 @@ For help with configuration, contact your administrator.
 • Compress your video to under 50 MB
 • Use a video compression tool
 • Upload a shorter clip"""
-                    self.bot.reply_to(message, error_msg, parse_mode='HTML')
+                    await self.bot.reply_to(message, error_msg, parse_mode='HTML')
                     log.warning(f"Video too large: {file_size_mb:.1f} MB from user {message.from_user.id}")
                     return
 
             # Send initial response
-            processing_msg = self.bot.reply_to(
+            processing_msg = await self.bot.reply_to(
                 message,
                 f"📹 Video received! ({file_size_mb:.1f} MB)\n\n⏳ Processing and uploading to Rumble..."
             )
@@ -347,28 +604,22 @@ For help with configuration, contact your administrator.
             title, description, tags = self._extract_metadata(message.caption or "")
 
             # Generate random metadata if needed
-            if not title and config.ENABLE_RANDOM_TITLES:
-                title = self.metadata_generator.generate_title()
-
-            if not description and config.ENABLE_RANDOM_DESCRIPTIONS:
-                description = self.metadata_generator.generate_description()
+            if self._random_metadata and not (title and description and tags):
+                title, description, tags = self._fill_random_metadata(title, description, tags)
 
-            if not tags and config.ENABLE_RANDOM_TAGS:
-                tags = self.metadata_generator.generate_tags()
-
-            log.info(f"Processing video from user {message.from_user.id}")
-            log.info(f"Metadata - Title: {title}, Description: {description[:50]}..., Tags: {tags}")
+            log.info("Processing video from user {}", message.from_user.id)
+            log.info("Metadata - Title: {}, Description: {!s:.50}..., Tags: {}", title, description, tags)
 
             # Update with metadata info
-            self.bot.edit_message_text(
-                f"📹 Video received!\n\n📝 **Metadata:**\n- Title: {title}\n- Tags: {', '.join(tags) if tags else 'None'}\n\n⬇️ Downloading video...",
+            self._editor.schedule(
                 message.chat.id,
                 processing_msg.message_id,
+                f"📹 Video received!\n\n📝 **Metadata:**\n- Title: {title}\n- Tags: {', '.join(tags) if tags else 'None'}\n\n⬇️ Downloading video...",
                 parse_mode='Markdown'
             )
 
             # Process the video
-            video_path = asyncio.run(self._process_video_file(message, processing_msg))
+            video_path = await self._process_video_file(message, processing_msg)
 
             if not video_path:
                 # Check if it's a file size issue
@@ -414,25 +665,26 @@ Your video is too large for Telegram to process (over 50 MB limit).
 
 <b>💡 Best Solution:</b> Use the document/file option in Telegram for large videos!"""
 
-                self.bot.edit_message_text(
-                    error_text,
+                await self._editor.flush(
                     message.chat.id,
                     processing_msg.message_id,
+                    error_text,
                     parse_mode='HTML'
                 )
                 return
 
             # Update status - login phase
-            self.bot.edit_message_text(
-                f"📤 Video downloaded successfully!\n\n🔐 Logging into Rumble...\n\n📝 **Video:** {title}",
+            self._editor.schedule(
                 message.chat.id,
                 processing_msg.message_id,
+                f"📤 Video downloaded successfully!\n\n🔐 Logging into Rumble...\n\n📝 **Video:** {title}",
                 parse_mode='Markdown'
             )
 
             # Upload to Rumble with progress callback
-            upload_result = self._upload_with_progress_updates(
-                video_path, title, description, tags, message.chat.id, processing_msg.message_id
+            upload_result = await self._upload_with_progress_updates(
+                video_path, title, description, tags, message.chat.id, processing_msg.message_id,
+                user_id=message.from_user.id
             )
 
             if upload_result.get('success'):
@@ -451,14 +703,14 @@ Your video is too large for Telegram to process (over 50 MB limit).
 🎉 Your video is now live on Rumble!
                 """
 
-                self.bot.edit_message_text(
-                    success_text,
+                await self._editor.flush(
                     message.chat.id,
                     processing_msg.message_id,
+                    success_text,
                     parse_mode='Markdown'
                 )
 
-                log.info(f"Successfully uploaded video for user {message.from_user.id}")
+                log.info("Successfully uploaded video for user {}", message.from_user.id)
             else:
                 error_msg = upload_result.get('error', 'Unknown error occurred')
                 debug_info = upload_result.get('debug_info', '')
@@ -483,10 +735,10 @@ Please try again later or contact support if the issue persists.
 Please try again later or contact support if the issue persists.
                     """
 
-                self.bot.edit_message_text(
-                    error_text,
+                await self._editor.flush(
                     message.chat.id,
                     processing_msg.message_id,
+                    error_text,
                     parse_mode='Markdown'
                 )
 
@@ -498,78 +750,98 @@ Please try again later or contact support if the issue persists.
         except Exception as e:
             log.error(f"Error processing video message: {e}")
             try:
-                self.bot.edit_message_text(
-                    f"❌ <b>System Error</b>\n\nAn unexpected error occurred: {str(e)}\n\nPlease try again later.",
+                await self._editor.flush(
                     message.chat.id,
                     processing_msg.message_id,
+                    f"❌ <b>System Error</b>\n\nAn unexpected error occurred: {str(e)}\n\nPlease try again later.",
                     parse_mode='HTML'
                 )
             except:
-                self.bot.reply_to(message, f"❌ An error occurred: {str(e)}")
+                await self.bot.reply_to(message, f"❌ An error occurred: {str(e)}")
+
+    def _make_upload_progress_callback(self, title: str, chat_id: int, message_id: int):
+        """Build an upload progress callback that edits the status message at most once a second"""
+        loop = asyncio.get_running_loop()
+        last = {'time': 0.0, 'percent': -1}
+
+        def on_progress(bytes_done: int, bytes_total: int):
+            # Runs on the uploader thread, so edits are handed back to the event loop
+            percent = bytes_done * 100 // bytes_total
+            now = time.monotonic()
+            if percent == last['percent'] or now - last['time'] < 1:
+                return
+            last['time'], last['percent'] = now, percent
+            text = f"📤 Uploading video file... {percent}%\n\n📝 **Video:** {title}"
+            loop.call_soon_threadsafe(
+                lambda: self._editor.schedule(chat_id, message_id, text, parse_mode='Markdown')
+            )
 
-    def _upload_with_progress_updates(self, video_path: str, title: str, description: str,
-                                    tags: list, chat_id: int, message_id: int) -> dict:
+        return on_progress
+
+    @asynccontextmanager
+    async def _use_uploader(self, job: Optional[Tuple[int, int]]):
+        """Hold the browser for a (chat_id, user_id) upload, so /cancel knows whose upload it may close"""
+        async with self._uploader_lock:
+            self._uploader_owner = job
+            try:
+                yield
+            finally:
+                self._uploader_owner = None
+
+    async def _upload_with_progress_updates(self, video_path: str, title: str, description: str,
+                                    tags: list, chat_id: int, message_id: int,
+                                    user_id: Optional[int] = None) -> dict:
         """Upload video with progress updates to user"""
+        job = (chat_id, user_id) if user_id is not None else None
+        if job:
+            self.active_uploads.add(job)
         try:
+            progress_callback = None
             if config.ENABLE_PROGRESS_UPDATES:
-                # Phase 0: Get available channels
-                self.bot.edit_message_text(
-                    f"🔍 Getting available channels...\n\n📝 **Video:** {title}",
-                    chat_id, message_id, parse_mode='Markdown'
-                )
-
-                # Phase 1: Login
-                self.bot.edit_message_text(
-                    f"🔐 Logging into Rumble...\n\n📝 **Video:** {title}",
-                    chat_id, message_id, parse_mode='Markdown'
-                )
-
-                # Phase 2: Upload file
-                self.bot.edit_message_text(
-                    f"📤 Uploading video file...\n\n📝 **Video:** {title}\n⏳ This may take a few minutes depending on file size.",
-                    chat_id, message_id, parse_mode='Markdown'
-                )
+                progress_callback = self._make_upload_progress_callback(title, chat_id, message_id)
 
-                # Phase 3: Form filling
-                self.bot.edit_message_text(
-                    f"📝 Filling upload form...\n\n📝 **Video:** {title}\n✅ File uploaded successfully",
-                    chat_id, message_id, parse_mode='Markdown'
-                )
-
-                # Phase 4: Final submission
-                self.bot.edit_message_text(
-                    f"🚀 Submitting upload...\n\n📝 **Video:** {title}\n✅ Form completed",
-                    chat_id, message_id, parse_mode='Markdown'
-                )
+            # Selenium calls run in worker threads so other chats keep being served;
+            # the browser lock is only held while the browser is in use
+            async with self._use_uploader(job):
+                available_channels = await asyncio.to_thread(self.rumble_uploader.get_available_channels)
 
-                # Phase 5: Processing
-                self.bot.edit_message_text(
-                    f"⚙️ Processing upload...\n\n📝 **Video:** {title}\n✅ Upload submitted\n⏳ Waiting for Rumble to process...",
-                    chat_id, message_id, parse_mode='Markdown'
-                )
-
-            # Get available channels and ask user to choose
-            available_channels = self.rumble_uploader.get_available_channels()
+            # Ask the user to choose a channel without blocking other chats' uploads
             selected_channel = None
-
             if available_channels and len(available_channels) > 1:
-                # Ask user to select channel
-                selected_channel = self._ask_user_for_channel_selection(chat_id, available_channels, message_id)
+                selected_channel = await self._ask_user_for_channel_selection(chat_id, available_channels, message_id)
             elif available_channels:
                 # Only one channel available, use it
                 selected_channel = available_channels[0]['name']
-                log.info(f"Only one channel available, auto-selecting: {selected_channel}")
+                log.info("Only one channel available, auto-selecting: {}", selected_channel)
             else:
                 log.warning("No channels found, will use default")
 
-            # Actual upload
-            upload_result = self.rumble_uploader.upload_video(
-                video_path=video_path,
-                title=title,
-                description=description,
-                tags=tags,
-                channel=selected_channel
-            )
+            if job in self._cancelled_uploads:
+                return {'success': False, 'error': 'Upload cancelled'}
+
+            async with self._use_uploader(job):
+                try:
+                    # Actual upload; only failures from before the form was submitted are retried
+                    for attempt in range(1, config.RETRY_ATTEMPTS + 1):
+                        upload_result = await self.rumble_uploader.upload_video_async(
+                            video_path=video_path,
+                            title=title,
+                            description=description,
+                            tags=tags,
+                            channel=selected_channel,
+                            progress_callback=progress_callback
+                        )
+                        if upload_result.get('success') or not upload_result.get('retryable') or attempt == config.RETRY_ATTEMPTS:
+                            break
+                        if job in self._cancelled_uploads:
+                            upload_result = {'success': False, 'error': 'Upload cancelled'}
+                            break
+                        delay = self._backoff_delay(attempt)
+                        log.warning(f"Upload attempt {attempt}/{config.RETRY_ATTEMPTS} failed ({upload_result.get('error')}), retrying in {delay:.1f}s")
+                        await asyncio.sleep(delay)
+                finally:
+                    # Keep the browser warm for the next video instead of cold-starting it
+                    await asyncio.to_thread(self.rumble_uploader.reset_for_next_upload)
 
             return upload_result
 
@@ -577,15 +849,19 @@ Please try again later or contact support if the issue persists.
             log.error(f"Error in upload with progress: {e}")
             debug_info = f'Progress update error: {e}' if config.ENABLE_DEBUG_INFO else ''
             return {'success': False, 'error': str(e), 'debug_info': debug_info}
+        finally:
+            if job:
+                self.active_uploads.discard(job)
+                self._cancelled_uploads.discard(job)
 
-    def _ask_user_for_channel_selection(self, chat_id: int, available_channels: list, message_id: int) -> str:
+    async def _ask_user_for_channel_selection(self, chat_id: int, available_channels: list, message_id: int) -> str:
         """Ask user to select a channel from available options"""
         try:
-            log.info(f"Available channels: {[ch['name'] for ch in available_channels]}")
+            log.opt(lazy=True).info("Available channels: {}", lambda: [ch['name'] for ch in available_channels])
 
             # Check if RUMBLE_CHANNEL is set in environment for auto-selection
             env_channel = getattr(config, 'RUMBLE_CHANNEL', None)
-            log.info(f"Environment RUMBLE_CHANNEL: '{env_channel}'")
+            log.info("Environment RUMBLE_CHANNEL: '{}'", env_channel)
 
             if env_channel and env_channel.strip():
                 # Auto-select based on environment variable
@@ -597,23 +873,22 @@ Please try again later or contact support if the issue persists.
 
                 if selected_channel:
                     channel_text = f"📺 <b>Channel Auto-Selected from Config:</b>\n\n✅ <b>{selected_channel}</b>\n\n🚀 Proceeding with upload..."
-                    log.info(f"Auto-selected channel from config: {selected_channel}")
+                    log.info("Auto-selected channel from config: {}", selected_channel)
                 else:
                     selected_channel = available_channels[0]['name']
                     channel_text = f"📺 <b>Config Channel Not Found:</b>\n\n⚠️ Configured: '{env_channel}'\n✅ Using: {selected_channel} (first available)\n\n🚀 Proceeding with upload..."
                     log.warning(f"Configured channel '{env_channel}' not found, using first available: {selected_channel}")
 
                 # Send auto-selection message
-                self.bot.edit_message_text(
-                    channel_text,
+                await self._editor.flush(
                     chat_id,
                     message_id,
+                    channel_text,
                     parse_mode='HTML'
                 )
 
                 # Give user a moment to see the selection
-                import time
-                time.sleep(3)
+                await asyncio.sleep(3)
                 return selected_channel
             else:
                 # Manual selection with clickable buttons
@@ -635,10 +910,10 @@ Please try again later or contact support if the issue persists.
                 channel_text += "👆 <b>Click a button to select your channel:</b>"
 
                 # Send channel selection message with buttons
-                self.bot.edit_message_text(
-                    channel_text,
+                await self._editor.flush(
                     chat_id,
                     message_id,
+                    channel_text,
                     parse_mode='HTML',
                     reply_markup=keyboard
                 )
@@ -654,7 +929,6 @@ Please try again later or contact support if the issue persists.
                 }
 
                 # Wait for user selection (this will be handled by callback)
-                import time
                 timeout = 60
                 start_time = time.time()
 
@@ -664,14 +938,14 @@ Please try again later or contact support if the issue persists.
                         selected_channel = selection_data['selected_channel']
                         del self.pending_channel_selections[chat_id]
                         return selected_channel
-                    time.sleep(1)
+                    await asyncio.sleep(1)
 
                 # Timeout - use first channel
                 selected_channel = available_channels[0]['name']
-                self.bot.edit_message_text(
-                    f"📺 <b>Selection Timeout</b>\n\n⏰ Auto-selected: {selected_channel}\n\n🚀 Proceeding with upload...",
+                await self._editor.flush(
                     chat_id,
                     message_id,
+                    f"📺 <b>Selection Timeout</b>\n\n⏰ Auto-selected: {selected_channel}\n\n🚀 Proceeding with upload...",
                     parse_mode='HTML'
                 )
 
@@ -687,7 +961,7 @@ Please try again later or contact support if the issue persists.
             log.error(f"Error in channel selection: {e}")
             return None
 
-    def _handle_channel_selection_response(self, message: Message):
+    async def _handle_channel_selection_response(self, message: Message):
         """Handle user response to channel selection"""
         try:
             user_id = message.from_user.id
@@ -705,7 +979,7 @@ Please try again later or contact support if the issue persists.
                     selected_channel = available_channels[choice - 1]['name']
 
                     # Update the message to show selection
-                    self.bot.edit_message_text(
+                    await self.bot.edit_message_text(
                         f"📺 <b>Channel Selected!</b>\n\n✅ <b>Selected:</b> {selected_channel}\n\n🚀 Proceeding with upload...",
                         selection_data['chat_id'],
                         selection_data['message_id'],
@@ -714,51 +988,74 @@ Please try again later or contact support if the issue persists.
 
                     # Store the selection and remove from pending
                     selection_data['selected_channel'] = selected_channel
-                    log.info(f"User {user_id} selected channel: {selected_channel}")
+                    log.info("User {} selected channel: {}", user_id, selected_channel)
 
                 else:
-                    self.bot.reply_to(message, f"❌ Invalid choice. Please select a number between 1 and {len(available_channels)}")
+                    await self.bot.reply_to(message, f"❌ Invalid choice. Please select a number between 1 and {len(available_channels)}")
 
             except ValueError:
-                self.bot.reply_to(message, "❌ Please reply with a number (e.g., 1, 2, 3...)")
+                await self.bot.reply_to(message, "❌ Please reply with a number (e.g., 1, 2, 3...)")
 
         except Exception as e:
             log.error(f"Error handling channel selection response: {e}")
 
-    def _handle_cancel_command(self, message: Message):
-        """Handle cancel command - stop all active processes"""
+    def _drop_queued_videos(self, chat_id: int, user_id: int) -> int:
+        """Remove user_id's videos still waiting in chat_id's queue, returning how many"""
+        queue = self._chat_queues.get(chat_id)
+        if not queue:
+            return 0
+
+        # No await in between, so the chat worker cannot take a message meanwhile
+        kept, dropped = [], 0
+        while not queue.empty():
+            queued = queue.get_nowait()
+            if queued.from_user.id == user_id:
+                dropped += 1
+            else:
+                kept.append(queued)
+        for queued in kept:
+            queue.put_nowait(queued)
+        return dropped
+
+    async def _handle_cancel_command(self, message: Message):
+        """Handle cancel command - stop the requesting user's queued and active uploads"""
         try:
             user_id = message.from_user.id
+            chat_id = message.chat.id
+
+            # Cancel pending channel selection (keyed by chat)
+            if chat_id in self.pending_channel_selections:
+                del self.pending_channel_selections[chat_id]
+                log.info("Cancelled channel selection for user {}", user_id)
+
+            dropped = self._drop_queued_videos(chat_id, user_id)
+            if dropped:
+                log.info("Dropped {} queued videos for user {}", dropped, user_id)
+
+            # Cancel active upload in this chat; the browser is only closed while that
+            # upload holds it, so other chats' uploads keep running
+            job = (chat_id, user_id)
+            if job in self.active_uploads:
+                self._cancelled_uploads.add(job)
+                log.info("Cancelled active upload for user {}", user_id)
+                try:
+                    if self._uploader_owner == job and self.rumble_uploader.driver:
+                        await asyncio.to_thread(self.rumble_uploader.close)
+                        log.info("Closed Rumble uploader driver")
+                except Exception as e:
+                    log.warning(f"Error closing Rumble uploader: {e}")
 
-            # Cancel pending channel selection
-            if user_id in self.pending_channel_selections:
-                del self.pending_channel_selections[user_id]
-                log.info(f"Cancelled channel selection for user {user_id}")
-
-            # Cancel active upload
-            if user_id in self.active_uploads:
-                del self.active_uploads[user_id]
-                log.info(f"Cancelled active upload for user {user_id}")
-
-            # Try to stop Rumble uploader if active
-            try:
-                if hasattr(self.rumble_uploader, 'driver') and self.rumble_uploader.driver:
-                    self.rumble_uploader.close()
-                    log.info("Closed Rumble uploader driver")
-            except Exception as e:
-                log.warning(f"Error closing Rumble uploader: {e}")
-
-            self.bot.reply_to(
+            await self.bot.reply_to(
                 message,
-                "🛑 <b>Process Cancelled</b>\n\nAll active uploads and selections have been cancelled.\n\nYou can start a new upload by sending a video file.",
+                "🛑 <b>Process Cancelled</b>\n\nYour active and queued uploads and selections have been cancelled.\n\nYou can start a new upload by sending a video file.",
                 parse_mode='HTML'
             )
 
         except Exception as e:
             log.error(f"Error handling cancel command: {e}")
-            self.bot.reply_to(message, "❌ Error cancelling process. Please try again.")
+            await self.bot.reply_to(message, "❌ Error cancelling process. Please try again.")
 
-    def _handle_channel_callback(self, call: CallbackQuery):
+    async def _handle_channel_callback(self, call: CallbackQuery):
         """Handle channel selection button clicks"""
         try:
             chat_id = call.message.chat.id
@@ -766,7 +1063,7 @@ Please try again later or contact support if the issue persists.
 
             if call.data == "channel_cancel":
                 # User cancelled
-                self.bot.edit_message_text(
+                await self.bot.edit_message_text(
                     "❌ <b>Upload Cancelled</b>\n\nChannel selection cancelled by user.",
                     chat_id,
                     message_id,
@@ -777,7 +1074,7 @@ Please try again later or contact support if the issue persists.
                 if chat_id in self.pending_channel_selections:
                     del self.pending_channel_selections[chat_id]
 
-                self.bot.answer_callback_query(call.id, "Upload cancelled")
+                await self.bot.answer_callback_query(call.id, "Upload cancelled")
                 return
 
             # Extract channel index
@@ -790,7 +1087,7 @@ Please try again later or contact support if the issue persists.
                         selected_channel = selection_data['channels'][channel_index]['name']
 
                         # Update message to show selection
-                        self.bot.edit_message_text(
+                        await self.bot.edit_message_text(
                             f"📺 <b>Channel Selected!</b>\n\n✅ <b>Selected:</b> {selected_channel}\n\n🚀 Proceeding with upload...",
                             chat_id,
                             message_id,
@@ -799,25 +1096,25 @@ Please try again later or contact support if the issue persists.
 
                         # Store the selection
                         selection_data['selected_channel'] = selected_channel
-                        log.info(f"User selected channel via button: {selected_channel}")
+                        log.info("User selected channel via button: {}", selected_channel)
 
-                        self.bot.answer_callback_query(call.id, f"Selected: {selected_channel}")
+                        await self.bot.answer_callback_query(call.id, f"Selected: {selected_channel}")
                     else:
-                        self.bot.answer_callback_query(call.id, "Invalid selection")
+                        await self.bot.answer_callback_query(call.id, "Invalid selection")
 
                 except (ValueError, IndexError) as e:
                     log.error(f"Error parsing channel selection: {e}")
-                    self.bot.answer_callback_query(call.id, "Error processing selection")
+                    await self.bot.answer_callback_query(call.id, "Error processing selection")
 
         except Exception as e:
             log.error(f"Error handling channel callback: {e}")
-            self.bot.answer_callback_query(call.id, "Error occurred")
+            await self.bot.answer_callback_query(call.id, "Error occurred")
 
-    def _handle_config_command(self, message: Message):
+    async def _handle_config_command(self, message: Message):
         """Handle /config command and subcommands"""
         try:
             # Debug log to check message type
-            log.debug(f"Config command message type: {type(message)}")
+            log.debug("Config command message type: {}", type(message))
 
             # Validate message object
             if not hasattr(message, 'text') or not hasattr(message, 'chat'):
@@ -901,8 +1198,8 @@ Sensitive values (passwords, emails) are hidden in status displays."""
 
             # Ensure message is valid before replying
             if hasattr(message, 'chat') and hasattr(message, 'from_user'):
-                self.bot.reply_to(message, response, parse_mode='HTML')
-                log.info(f"Handled config command from user {message.from_user.id}")
+                await self.bot.reply_to(message, response, parse_mode='HTML')
+                log.info("Handled config command from user {}", message.from_user.id)
             else:
                 log.error(f"Invalid message object in config handler: {type(message)}")
 
@@ -911,13 +1208,13 @@ Sensitive values (passwords, emails) are hidden in status displays."""
             try:
                 # Ensure message is a proper Message object
                 if hasattr(message, 'chat') and hasattr(message, 'message_id'):
-                    self.bot.reply_to(message, "❌ Error processing configuration command. Please try again.")
+                    await self.bot.reply_to(message, "❌ Error processing configuration command. Please try again.")
                 else:
                     log.error(f"Invalid message object type: {type(message)}")
             except Exception as reply_error:
                 log.error(f"Failed to send error reply: {reply_error}")
 
-    def _handle_text_message(self, message: Message):
+    async def _handle_text_message(self, message: Message):
         """Handle text messages"""
         chat_id = message.chat.id
 
@@ -928,28 +1225,42 @@ Sensitive values (passwords, emails) are hidden in status displays."""
             return
 
         # Default response for other text
-        self.bot.reply_to(
+        await self.bot.reply_to(
             message,
             "📹 Please send a video file to upload to Rumble.\n\n💡 **For large videos (>50 MB)**: Send as **📄 Document/File** instead of 🎥 Video for better success rate.\n\nUse /help for more information."
         )
     
+    def _fill_random_metadata(self, title: Optional[str], description: Optional[str],
+                              tags: List[str]) -> Tuple[Optional[str], Optional[str], List[str]]:
+        """Generate the missing fields that random content is enabled for"""
+        if not title and 'title' in self._random_metadata:
+            title = self.metadata_generator.generate_title()
+
+        if not description and 'description' in self._random_metadata:
+            description = self.metadata_generator.generate_description()
+
+        if not tags and 'tags' in self._random_metadata:
+            tags = self.metadata_generator.generate_tags()
+
+        return title, description, tags
+
     def _extract_metadata(self, text: str) -> Tuple[Optional[str], Optional[str], List[str]]:
         """Extract title, description, and tags from message text"""
         if not text:
             return None, None, []
         
-        lines = text.strip().split('\n')
         title = None
         description_lines = []
-        tags = []
         
-        # Extract hashtags
-        tag_pattern = r'#(\w+)'
-        for line in lines:
-            found_tags = re.findall(tag_pattern, line)
-            tags.extend(found_tags)
-            # Remove hashtags from the line for further processing
-            line_without_tags = re.sub(tag_pattern, '', line).strip()
+        # Extract hashtags, then remove them; tags never span lines, so this can
+        # run over the whole caption instead of line by line. Captions without a
+        # '#' skip the regex entirely.
+        tags = []
+        if '#' in text:
+            tags = HASHTAG_PATTERN.findall(text)
+            text = HASHTAG_PATTERN.sub('', text)
+        for line in text.split('\n'):
+            line_without_tags = line.strip()
             if line_without_tags:
                 if title is None:
                     title = line_without_tags
@@ -964,13 +1275,9 @@ Sensitive values (passwords, emails) are hidden in status displays."""
         """Download any media content from message - simplified approach"""
         try:
             # Check available disk space first
-            import shutil
-            total, used, free = shutil.disk_usage("/")
-            free_mb = free / (1024 * 1024)
-            log.info(f"Available disk space: {free_mb:.1f} MB")
-
-            if free_mb < 200:  # Require at least 200 MB free
-                log.error(f"Insufficient disk space: {free_mb:.1f} MB available")
+            free = _free_disk_bytes()
+            if free < self._MIN_FREE_BYTES:
+                log.error(f"Insufficient disk space: {free / (1024 * 1024):.1f} MB available")
                 return None
 
             # Simple approach: just download whatever media is in the message
@@ -979,29 +1286,29 @@ Sensitive values (passwords, emails) are hidden in status displays."""
             # Determine file info from any media type
             file_id = None
             file_size = 0
-            file_name = f"media_{int(time.time())}"
+            file_name = "media"
 
             if message.document:
                 file_id = message.document.file_id
                 file_size = message.document.file_size or 0
-                file_name = message.document.file_name or f"document_{int(time.time())}"
-                log.info(f"Processing document: {file_name} ({file_size / (1024*1024):.1f} MB)")
+                file_name = message.document.file_name or "document"
+                log.info("Processing document: {} ({:.1f} MB)", file_name, file_size / (1024*1024))
             elif message.video:
                 file_id = message.video.file_id
                 file_size = message.video.file_size or 0
-                file_name = f"video_{int(time.time())}.mp4"
-                log.info(f"Processing video: {file_name} ({file_size / (1024*1024):.1f} MB)")
+                file_name = "video.mp4"
+                log.info("Processing video: {} ({:.1f} MB)", file_name, file_size / (1024*1024))
             elif message.audio:
                 file_id = message.audio.file_id
                 file_size = message.audio.file_size or 0
-                file_name = f"audio_{int(time.time())}.mp3"
-                log.info(f"Processing audio: {file_name} ({file_size / (1024*1024):.1f} MB)")
+                file_name = "audio.mp3"
+                log.info("Processing audio: {} ({:.1f} MB)", file_name, file_size / (1024*1024))
             elif message.photo:
                 # Get the largest photo size
                 file_id = message.photo[-1].file_id
                 file_size = message.photo[-1].file_size or 0
-                file_name = f"photo_{int(time.time())}.jpg"
-                log.info(f"Processing photo: {file_name} ({file_size / (1024*1024):.1f} MB)")
+                file_name = "photo.jpg"
+                log.info("Processing photo: {} ({:.1f} MB)", file_name, file_size / (1024*1024))
             else:
                 log.warning("No media content found in message")
                 return None
@@ -1010,13 +1317,14 @@ Sensitive values (passwords, emails) are hidden in status displays."""
                 log.warning("Could not get file_id from message")
                 return None
 
-            log.info(f"Downloading media: {file_name}")
+            log.info("Downloading media: {}", file_name)
 
-            # Create file path
-            file_path = Path(config.DOWNLOADS_DIR) / file_name
+            # Create file path; chat and message id keep concurrent downloads of the same name apart
+            file_path = Path(config.DOWNLOADS_DIR) / f"{message.chat.id}_{message.message_id}_{Path(file_name).name}"
 
             # Try Pyrogram first for large file support, fallback to pyTelegramBotAPI
             download_success = False
+            streamed_path = None
 
             if self.pyrogram_client:
                 try:
@@ -1032,7 +1340,7 @@ Sensitive values (passwords, emails) are hidden in status displays."""
                     )
 
                     if downloaded_file and os.path.exists(file_path):
-                        log.info(f"Pyrogram download successful: {file_path}")
+                        log.info("Pyrogram download successful: {}", file_path)
                         download_success = True
                     else:
                         log.warning("Pyrogram download failed - file not created")
@@ -1049,34 +1357,30 @@ Sensitive values (passwords, emails) are hidden in status displays."""
 
                     # Try to get file info - this might fail for large files
                     try:
-                        file_info = self.bot.get_file(file_id)
+                        file_info = await self.bot.get_file(file_id)
                         download_url = f"https://api.telegram.org/file/bot{self.bot.token}/{file_info.file_path}"
-                        log.info(f"Got file URL: {download_url}")
+                        log.info("Got file URL: {}", download_url)
                     except Exception as e:
                         log.error(f"Failed to get file info from Telegram: {e}")
                         # For very large files, Telegram won't provide file_path
                         # This is expected behavior - we need Pyrogram for these
                         return None
 
-                    # Download file directly using requests for better control
-                    import requests
-                    log.info(f"Downloading from: {download_url}")
-
-                    # Stream download to handle large files efficiently
-                    with requests.get(download_url, stream=True, timeout=300) as response:
-                        response.raise_for_status()
-
-                        with open(file_path, 'wb') as f:
-                            downloaded = 0
-                            for chunk in response.iter_content(chunk_size=8192):
-                                if chunk:
-                                    f.write(chunk)
-                                    downloaded += len(chunk)
-
-                                    # Log progress for large files
-                                    if file_size > 0 and downloaded % (10 * 1024 * 1024) == 0:  # Every 10 MB
-                                        progress = (downloaded / file_size) * 100
-                                        log.info(f"Download progress: {downloaded / (1024*1024):.1f} MB ({progress:.1f}%)")
+                    # Stream the file directly for better control over large downloads
+                    log.info("Downloading from: {}", download_url)
+                    if config.ENABLE_VIDEO_CONVERSION and not self._transcode_slots.locked():
+                        # Transcode while downloading instead of after
+                        async with self._transcode_slots:
+                            streamed_path = await self._with_backoff(
+                                lambda: self._download_and_convert(download_url, file_path, file_size),
+                                "Download"
+                            )
+                    else:
+                        # Plain download; if all transcode slots are busy, conversion waits for one afterwards
+                        await self._with_backoff(
+                            lambda: self._download_url(download_url, file_path, file_size),
+                            "Download"
+                        )
 
                     download_success = True
                     log.info("pyTelegramBotAPI download successful")
@@ -1089,26 +1393,28 @@ Sensitive values (passwords, emails) are hidden in status displays."""
                 log.error("All download methods failed")
                 return None
 
-            log.info(f"Media downloaded successfully: {file_path}")
+            log.info("Media downloaded successfully: {}", file_path)
+            _drop_page_cache(file_path)
 
             # Convert video to ensure Rumble compatibility (optional)
-            if config.ENABLE_VIDEO_CONVERSION:
+            if config.ENABLE_VIDEO_CONVERSION and streamed_path:
+                self._cleanup_file(str(file_path))
+                return streamed_path
+            elif config.ENABLE_VIDEO_CONVERSION:
                 if processing_msg:
-                    try:
-                        self.bot.edit_message_text(
-                            f"📹 Media downloaded!\n\n🔄 Converting to Rumble-compatible format...",
-                            processing_msg.chat.id,
-                            processing_msg.message_id
-                        )
-                    except Exception as e:
-                        log.warning(f"Failed to update progress message: {e}")
+                    self._editor.schedule(
+                        processing_msg.chat.id,
+                        processing_msg.message_id,
+                        f"📹 Media downloaded!\n\n🔄 Converting to Rumble-compatible format..."
+                    )
 
-                converted_path = self._convert_video_for_rumble(file_path)
+                async with self._transcode_slots:
+                    converted_path = await asyncio.to_thread(self._convert_video_for_rumble, file_path)
                 if converted_path and converted_path != str(file_path):
                     # Remove original file if conversion was successful
                     try:
                         os.remove(file_path)
-                        log.info(f"Removed original file after conversion: {file_path}")
+                        log.info("Removed original file after conversion: {}", file_path)
                     except Exception as e:
                         log.warning(f"Failed to remove original file: {e}")
                     return converted_path
@@ -1116,14 +1422,11 @@ Sensitive values (passwords, emails) are hidden in status displays."""
                     # Conversion failed, but continue with original file
                     log.warning("Video conversion failed, proceeding with original file")
                     if processing_msg:
-                        try:
-                            self.bot.edit_message_text(
-                                f"📹 Media downloaded!\n\n⚠️ Conversion failed, using original format...",
-                                processing_msg.chat.id,
-                                processing_msg.message_id
-                            )
-                        except Exception as e:
-                            log.warning(f"Failed to update progress message: {e}")
+                        self._editor.schedule(
+                            processing_msg.chat.id,
+                            processing_msg.message_id,
+                            f"📹 Media downloaded!\n\n⚠️ Conversion failed, using original format..."
+                        )
             else:
                 log.info("Video conversion disabled, using original format")
 
@@ -1153,11 +1456,191 @@ Sensitive values (passwords, emails) are hidden in status displays."""
 
             return None
 
+    @staticmethod
+    def _backoff_delay(attempt: int) -> float:
+        """Exponential backoff with jitter before retry number `attempt`, capped at a minute"""
+        return min(60, config.RETRY_DELAY_SECONDS * 2 ** (attempt - 1)) + random.random()
+
+    async def _with_backoff(self, operation, description: str):
+        """Await operation() again after transient network errors (connection drops, timeouts, 429, 5xx)"""
+        for attempt in range(1, config.RETRY_ATTEMPTS + 1):
+            try:
+                return await operation()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                status = getattr(e, 'status', None)
+                if attempt == config.RETRY_ATTEMPTS or (status and status < 500 and status != 429):
+                    raise
+                delay = self._backoff_delay(attempt)
+                log.warning(f"{description} attempt {attempt}/{config.RETRY_ATTEMPTS} failed ({e}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Shared session for file downloads, so consecutive downloads reuse the TLS connection"""
+        if self._http_session is None or self._http_session.closed:
+            timeout = aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=300)
+            self._http_session = aiohttp.ClientSession(timeout=timeout)
+        return self._http_session
+
+    async def _download_url(self, download_url: str, file_path: Path, file_size: int, on_chunk=None):
+        """Stream a file to disk in DOWNLOAD_CHUNK_SIZE chunks, passing each to the optional on_chunk coroutine"""
+        async with self._get_http_session().get(download_url) as response:
+            response.raise_for_status()
+
+            with open(file_path, 'wb', buffering=0) as f:
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                downloaded = 0
+                last_logged = 0
+                pending = []
+                pending_bytes = 0
+                async for chunk in response.content.iter_chunked(config.DOWNLOAD_CHUNK_SIZE):
+                    pending.append(chunk)
+                    pending_bytes += len(chunk)
+                    if pending_bytes >= WRITE_BATCH_BYTES or len(pending) >= WRITE_BATCH_BUFFERS:
+                        _write_batch(f, pending)
+                        pending_bytes = 0
+                    if on_chunk:
+                        await on_chunk(chunk)
+                    downloaded += len(chunk)
+
+                    # Log progress for large files, every 10 MB
+                    if file_size > 0 and downloaded - last_logged >= 10 << 20:
+                        last_logged = downloaded
+                        progress = (downloaded / file_size) * 100
+                        log.info("Download progress: {:.1f} MB ({:.1f}%)", downloaded / (1024*1024), progress)
+
+                _write_batch(f, pending)
+
+    async def _download_and_convert(self, download_url: str, file_path: Path, file_size: int) -> Optional[str]:
+        """Download to file_path while piping the same bytes into FFmpeg.
+
+        Returns the converted path, or None if FFmpeg failed; the complete download is
+        still on disk then, so the caller can convert it the regular way (MP4s with the
+        moov atom at the end cannot be demuxed from a pipe).
+        """
+        output_path = file_path.parent / f"{file_path.stem}_converted.mp4"
+        stderr_task = None
+        try:
+            process = await asyncio.create_subprocess_exec(
+                'ffmpeg', '-nostats', '-loglevel', 'error', *self._ffmpeg_input_args(), '-i', 'pipe:0',
+                *self._ffmpeg_output_args(output_path),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE
+            )
+            # A corrupt stream logs an error per frame; stderr is read all along so a
+            # full pipe can never stall FFmpeg and, through stdin, the download
+            stderr_task = asyncio.create_task(self._read_stderr_tail(process.stderr))
+        except FileNotFoundError:
+            log.error("FFmpeg not found. Please install FFmpeg for video conversion.")
+            process = None
+
+        async def feed_ffmpeg(chunk: bytes):
+            if process and process.returncode is None:
+                try:
+                    process.stdin.write(chunk)
+                    await process.stdin.drain()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # FFmpeg gave up; keep downloading for the fallback
+
+        try:
+            await self._download_url(download_url, file_path, file_size, feed_ffmpeg)
+        except BaseException:
+            if process:
+                await self._abort_ffmpeg(process, output_path, stderr_task)
+            raise
+
+        if not process:
+            return None
+
+        # Already compatible files are remuxed by the caller, much cheaper than finishing the encode
+        if process.returncode is None and await asyncio.to_thread(self._is_rumble_compatible, file_path):
+            await self._abort_ffmpeg(process, output_path, stderr_task)
+            return None
+
+        try:
+            process.stdin.close()
+            await asyncio.wait_for(process.wait(), timeout=1800)
+        except asyncio.TimeoutError:
+            log.error("Streamed video conversion timed out (30 minutes)")
+            await self._abort_ffmpeg(process, output_path, stderr_task)
+            return None
+
+        stderr = (await stderr_task).decode(errors='replace')
+        if process.returncode == 0 and output_path.exists():
+            log.info("Streamed video conversion successful: {}", output_path.name)
+            return str(output_path)
+
+        log.warning(f"Streamed conversion failed, converting the downloaded file instead: {stderr}")
+        self._cleanup_file(str(output_path))
+        return None
+
+    @staticmethod
+    async def _read_stderr_tail(stream, limit: int = 64 << 10) -> bytes:
+        """Read a process's stderr until EOF, keeping only the last limit bytes"""
+        tail = b''
+        while True:
+            chunk = await stream.read(limit)
+            if not chunk:
+                return tail
+            tail = (tail + chunk)[-limit:]
+
+    async def _abort_ffmpeg(self, process, output_path: Path, stderr_task: Optional[asyncio.Task]):
+        """Kill a streamed FFmpeg run, reap it and remove its partial output"""
+        if process.returncode is None:
+            process.stdin.close()
+            process.kill()
+        await process.wait()
+        if stderr_task:
+            stderr_task.cancel()
+        self._cleanup_file(str(output_path))
+
+    @staticmethod
+    def _is_rumble_compatible(input_path) -> bool:
+        """Whether a file is already an H.264 (yuv420p) / AAC MP4 that only needs remuxing"""
+        if Path(input_path).suffix.lower() != '.mp4':
+            return False
+
+        try:
+            probe = subprocess.run(
+                ['ffprobe', '-v', 'error', '-show_streams', '-of', 'json', str(input_path)],
+                capture_output=True, text=True, timeout=30
+            )
+            streams = json.loads(probe.stdout).get('streams', [])
+        except (OSError, subprocess.SubprocessError, ValueError):
+            return False
+
+        video = [st for st in streams if st.get('codec_type') == 'video']
+        audio = [st for st in streams if st.get('codec_type') == 'audio']
+        return (
+            probe.returncode == 0
+            and len(video) == 1
+            and video[0].get('codec_name') == 'h264'
+            and video[0].get('pix_fmt') == 'yuv420p'
+            and all(st.get('codec_name') == 'aac' for st in audio)
+        )
+
+    @staticmethod
+    def _ffmpeg_input_args() -> List[str]:
+        """FFmpeg options needed before -i by the selected encoder"""
+        return _encoder_input_args(_video_encoder())
+
+    @staticmethod
+    def _ffmpeg_output_args(output_path: Path) -> List[str]:
+        """FFmpeg encoding options for a Rumble-compatible MP4"""
+        # Using H.264 codec with AAC audio, which is widely supported
+        return [
+            *_encoder_video_args(_video_encoder()),
+            '-c:a', 'aac',               # AAC audio codec
+            '-b:a', '128k',              # Audio bitrate
+            '-movflags', '+faststart',   # Optimize for web streaming
+            '-y',                        # Overwrite output file
+            str(output_path)
+        ]
+
     def _convert_video_for_rumble(self, input_path: str) -> Optional[str]:
         """Convert video to Rumble-compatible format using FFmpeg"""
         try:
-            import subprocess
-
             # Check if input file exists
             if not os.path.exists(input_path):
                 log.error(f"Input file does not exist: {input_path}")
@@ -1167,28 +1650,19 @@ Sensitive values (passwords, emails) are hidden in status displays."""
             input_file = Path(input_path)
             file_size_mb = input_file.stat().st_size / (1024 * 1024)
 
-            log.info(f"Converting video for Rumble compatibility: {input_file.name} ({file_size_mb:.1f} MB)")
+            log.info("Converting video for Rumble compatibility: {} ({:.1f} MB)", input_file.name, file_size_mb)
 
             # Create output path with .mp4 extension
             output_path = input_file.parent / f"{input_file.stem}_converted.mp4"
 
-            # FFmpeg command for Rumble-compatible video
-            # Using H.264 codec with AAC audio, which is widely supported
-            ffmpeg_cmd = [
-                'ffmpeg',
-                '-i', str(input_path),
-                '-c:v', 'libx264',           # H.264 video codec
-                '-preset', 'medium',         # Encoding speed vs compression
-                '-crf', '23',                # Quality (18-28, lower = better quality)
-                '-c:a', 'aac',               # AAC audio codec
-                '-b:a', '128k',              # Audio bitrate
-                '-movflags', '+faststart',   # Optimize for web streaming
-                '-pix_fmt', 'yuv420p',       # Pixel format for compatibility
-                '-y',                        # Overwrite output file
-                str(output_path)
-            ]
-
-            log.info(f"Running FFmpeg conversion: {' '.join(ffmpeg_cmd)}")
+            # FFmpeg command for Rumble-compatible video; compatible input is only remuxed
+            if self._is_rumble_compatible(input_file):
+                log.info("Video is already H.264/AAC MP4, remuxing without re-encoding")
+                ffmpeg_cmd = ['ffmpeg', '-i', str(input_path), '-c', 'copy', '-movflags', '+faststart', '-y', str(output_path)]
+            else:
+                ffmpeg_cmd = ['ffmpeg', *self._ffmpeg_input_args(), '-i', str(input_path), *self._ffmpeg_output_args(output_path)]
+
+            log.opt(lazy=True).info("Running FFmpeg conversion: {}", lambda: ' '.join(ffmpeg_cmd))
 
             # Run FFmpeg with timeout
             process = subprocess.run(
@@ -1201,7 +1675,7 @@ Sensitive values (passwords, emails) are hidden in status displays."""
             if process.returncode == 0:
                 if os.path.exists(output_path):
                     output_size_mb = output_path.stat().st_size / (1024 * 1024)
-                    log.info(f"Video conversion successful: {output_path.name} ({output_size_mb:.1f} MB)")
+                    log.info("Video conversion successful: {} ({:.1f} MB)", output_path.name, output_size_mb)
                     return str(output_path)
                 else:
                     log.error("FFmpeg reported success but output file not found")
@@ -1225,23 +1699,43 @@ Sensitive values (passwords, emails) are hidden in status displays."""
         try:
             if os.path.exists(file_path):
                 os.remove(file_path)
-                log.info(f"Cleaned up file: {file_path}")
+                log.info("Cleaned up file: {}", file_path)
         except Exception as e:
             log.warning(f"Failed to cleanup file {file_path}: {e}")
     
     def start(self):
         """Start the bot"""
         log.info("Starting Telegram bot polling...")
-        self.bot.infinity_polling(timeout=10, long_polling_timeout=5)
+        asyncio.run(self._run_polling())
+
+    async def _run_polling(self):
+        """Long-poll for updates; each batch is handled in its own task so uploads don't block commands"""
+        self._loop = asyncio.get_running_loop()
+        self._polling_task = asyncio.current_task()
+        try:
+            await self.bot.infinity_polling(timeout=50, request_timeout=60)
+        except asyncio.CancelledError:
+            log.info("Polling cancelled")
+        finally:
+            try:
+                await self.bot.close_session()
+            except Exception:
+                pass  # No session was opened
+            if self._http_session:
+                await self._http_session.close()
+            if self.pyrogram_client and self.pyrogram_client.is_connected:
+                await self.pyrogram_client.stop()
 
     def stop(self):
         """Stop the bot gracefully"""
         try:
             log.info("Stopping Telegram bot...")
-            self.bot.stop_polling()
+            # Safe from signal handlers and other threads; polling exits on cancellation
+            if self._loop and self._polling_task and not self._loop.is_closed():
+                self._loop.call_soon_threadsafe(self._polling_task.cancel)
 
-            # Close any open browser instances
-            if hasattr(self, 'rumble_uploader') and self.rumble_uploader:
+            # Close any open browser instances (the uploader only exists once a video came in)
+            if 'rumble_uploader' in self.__dict__:
                 self.rumble_uploader.close()
 
             log.info("Telegram bot stopped successfully")
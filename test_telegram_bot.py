@@ -172,14 +172,11 @@ def test_bot_startup():
         
         # Start polling with timeout
         import threading
-        import signal
-        
-        stop_event = threading.Event()
         
         def stop_bot():
             time.sleep(30)
-            stop_event.set()
             print("\n⏰ 30 seconds elapsed - stopping bot...")
+            bot.stop()
         
         # Start timer thread
         timer_thread = threading.Thread(target=stop_bot)
@@ -188,19 +185,14 @@ def test_bot_startup():
         
         # Start bot polling
         try:
-            while not stop_event.is_set():
-                try:
-                    bot.bot.polling(none_stop=False, timeout=1)
-                except Exception as e:
-                    if "Conflict" in str(e):
-                        print("⚠️ Bot conflict detected - another instance may be running")
-                        break
-                    else:
-                        print(f"⚠️ Polling error: {e}")
-                time.sleep(0.1)
-                
+            bot.start()
         except KeyboardInterrupt:
             print("\n🛑 Bot stopped by user")
+        except Exception as e:
+            if "Conflict" in str(e):
+                print("⚠️ Bot conflict detected - another instance may be running")
+            else:
+                print(f"⚠️ Polling error: {e}")
         
         print("✅ Bot startup test completed")
         return True
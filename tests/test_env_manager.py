@@ -0,0 +1,78 @@
+"""
+Tests for environment manager module
+"""
+import pytest
+import sys
+import time
+from pathlib import Path
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.env_manager import EnvironmentManager
+
+
+class TestEnvironmentManager:
+    """Test configuration status caching"""
+
+    @pytest.fixture(autouse=True)
+    def manager(self, tmp_path, monkeypatch):
+        """Manager writing its .env into a temporary directory"""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv('RUMBLE_CHANNEL', 'News')
+        self.now = [1000.0]
+        monkeypatch.setattr(time, 'monotonic', lambda: self.now[0])
+        self.manager = EnvironmentManager()
+
+    def test_status_cached_within_ttl(self, monkeypatch):
+        """Test repeated status reads inside the TTL reuse the first result"""
+        status = self.manager.get_configuration_status()
+        monkeypatch.setenv('RUMBLE_CHANNEL', 'Sports')
+        self.now[0] += EnvironmentManager.STATUS_TTL / 2
+
+        assert self.manager.get_configuration_status() is status
+        assert status['configured']['RUMBLE_CHANNEL']['value'] == 'News'
+
+    def test_status_refreshed_after_ttl(self, monkeypatch):
+        """Test changes made outside the bot show up once the TTL passes"""
+        status = self.manager.get_configuration_status()
+        monkeypatch.setenv('RUMBLE_CHANNEL', 'Sports')
+        self.now[0] += EnvironmentManager.STATUS_TTL
+
+        refreshed = self.manager.get_configuration_status()
+
+        assert refreshed is not status
+        assert refreshed['configured']['RUMBLE_CHANNEL']['value'] == 'Sports'
+
+    def test_status_refreshed_after_set(self):
+        """Test setting a variable through the bot invalidates the cache at once"""
+        status = self.manager.get_configuration_status()
+
+        success, _ = self.manager.set_environment_variable('RUMBLE_CHANNEL', 'Gaming')
+        refreshed = self.manager.get_configuration_status()
+
+        assert success
+        assert refreshed is not status
+        assert refreshed['configured']['RUMBLE_CHANNEL']['value'] == 'Gaming'
+        assert (Path.cwd() / ".env").read_text() == "RUMBLE_CHANNEL=Gaming\n"
+
+    def test_sensitive_values_hidden(self, monkeypatch):
+        """Test sensitive variables are never shown in the status"""
+        monkeypatch.setenv('RUMBLE_PASSWORD', 'hunter22')
+
+        status = self.manager.get_configuration_status()
+
+        assert status['configured']['RUMBLE_PASSWORD']['value'] == '***HIDDEN***'
+
+    def test_setup_instructions_follow_status_ttl(self, monkeypatch):
+        """Test the setup text picks up variables set outside the bot once the TTL passes"""
+        monkeypatch.delenv('RUMBLE_EMAIL', raising=False)
+        instructions = self.manager.get_setup_instructions()
+        monkeypatch.setenv('RUMBLE_EMAIL', 'me@example.com')
+
+        assert self.manager.get_setup_instructions() is instructions
+        assert '<b>RUMBLE_EMAIL</b>' in instructions
+
+        self.now[0] += EnvironmentManager.STATUS_TTL
+
+        assert '<b>RUMBLE_EMAIL</b>' not in self.manager.get_setup_instructions()
@@ -0,0 +1,428 @@
+"""
+Tests for rumble uploader module
+"""
+import pytest
+import asyncio
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src import rumble_uploader
+from src.rumble_uploader import RumbleUploader, RumbleUploaderPool, DEFAULT_COOKIES_FILE
+
+
+class TestRumbleUploaderCookies:
+    """Test cookie file selection"""
+
+    def test_default_cookies_file(self):
+        """Test uploaders share the default cookie file unless given one"""
+        uploader = RumbleUploader()
+        try:
+            assert uploader.cookies_file == DEFAULT_COOKIES_FILE
+        finally:
+            uploader.close()
+
+    def test_custom_cookies_file(self, tmp_path):
+        """Test the cookie file can be passed to the constructor"""
+        cookies_file = str(tmp_path / "cookies.json")
+        uploader = RumbleUploader(cookies_file=cookies_file)
+        try:
+            assert uploader.cookies_file == cookies_file
+        finally:
+            uploader.close()
+
+    def test_pool_worker_gets_own_cookies_file(self, tmp_path, monkeypatch):
+        """Test pool workers get a per-profile cookie file seeded from the shared one"""
+        monkeypatch.chdir(tmp_path)
+        Path(DEFAULT_COOKIES_FILE).write_text('[{"name": "session"}]')
+
+        pool = RumbleUploaderPool(max_workers=1)
+        try:
+            uploader = pool._create_uploader()
+
+            assert Path(uploader.cookies_file).parent == Path(uploader.user_data_dir)
+            assert Path(uploader.cookies_file).read_text() == '[{"name": "session"}]'
+        finally:
+            pool.close()
+
+    def test_pool_worker_without_shared_cookies(self, tmp_path, monkeypatch):
+        """Test pool workers start without cookies when there is no shared file"""
+        monkeypatch.chdir(tmp_path)
+
+        pool = RumbleUploaderPool(max_workers=1)
+        try:
+            uploader = pool._create_uploader()
+
+            assert Path(uploader.cookies_file).parent == Path(uploader.user_data_dir)
+            assert not os.path.exists(uploader.cookies_file)
+        finally:
+            pool.close()
+
+
+
+class TestRumbleUploaderClose:
+    """Test browser and cookie writer shutdown"""
+
+    def test_close_waits_for_cookie_writes(self):
+        """Test close returns only once queued cookie writes are done"""
+        uploader = RumbleUploader()
+        written = []
+        uploader._io_executor.submit(lambda: (time.sleep(0.1), written.append(True)))
+
+        uploader.close()
+
+        assert written == [True]
+
+    def test_exit_stops_cookie_writer(self):
+        """Test leaving the with block flushes cookie writes and stops the writer thread"""
+        written = []
+        with RumbleUploader() as uploader:
+            uploader._io_executor.submit(lambda: (time.sleep(0.1), written.append(True)))
+
+        assert written == [True]
+        assert not any(t.name.startswith("rumble-io") and t.is_alive()
+                       for t in uploader._io_executor._threads)
+
+    def test_del_does_not_wait_for_cookie_writes(self):
+        """Test garbage collection never blocks on the cookie writer"""
+        uploader = RumbleUploader()
+        release = threading.Event()
+        uploader._io_executor.submit(release.wait)
+        try:
+            start = time.monotonic()
+            uploader.__del__()
+            assert time.monotonic() - start < 1
+        finally:
+            release.set()
+            uploader.close()
+
+class FakeUploader:
+    """Stand-in for RumbleUploader that never starts a browser"""
+
+    active = 0
+    max_active = 0
+
+    def __init__(self, user_data_dir=None, cookies_file=None):
+        self.user_data_dir = user_data_dir
+        self.cookies_file = cookies_file
+        self.uploads = []
+        self.resets = 0
+        self.closed = False
+        self.disposed = False
+
+    def upload_video(self, video_path, **kwargs):
+        FakeUploader.active += 1
+        FakeUploader.max_active = max(FakeUploader.max_active, FakeUploader.active)
+        try:
+            time.sleep(0.01)
+            if video_path == "broken.mp4":
+                raise RuntimeError("browser crashed")
+            self.uploads.append(video_path)
+            return {'success': True, 'url': f"https://rumble.com/{video_path}", 'error': None}
+        finally:
+            FakeUploader.active -= 1
+
+    def reset_for_next_upload(self):
+        self.resets += 1
+
+    def close(self):
+        self.closed = True
+
+    def dispose(self):
+        self.close()
+        self.disposed = True
+
+
+class TestRumbleUploaderPool:
+    """Test parallel uploads through the pool"""
+
+    def setup_method(self):
+        """Setup fake uploader counters"""
+        FakeUploader.active = 0
+        FakeUploader.max_active = 0
+
+    @pytest.fixture(autouse=True)
+    def fake_uploader(self, monkeypatch, tmp_path):
+        """Build pool workers from FakeUploader, away from the real cookie file"""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(rumble_uploader, "RumbleUploader", FakeUploader)
+
+    def test_submit_returns_future(self):
+        """Test submit queues a job and resolves to its result"""
+        pool = RumbleUploaderPool(max_workers=1)
+        try:
+            result = pool.submit({'video_path': "a.mp4", 'title': "A", 'description': ""}).result(timeout=5)
+
+            assert result['success'] is True
+            assert result['url'] == "https://rumble.com/a.mp4"
+        finally:
+            pool.close()
+
+    def test_upload_many_keeps_job_order(self):
+        """Test results come back in the order the jobs were given"""
+        pool = RumbleUploaderPool(max_workers=3)
+        try:
+            jobs = [{'video_path': f"{i}.mp4", 'title': str(i), 'description': ""} for i in range(6)]
+            results = pool.upload_many(jobs)
+
+            assert [r['url'] for r in results] == [f"https://rumble.com/{i}.mp4" for i in range(6)]
+        finally:
+            pool.close()
+
+    def test_upload_many_async(self):
+        """Test the event-loop variant returns results in job order"""
+        pool = RumbleUploaderPool(max_workers=2)
+        try:
+            jobs = [{'video_path': f"{i}.mp4", 'title': str(i), 'description': ""} for i in range(4)]
+            results = asyncio.run(pool.upload_many_async(jobs))
+
+            assert [r['url'] for r in results] == [f"https://rumble.com/{i}.mp4" for i in range(4)]
+        finally:
+            pool.close()
+
+    def test_upload_many_empty(self):
+        """Test an empty batch does not start any worker"""
+        pool = RumbleUploaderPool(max_workers=2)
+        try:
+            assert pool.upload_many([]) == []
+            assert pool._uploaders == []
+        finally:
+            pool.close()
+
+    def test_idle_uploader_is_reused(self):
+        """Test a finished uploader is reset and reused instead of starting another browser"""
+        pool = RumbleUploaderPool(max_workers=1)
+        try:
+            pool.upload_many([{'video_path': f"{i}.mp4", 'title': str(i), 'description': ""} for i in range(3)])
+
+            assert len(pool._uploaders) == 1
+            assert pool._uploaders[0].uploads == ["0.mp4", "1.mp4", "2.mp4"]
+            assert pool._uploaders[0].resets == 3
+        finally:
+            pool.close()
+
+    def test_failed_upload_returns_uploader(self):
+        """Test an upload that raises reports failure and keeps the uploader usable"""
+        pool = RumbleUploaderPool(max_workers=1)
+        try:
+            failed, succeeded = pool.upload_many([
+                {'video_path': "broken.mp4", 'title': "B", 'description': ""},
+                {'video_path': "ok.mp4", 'title': "O", 'description': ""},
+            ])
+
+            assert failed['success'] is False
+            assert "browser crashed" in failed['error']
+            assert succeeded['success'] is True
+            assert len(pool._uploaders) == 1
+        finally:
+            pool.close()
+
+    def test_concurrent_upload_limit(self):
+        """Test max_concurrent_uploads caps uploads in flight below the worker count"""
+        pool = RumbleUploaderPool(max_workers=4, max_concurrent_uploads=1)
+        try:
+            pool.upload_many([{'video_path': f"{i}.mp4", 'title': str(i), 'description': ""} for i in range(4)])
+
+            assert FakeUploader.max_active == 1
+        finally:
+            pool.close()
+
+    def test_close_removes_profiles(self):
+        """Test close disposes every uploader and deletes the worker profile directories"""
+        pool = RumbleUploaderPool(max_workers=2)
+        pool.upload_many([{'video_path': f"{i}.mp4", 'title': str(i), 'description': ""} for i in range(4)])
+        uploaders = list(pool._uploaders)
+        profile_dirs = list(pool._profile_dirs)
+
+        pool.close()
+
+        assert uploaders and all(uploader.disposed for uploader in uploaders)
+        assert profile_dirs and not any(os.path.exists(d) for d in profile_dirs)
+        assert pool._uploaders == [] and pool._profile_dirs == []
+
+    def test_submit_after_close(self):
+        """Test the pool starts fresh workers when used again after close"""
+        pool = RumbleUploaderPool(max_workers=1)
+        try:
+            pool.submit({'video_path': "a.mp4", 'title': "A", 'description': ""}).result(timeout=5)
+            first = pool._uploaders[0]
+            pool.close()
+
+            result = pool.submit({'video_path': "b.mp4", 'title': "B", 'description': ""}).result(timeout=5)
+
+            assert result['success'] is True
+            assert pool._uploaders[0] is not first
+        finally:
+            pool.close()
+
+
+class FakeDriver:
+    """Answers the upload progress script from a list of hook states"""
+
+    def __init__(self, states, title_enabled=False):
+        self.states = list(states)
+        self.title_enabled = title_enabled
+
+    def execute_script(self, script, *args):
+        return self.states.pop(0) if len(self.states) > 1 else self.states[0]
+
+    def find_elements(self, by, selector):
+        return [SimpleNamespace(is_enabled=lambda: True)] if self.title_enabled else []
+
+    def quit(self):
+        pass
+
+
+class TestUploadCompletion:
+    """Test the upload completion wait"""
+
+    def make_uploader(self, monkeypatch, driver, request_status=lambda: None):
+        """Uploader wired to a fake driver and CDP check"""
+        uploader = RumbleUploader()
+        uploader.driver = driver
+        monkeypatch.setattr(uploader, '_upload_request_status', request_status)
+        return uploader
+
+    def test_hook_success_reports_progress(self, monkeypatch):
+        """Test a 2xx upload request completes the wait and reports progress"""
+        driver = FakeDriver([[None, [50, 100]], [200, [100, 100]]])
+        uploader = self.make_uploader(monkeypatch, driver)
+        progress = []
+        try:
+            assert uploader._wait_for_upload_completion(lambda sent, total: progress.append(sent)) is True
+            assert progress == [50, 100]
+        finally:
+            uploader.close()
+
+    @pytest.mark.parametrize("status", [0, 403, 500])
+    def test_hook_failure(self, monkeypatch, status):
+        """Test a failed or aborted upload request is reported as a failure"""
+        uploader = self.make_uploader(monkeypatch, FakeDriver([[status, [0, 0]]]))
+        try:
+            assert uploader._wait_for_upload_completion() is False
+        finally:
+            uploader.close()
+
+    def test_cdp_signal_without_hook_event(self, monkeypatch):
+        """Test the CDP upload signal wins while the hook never sees the request"""
+        statuses = iter([None, 200])
+        uploader = self.make_uploader(
+            monkeypatch, FakeDriver([[None, [0, 0], False]]), request_status=lambda: next(statuses)
+        )
+        try:
+            start = time.monotonic()
+            assert uploader._wait_for_upload_completion() is True
+            assert time.monotonic() - start < 5
+        finally:
+            uploader.close()
+
+    def test_cdp_signal_ignored_while_hook_tracks_request(self, monkeypatch):
+        """Test a finished CDP request or enabled title field does not end the wait while the hook is still waiting"""
+        uploader = self.make_uploader(
+            monkeypatch, FakeDriver([[None, [10, 100], True]], title_enabled=True), request_status=lambda: 200
+        )
+        try:
+            assert uploader._check_upload_signals() is None
+        finally:
+            uploader.close()
+
+    def test_title_field_signal_without_hook(self, monkeypatch):
+        """Test an enabled title field completes the wait when the hook is missing"""
+        uploader = self.make_uploader(monkeypatch, FakeDriver([None], title_enabled=True))
+        try:
+            assert uploader._wait_for_upload_completion() is True
+        finally:
+            uploader.close()
+
+
+def cdp_event(method, request_id, **params):
+    """A drained CDP network event for request_id"""
+    return {'method': method, 'params': dict(params, requestId=request_id)}
+
+
+def upload_post(request_id):
+    """CDP event for an upload POST being sent"""
+    return cdp_event(
+        'Network.requestWillBeSent', request_id,
+        request={'method': 'POST', 'url': "https://rumble.com/upload.php?api=1"},
+    )
+
+
+def upload_response(request_id, status):
+    """CDP events for an upload POST answered with status"""
+    return [
+        cdp_event('Network.responseReceived', request_id, response={'status': status}),
+        cdp_event('Network.loadingFinished', request_id),
+    ]
+
+
+class TestUploadRequestStatus:
+    """Test upload completion from CDP network events"""
+
+    def make_uploader(self, monkeypatch, batches, fake_clock=True):
+        """Uploader whose performance log yields one batch of events per drain, on a fake clock"""
+        uploader = RumbleUploader()
+        batches = iter(batches)
+        monkeypatch.setattr(uploader, '_drain_performance_log', lambda: next(batches, []))
+        clock = SimpleNamespace(now=0.0)
+        if fake_clock:
+            monkeypatch.setattr(rumble_uploader.time, 'monotonic', lambda: clock.now)
+        return uploader, clock
+
+    def test_multi_chunk_upload(self, monkeypatch):
+        """Test the first chunk finishing does not count as the upload finishing"""
+        uploader, clock = self.make_uploader(monkeypatch, [
+            [upload_post('1')] + upload_response('1', 200),
+            [upload_post('2')],
+            upload_response('2', 200),
+        ])
+        try:
+            assert uploader._upload_request_status() is None
+            clock.now += 1
+            assert uploader._upload_request_status() is None
+            clock.now += 5
+            assert uploader._upload_request_status() is None
+            clock.now += 1
+            assert uploader._upload_request_status() is None
+            clock.now += rumble_uploader.UPLOAD_SETTLE_SECONDS
+            assert uploader._upload_request_status() == 200
+        finally:
+            uploader.close()
+
+    def test_server_error(self, monkeypatch):
+        """Test a 500 reply to an upload POST is reported as the upload status"""
+        uploader, _ = self.make_uploader(monkeypatch, [[upload_post('1')] + upload_response('1', 500)])
+        try:
+            assert uploader._upload_request_status() == 500
+        finally:
+            uploader.close()
+
+    def test_server_error_fails_wait(self, monkeypatch):
+        """Test the completion wait fails on a 500 reply seen only in CDP events"""
+        uploader, _ = self.make_uploader(
+            monkeypatch, [[upload_post('1')] + upload_response('1', 500)], fake_clock=False
+        )
+        uploader.driver = FakeDriver([None])
+        try:
+            assert uploader._wait_for_upload_completion() is False
+        finally:
+            uploader.close()
+
+    def test_other_requests_ignored(self, monkeypatch):
+        """Test requests that are not upload POSTs are not tracked"""
+        uploader, clock = self.make_uploader(monkeypatch, [
+            [cdp_event('Network.requestWillBeSent', '9', request={'method': 'GET', 'url': "https://rumble.com/upload.php"})]
+            + upload_response('9', 500),
+        ])
+        try:
+            assert uploader._upload_request_status() is None
+            clock.now += 10
+            assert uploader._upload_request_status() is None
+        finally:
+            uploader.close()
@@ -0,0 +1,185 @@
+"""
+Tests for security module
+"""
+import pytest
+import base64
+import stat
+import sys
+import threading
+import time
+from pathlib import Path
+from cryptography.fernet import Fernet
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.config import config
+from src.security import CredentialManager, SecurityValidator
+
+
+class TestCredentialManager:
+    """Test credential encryption and masking"""
+
+    @pytest.fixture(autouse=True)
+    def derived_key(self, monkeypatch):
+        """Use the derived key unless a test enables the key file"""
+        monkeypatch.setattr(config, 'CREDENTIAL_KEY_FILE', '')
+
+    def test_encrypt_decrypt_roundtrip(self):
+        """Test a credential survives encryption and decryption"""
+        manager = CredentialManager()
+        token = manager.encrypt_credential("hunter2")
+
+        assert token != "hunter2"
+        assert CredentialManager().decrypt_credential(token) == "hunter2"
+
+    def test_decrypt_legacy_double_base64(self):
+        """Test values stored with the old extra base64 layer still decrypt"""
+        token = CredentialManager().encrypt_credential("hunter2")
+        legacy = base64.urlsafe_b64encode(token.encode()).decode()
+
+        assert CredentialManager().decrypt_credential(legacy) == "hunter2"
+
+    def test_concurrent_decrypts_with_eviction(self, monkeypatch):
+        """Test threads filling and evicting the plaintext cache always get the plaintext"""
+        monkeypatch.setattr(CredentialManager, 'PLAINTEXT_CACHE_SIZE', 2)
+        manager = CredentialManager()
+        tokens = {manager.encrypt_credential(f"secret{i}"): f"secret{i}" for i in range(8)}
+        mismatches = []
+
+        def decrypt_all():
+            for _ in range(50):
+                for token, plaintext in tokens.items():
+                    if manager.decrypt_credential(token) != plaintext:
+                        mismatches.append(token)
+
+        threads = [threading.Thread(target=decrypt_all) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert mismatches == []
+        assert len(manager._plaintext_cache) <= 2
+
+    def test_decrypt_invalid_returns_input(self):
+        """Test undecryptable values are returned unchanged"""
+        assert CredentialManager().decrypt_credential("not-a-token") == "not-a-token"
+
+    def test_key_file_created_and_reused(self, tmp_path, monkeypatch):
+        """Test the key file is created private on first use and shared afterwards"""
+        key_file = tmp_path / "keys" / "credential.key"
+        monkeypatch.setattr(config, 'CREDENTIAL_KEY_FILE', str(key_file))
+
+        token = CredentialManager().encrypt_credential("hunter2")
+
+        assert key_file.exists()
+        assert stat.S_IMODE(key_file.stat().st_mode) == 0o600
+        assert CredentialManager().decrypt_credential(token) == "hunter2"
+
+    def test_key_file_decrypts_derived_key_values(self, tmp_path, monkeypatch):
+        """Test values encrypted before the key file was enabled stay readable"""
+        old_token = CredentialManager().encrypt_credential("hunter2")
+        monkeypatch.setattr(config, 'CREDENTIAL_KEY_FILE', str(tmp_path / "credential.key"))
+
+        manager = CredentialManager()
+
+        assert manager.decrypt_credential(old_token) == "hunter2"
+        assert manager._key_from_file
+
+    def test_invalid_key_file_is_rejected(self, tmp_path, monkeypatch):
+        """Test a corrupt key file is neither cached nor replaced by the derived key"""
+        key_file = tmp_path / "credential.key"
+        key_file.write_bytes(b"truncated")
+        monkeypatch.setattr(config, 'CREDENTIAL_KEY_FILE', str(key_file))
+
+        manager = CredentialManager()
+
+        with pytest.raises(ValueError):
+            manager._get_encryption_key()
+        assert manager._encryption_key is None
+        assert manager._fernet is None
+
+    def test_key_file_read_waits_for_writer(self, tmp_path, monkeypatch):
+        """Test a reader racing the creator waits for the key instead of deriving one"""
+        key_file = tmp_path / "credential.key"
+        key_file.touch()
+        monkeypatch.setattr(config, 'CREDENTIAL_KEY_FILE', str(key_file))
+        key = Fernet.generate_key()
+
+        writer = threading.Timer(0.2, key_file.write_bytes, args=(key,))
+        writer.start()
+        try:
+            assert CredentialManager()._get_encryption_key() == key
+        finally:
+            writer.join()
+
+    def test_mask_credential_str(self):
+        """Test masking keeps only the leading characters of a string"""
+        manager = CredentialManager()
+
+        assert manager.mask_credential("secretvalue") == "secr*******"
+        assert manager.mask_credential("abc") == "***"
+        assert manager.mask_credential("") == ""
+        assert manager.mask_credential("password", show_chars=0) == "********"
+
+    def test_mask_credential_bytes(self):
+        """Test masking bytes returns bytes"""
+        manager = CredentialManager()
+
+        assert manager.mask_credential(b"secretvalue") == b"secr*******"
+        assert manager.mask_credential(b"abc") == b"***"
+        assert manager.mask_credential(b"") == b""
+
+    def test_mask_credential_long(self):
+        """Test masking values longer than the precomputed run of stars"""
+        masked = CredentialManager().mask_credential("x" * 5000)
+
+        assert masked == "xxxx" + "*" * 4996
+
+
+class TestSecurityValidator:
+    """Test request validation helpers"""
+
+    @pytest.fixture(autouse=True)
+    def fresh_rate_limits(self, monkeypatch):
+        """Isolate rate-limit buckets between tests"""
+        monkeypatch.setattr(SecurityValidator, '_rate_limits', {})
+
+    def test_rate_limit_blocks_after_max_requests(self):
+        """Test requests beyond the limit are refused"""
+        results = [SecurityValidator.check_rate_limit(1, max_requests=3) for _ in range(4)]
+
+        assert results == [True, True, True, False]
+
+    def test_rate_limit_is_per_user(self):
+        """Test one user's requests do not count against another"""
+        for _ in range(3):
+            SecurityValidator.check_rate_limit(1, max_requests=3)
+
+        assert SecurityValidator.check_rate_limit(2, max_requests=3)
+
+    def test_rate_limit_window_expires(self, monkeypatch):
+        """Test requests older than the window are dropped"""
+        now = [1000.0]
+        monkeypatch.setattr(time, 'monotonic', lambda: now[0])
+        for _ in range(3):
+            SecurityValidator.check_rate_limit(1, max_requests=3, window_minutes=1)
+        assert not SecurityValidator.check_rate_limit(1, max_requests=3, window_minutes=1)
+
+        now[0] += 61
+
+        assert SecurityValidator.check_rate_limit(1, max_requests=3, window_minutes=1)
+        assert len(SecurityValidator._rate_limits[1][0]) == 1
+
+    def test_validate_file_path_follows_cwd(self, tmp_path, monkeypatch):
+        """Test the working directory allowance tracks the current directory"""
+        monkeypatch.chdir(tmp_path)
+
+        assert SecurityValidator.validate_file_path(str(tmp_path / "video.mp4"))
+        assert not SecurityValidator.validate_file_path("../video.mp4")
+
+    def test_sanitize_filename(self):
+        """Test unsafe characters are replaced"""
+        assert SecurityValidator.sanitize_filename('a<b>:c.mp4') == "a_b__c.mp4"
+        assert SecurityValidator.sanitize_filename(' .. ') == "file"
@@ -0,0 +1,480 @@
+"""
+Tests for telegram bot helpers
+"""
+import pytest
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src import telegram_bot
+from src.config import config
+from src.telegram_bot import RumbleBot, RateLimitedBot, EditDebouncer, _write_batch, _video_encoder
+
+
+class TestExtractMetadata:
+    """Test caption parsing"""
+
+    @pytest.fixture(autouse=True)
+    def bot(self, monkeypatch):
+        """Build a bot without touching Telegram"""
+        monkeypatch.setattr(config, 'TELEGRAM_BOT_TOKEN', '123456:' + 'A' * 35)
+        monkeypatch.setattr(config, 'ENABLE_VIDEO_CONVERSION', False)
+        self.bot = RumbleBot()
+
+    def test_title_description_and_tags(self):
+        """Test first line is the title, the rest the description, hashtags the tags"""
+        title, description, tags = self.bot._extract_metadata(
+            "My video #news\nFirst line\n\nSecond line #world #daily"
+        )
+
+        assert title == "My video"
+        assert description == "First line\nSecond line"
+        assert tags == ["news", "world", "daily"]
+
+    def test_without_hashtags(self):
+        """Test captions without a '#' keep their text"""
+        assert self.bot._extract_metadata("Title\nBody") == ("Title", "Body", [])
+
+    def test_hashtag_only_lines_are_dropped(self):
+        """Test lines holding only hashtags do not become the title"""
+        assert self.bot._extract_metadata("#one #two\nReal title") == ("Real title", None, ["one", "two"])
+
+    def test_only_newlines_split_lines(self):
+        """Test other line separators stay inside a line, as before"""
+        assert self.bot._extract_metadata("T\rU") == ("T\rU", None, [])
+        assert self.bot._extract_metadata("A\u2028B\nC") == ("A\u2028B", "C", [])
+
+    def test_empty_caption(self):
+        """Test empty captions yield no metadata"""
+        assert self.bot._extract_metadata("") == (None, None, [])
+        assert self.bot._extract_metadata(None) == (None, None, [])
+
+
+class TestWriteBatch:
+    """Test batched download writes"""
+
+    def test_writes_all_buffers(self, tmp_path):
+        """Test every chunk is written in order and the list is emptied"""
+        buffers = [b"abc", b"", b"defgh", b"ij"]
+        with open(tmp_path / "out", 'wb') as f:
+            _write_batch(f, buffers)
+
+        assert (tmp_path / "out").read_bytes() == b"abcdefghij"
+        assert buffers == []
+
+    def test_short_writes(self, tmp_path, monkeypatch):
+        """Test short writev results resume from the first unwritten byte"""
+        real_writev = os.writev
+        monkeypatch.setattr(os, 'writev', lambda fd, bufs: real_writev(fd, [b"".join(bufs)[:3]]))
+
+        buffers = [b"abcd", b"efghij", b"k"]
+        with open(tmp_path / "out", 'wb') as f:
+            _write_batch(f, buffers)
+
+        assert (tmp_path / "out").read_bytes() == b"abcdefghijk"
+        assert buffers == []
+
+    def test_without_writev(self, tmp_path, monkeypatch):
+        """Test platforms without writev fall back to plain writes"""
+        monkeypatch.delattr(os, 'writev')
+
+        buffers = [b"abc", b"def"]
+        with open(tmp_path / "out", 'wb') as f:
+            _write_batch(f, buffers)
+
+        assert (tmp_path / "out").read_bytes() == b"abcdef"
+        assert buffers == []
+
+
+class FakeTeleBot:
+    """Records edits and sends instead of calling Telegram"""
+
+    token = "123456:token"
+
+    def __init__(self, delays: dict = None):
+        self.delays = delays or {}  # text -> seconds the edit takes
+        self.sent = []
+
+    async def send_message(self, chat_id, text, **kwargs):
+        self.sent.append((time.monotonic(), chat_id, text))
+
+    async def edit_message_text(self, text, chat_id, message_id, **kwargs):
+        await asyncio.sleep(self.delays.get(text, 0))
+        self.sent.append((text, chat_id, message_id, kwargs))
+
+
+class TestRateLimitedBot:
+    """Test outgoing message pacing"""
+
+    def test_other_attributes_pass_through(self):
+        """Test non-send attributes come straight from the wrapped bot"""
+        bot = FakeTeleBot()
+
+        assert RateLimitedBot(bot).token == bot.token
+
+    def test_sends_are_paced(self, monkeypatch):
+        """Test sends beyond the burst wait for the token bucket to refill"""
+        monkeypatch.setattr(RateLimitedBot, 'RATE', 10)
+        bot = FakeTeleBot()
+
+        async def send_all():
+            limited = RateLimitedBot(bot)
+            start = time.monotonic()
+            await asyncio.gather(*(limited.send_message(1, str(i)) for i in range(13)))
+            return start
+
+        start = asyncio.run(send_all())
+
+        assert len(bot.sent) == 13
+        # 10 sends fit in the initial burst, the other 3 need 0.1s each
+        assert bot.sent[-1][0] - start >= 0.25
+
+
+class TestEditDebouncer:
+    """Test status edit coalescing"""
+
+    @pytest.fixture(autouse=True)
+    def short_interval(self, monkeypatch):
+        """Keep the debounce interval short for tests"""
+        monkeypatch.setattr(EditDebouncer, 'INTERVAL', 0.05)
+
+    def test_only_latest_edit_is_sent(self):
+        """Test queued edits for one message collapse to the newest text"""
+        bot = FakeTeleBot()
+
+        async def run():
+            editor = EditDebouncer(bot)
+            for percent in (10, 20, 30):
+                editor.schedule(1, 2, f"{percent}%", parse_mode='Markdown')
+            editor.schedule(1, 3, "other message")
+            await asyncio.sleep(0.15)
+
+        asyncio.run(run())
+
+        assert sorted(bot.sent, key=lambda edit: edit[2]) == [
+            ("30%", 1, 2, {'parse_mode': 'Markdown'}),
+            ("other message", 1, 3, {}),
+        ]
+
+    def test_flush_drops_queued_edit(self):
+        """Test an immediate edit is not overwritten by an older queued one"""
+        bot = FakeTeleBot()
+
+        async def run():
+            editor = EditDebouncer(bot)
+            editor.schedule(1, 2, "50%")
+            await editor.flush(1, 2, "Done")
+            await asyncio.sleep(0.15)
+
+        asyncio.run(run())
+
+        assert bot.sent == [("Done", 1, 2, {})]
+
+    def test_flush_waits_for_edit_in_flight(self):
+        """Test a queued edit already being sent lands before the flushed one"""
+        bot = FakeTeleBot(delays={"99%": 0.2})
+
+        async def run():
+            editor = EditDebouncer(bot)
+            editor.schedule(1, 2, "99%")
+            await asyncio.sleep(0.1)  # the queued edit is now being sent
+            await editor.flush(1, 2, "Done")
+            await asyncio.sleep(0.1)
+            return editor
+
+        editor = asyncio.run(run())
+
+        assert [edit[0] for edit in bot.sent] == ["99%", "Done"]
+        assert editor._tasks == {}
+
+    def test_edit_queued_during_send_follows(self):
+        """Test an edit queued while another is being sent goes out afterwards"""
+        bot = FakeTeleBot(delays={"10%": 0.05})
+
+        async def run():
+            editor = EditDebouncer(bot)
+            editor.schedule(1, 2, "10%")
+            await asyncio.sleep(0.07)  # the first edit is now being sent
+            editor.schedule(1, 2, "20%")
+            await asyncio.sleep(0.3)
+            return editor
+
+        editor = asyncio.run(run())
+
+        assert [edit[0] for edit in bot.sent] == ["10%", "20%"]
+        assert editor._tasks == {}
+
+
+class FakeUploader:
+    """Stands in for the shared browser"""
+
+    def __init__(self):
+        self.driver = object()
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def chat_message(chat_id, user_id):
+    """A message from user_id in chat_id"""
+    return SimpleNamespace(chat=SimpleNamespace(id=chat_id), from_user=SimpleNamespace(id=user_id))
+
+
+class TestCancelCommand:
+    """Test /cancel only stops the requesting user's uploads"""
+
+    @pytest.fixture(autouse=True)
+    def bot(self, monkeypatch):
+        """Build a bot without touching Telegram or a browser"""
+        monkeypatch.setattr(config, 'TELEGRAM_BOT_TOKEN', '123456:' + 'A' * 35)
+        monkeypatch.setattr(config, 'ENABLE_VIDEO_CONVERSION', False)
+        self.bot = RumbleBot()
+        self.replies = []
+
+        async def reply_to(message, text, **kwargs):
+            self.replies.append(text)
+
+        self.bot.bot = SimpleNamespace(reply_to=reply_to)
+        self.uploader = self.bot.__dict__['rumble_uploader'] = FakeUploader()
+
+    def test_other_users_upload_keeps_running(self):
+        """Test cancelling without an active upload leaves another chat's browser alone"""
+        self.bot.active_uploads.add((20, 2))
+        self.bot._uploader_owner = (20, 2)
+
+        asyncio.run(self.bot._handle_cancel_command(chat_message(10, 1)))
+
+        assert self.uploader.closed is False
+        assert self.bot._cancelled_uploads == set()
+        assert self.replies
+
+    def test_waiting_upload_is_not_closed(self):
+        """Test a user waiting for the browser is cancelled without closing it"""
+        self.bot.active_uploads.update({(10, 1), (20, 2)})
+        self.bot._uploader_owner = (20, 2)
+
+        asyncio.run(self.bot._handle_cancel_command(chat_message(10, 1)))
+
+        assert self.uploader.closed is False
+        assert self.bot._cancelled_uploads == {(10, 1)}
+
+    def test_own_upload_closes_browser(self):
+        """Test the browser is closed when the requesting user's upload holds it"""
+        self.bot.active_uploads.add((10, 1))
+        self.bot._uploader_owner = (10, 1)
+
+        asyncio.run(self.bot._handle_cancel_command(chat_message(10, 1)))
+
+        assert self.uploader.closed is True
+        assert self.bot._cancelled_uploads == {(10, 1)}
+
+    def test_same_user_in_two_chats(self):
+        """Test cancelling in one chat leaves the same user's upload in another chat alone"""
+        self.bot.active_uploads.update({(10, 1), (20, 1)})
+        self.bot._uploader_owner = (20, 1)
+
+        asyncio.run(self.bot._handle_cancel_command(chat_message(10, 1)))
+
+        assert self.uploader.closed is False
+        assert self.bot._cancelled_uploads == {(10, 1)}
+
+    def test_finished_upload_keeps_other_chat_cancellable(self, monkeypatch):
+        """Test one chat's upload finishing does not clear the user's upload in another chat"""
+        monkeypatch.setattr(config, 'ENABLE_PROGRESS_UPDATES', False)
+        self.uploader.get_available_channels = lambda: []
+        self.uploader.reset_for_next_upload = lambda: None
+
+        async def upload_video_async(**kwargs):
+            return {'success': True}
+
+        self.uploader.upload_video_async = upload_video_async
+        self.bot.active_uploads.add((20, 1))
+        self.bot._cancelled_uploads.add((20, 1))
+
+        result = asyncio.run(self.bot._upload_with_progress_updates("v.mp4", "T", "", [], 10, 5, user_id=1))
+
+        assert result == {'success': True}
+        assert self.bot.active_uploads == {(20, 1)}
+        assert self.bot._cancelled_uploads == {(20, 1)}
+
+    def test_queued_videos_dropped(self):
+        """Test only the requesting user's queued videos leave the chat queue"""
+        async def run():
+            queue = self.bot._chat_queues[10] = asyncio.Queue()
+            other = chat_message(10, 2)
+            for queued in (chat_message(10, 1), other, chat_message(10, 1)):
+                queue.put_nowait(queued)
+            await self.bot._handle_cancel_command(chat_message(10, 1))
+            return [queue.get_nowait() for _ in range(queue.qsize())], other
+
+        remaining, other = asyncio.run(run())
+
+        assert remaining == [other]
+
+
+# Stands in for FFmpeg: floods stderr before reading stdin, writes the output path
+# (last argument) and exits with the given status
+FAKE_FFMPEG = """
+import sys
+sys.stderr.write("corrupt frame\\n" * 20000)
+sys.stderr.flush()
+sys.stdin.buffer.read()
+open(sys.argv[-1], "wb").write(b"out")
+sys.exit(int(sys.argv[1]))
+"""
+
+
+class TestStreamedConversion:
+    """Test piping a download into FFmpeg"""
+
+    @pytest.fixture(autouse=True)
+    def bot(self, monkeypatch):
+        """Build a bot whose FFmpeg is a Python stand-in"""
+        monkeypatch.setattr(config, 'TELEGRAM_BOT_TOKEN', '123456:' + 'A' * 35)
+        monkeypatch.setattr(config, 'ENABLE_VIDEO_CONVERSION', False)
+        self.bot = RumbleBot()
+        self.returncode = 0
+        spawn = asyncio.create_subprocess_exec
+
+        async def fake_exec(program, *args, **kwargs):
+            return await spawn(sys.executable, '-c', FAKE_FFMPEG, str(self.returncode), args[-1], **kwargs)
+
+        monkeypatch.setattr(asyncio, 'create_subprocess_exec', fake_exec)
+        monkeypatch.setattr(RumbleBot, '_is_rumble_compatible', staticmethod(lambda path: False))
+
+    def download(self, chunks, fail=False):
+        """Make _download_url feed the given chunks, optionally failing afterwards"""
+        async def download_url(url, file_path, file_size, on_chunk=None):
+            for chunk in chunks:
+                await on_chunk(chunk)
+            if fail:
+                raise ConnectionError("connection lost")
+
+        self.bot._download_url = download_url
+
+    def test_chatty_stderr_does_not_stall(self, tmp_path):
+        """Test FFmpeg flooding stderr cannot block the download feeding its stdin"""
+        self.download([b"x" * (64 << 10)] * 32)
+
+        result = asyncio.run(asyncio.wait_for(
+            self.bot._download_and_convert("url", tmp_path / "video.mkv", 0), timeout=30
+        ))
+
+        assert result == str(tmp_path / "video_converted.mp4")
+
+    def test_failed_conversion_removes_output(self, tmp_path):
+        """Test a failed run leaves no partial converted file behind"""
+        self.returncode = 1
+        self.download([b"x"])
+
+        assert asyncio.run(self.bot._download_and_convert("url", tmp_path / "video.mkv", 0)) is None
+        assert not (tmp_path / "video_converted.mp4").exists()
+
+    def test_download_error_reaps_ffmpeg(self, tmp_path):
+        """Test a failed download kills FFmpeg and removes its partial output"""
+        self.download([b"x"], fail=True)
+        output_path = tmp_path / "video_converted.mp4"
+        output_path.write_bytes(b"partial")
+
+        with pytest.raises(ConnectionError):
+            asyncio.run(self.bot._download_and_convert("url", tmp_path / "video.mkv", 0))
+
+        assert not output_path.exists()
+
+
+class TestRumbleCompatibility:
+    """Test the ffprobe check that decides between remuxing and transcoding"""
+
+    def probe(self, monkeypatch, streams, returncode=0):
+        """Answer ffprobe with the given streams"""
+        calls = []
+
+        def fake_run(cmd, **kwargs):
+            calls.append(cmd)
+            return SimpleNamespace(returncode=returncode, stdout=json.dumps({'streams': streams}))
+
+        monkeypatch.setattr(telegram_bot.subprocess, 'run', fake_run)
+        return calls
+
+    def test_h264_aac_mp4_is_compatible(self, monkeypatch):
+        """Test H.264 yuv420p with AAC audio only needs a remux"""
+        self.probe(monkeypatch, [
+            {'codec_type': 'video', 'codec_name': 'h264', 'pix_fmt': 'yuv420p'},
+            {'codec_type': 'audio', 'codec_name': 'aac'},
+        ])
+
+        assert RumbleBot._is_rumble_compatible("video.mp4")
+
+    def test_silent_h264_is_compatible(self, monkeypatch):
+        """Test videos without audio are accepted"""
+        self.probe(monkeypatch, [{'codec_type': 'video', 'codec_name': 'h264', 'pix_fmt': 'yuv420p'}])
+
+        assert RumbleBot._is_rumble_compatible("video.mp4")
+
+    @pytest.mark.parametrize("streams", [
+        [{'codec_type': 'video', 'codec_name': 'hevc', 'pix_fmt': 'yuv420p'}],
+        [{'codec_type': 'video', 'codec_name': 'h264', 'pix_fmt': 'yuv444p'}],
+        [{'codec_type': 'video', 'codec_name': 'h264', 'pix_fmt': 'yuv420p'},
+         {'codec_type': 'audio', 'codec_name': 'opus'}],
+        [{'codec_type': 'audio', 'codec_name': 'aac'}],
+    ])
+    def test_needs_transcode(self, monkeypatch, streams):
+        """Test other codecs, pixel formats or audio-only files are transcoded"""
+        self.probe(monkeypatch, streams)
+
+        assert not RumbleBot._is_rumble_compatible("video.mp4")
+
+    def test_other_container_skips_probe(self, monkeypatch):
+        """Test non-MP4 files are transcoded without running ffprobe"""
+        calls = self.probe(monkeypatch, [])
+
+        assert not RumbleBot._is_rumble_compatible("video.mkv")
+        assert calls == []
+
+    def test_probe_failure(self, monkeypatch):
+        """Test ffprobe errors or a missing binary mean a full transcode"""
+        self.probe(monkeypatch, [{'codec_type': 'video', 'codec_name': 'h264', 'pix_fmt': 'yuv420p'}], returncode=1)
+        assert not RumbleBot._is_rumble_compatible("video.mp4")
+
+        def missing(cmd, **kwargs):
+            raise FileNotFoundError(cmd[0])
+
+        monkeypatch.setattr(telegram_bot.subprocess, 'run', missing)
+        assert not RumbleBot._is_rumble_compatible("video.mp4")
+
+
+class TestVideoEncoder:
+    """Test H.264 encoder selection"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Probe again in every test"""
+        _video_encoder.cache_clear()
+        yield
+        _video_encoder.cache_clear()
+
+    def test_configured_encoder(self, monkeypatch):
+        """Test a known encoder from config is used without probing"""
+        monkeypatch.setattr(config, 'VIDEO_ENCODER', 'h264_nvenc')
+
+        assert _video_encoder() == 'h264_nvenc'
+
+    def test_unknown_encoder_falls_back_to_probe(self, monkeypatch):
+        """Test an unrecognised encoder name is ignored in favour of auto-detection"""
+        monkeypatch.setattr(config, 'VIDEO_ENCODER', 'h264_bogus')
+
+        def no_ffmpeg(cmd, **kwargs):
+            raise subprocess.SubprocessError("ffmpeg unavailable")
+
+        monkeypatch.setattr(telegram_bot.subprocess, 'run', no_ffmpeg)
+
+        assert _video_encoder() == 'libx264'